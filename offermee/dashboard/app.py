@@ -2,11 +2,14 @@ import streamlit as st
 
 
 from offermee.dashboard.helpers.web_dashboard import log_info
+from offermee.database.query_metrics import track_queries
 from offermee.dashboard.widgets.navigate_to import (
     get_default_page,
     get_pages_to_show,
 )
 
+PAGE_QUERY_BUDGET = 200
+
 
 def navigate():
 
@@ -16,7 +19,9 @@ def navigate():
     log_info(
         __name__, f"Running '{navigator.title} - default={navigator._default}' ..."
     )
-    navigator.run()
+    # the query budget of one page render, see the diagnostics page
+    with track_queries(label=navigator.title, budget=PAGE_QUERY_BUDGET):
+        navigator.run()
 
 
 st.set_page_config(page_title="OfferMee Dashboard", layout="wide")
@@ -13,6 +13,7 @@ from offermee.dashboard.helpers.web_dashboard import (
     stop_if_not_logged_in,
 )
 from offermee.database.facades.main_facades import CVFacade
+from offermee.dashboard.widgets.pager import render_paged_records
 from offermee.utils.international import _T
 from offermee.utils.container import Container
 
@@ -31,7 +32,7 @@ def cv_view_all_render():
     operator = Config.get_instance().get_current_user()
 
     try:
-        cvs = CVFacade.get_all()
+        cvs = render_paged_records("cv_view_all", CVFacade)
         log_info(__name__, f"Fetched {len(cvs)} CVs:\n{cvs}")
         if cvs:
             # Definiere die Spalten, die du anzeigen möchtest
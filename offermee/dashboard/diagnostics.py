@@ -0,0 +1,70 @@
+import datetime
+
+import pandas as pd
+import streamlit as st
+
+from offermee.dashboard.helpers.web_dashboard import stop_if_not_logged_in
+from offermee.database.facades.main_facades import BaseFacade
+from offermee.database.query_metrics import query_metrics
+from offermee.utils.international import _T
+
+
+def get_title() -> str:
+    return _T("Diagnostics")
+
+
+def _with_time(rows):
+    return [
+        {**row, "at": datetime.datetime.fromtimestamp(row["at"]).strftime("%H:%M:%S")}
+        for row in rows
+    ]
+
+
+def diagnostics_render():
+    st.title(get_title())
+    stop_if_not_logged_in()
+
+    col_threshold, col_log, col_reset = st.columns([2, 1, 1])
+    query_metrics.slow_query_ms = col_threshold.number_input(
+        _T("Slow query threshold (ms)"),
+        min_value=1.0,
+        value=float(query_metrics.slow_query_ms),
+        step=50.0,
+    )
+    if col_log.button(_T("Write summary to log")):
+        query_metrics.log_summary()
+        st.success(_T("Summary written to the log."))
+    if col_reset.button(_T("Reset metrics")):
+        query_metrics.reset()
+
+    st.subheader(_T("Queries per page"))
+    requests = query_metrics.requests()
+    if requests:
+        st.dataframe(pd.DataFrame(_with_time(requests)), use_container_width=True)
+    else:
+        st.info(_T("No page renders recorded yet."))
+
+    st.subheader(_T("Queries per facade method"))
+    callers = query_metrics.by_caller()
+    if callers:
+        st.dataframe(pd.DataFrame(callers), use_container_width=True)
+
+    st.subheader(_T("Slowest statements"))
+    order_by = st.radio(
+        _T("Order by"), ["total_ms", "max_ms", "count"], horizontal=True
+    )
+    statements = query_metrics.summary(top=50, order_by=order_by)
+    if statements:
+        st.dataframe(pd.DataFrame(statements), use_container_width=True)
+    else:
+        st.info(_T("No queries recorded yet."))
+
+    st.subheader(_T("Slow query log"))
+    slow = query_metrics.slow_queries()
+    if slow:
+        st.dataframe(pd.DataFrame(_with_time(slow)), use_container_width=True)
+    else:
+        st.info(_T("No slow queries."))
+
+    st.subheader(_T("Entity cache"))
+    st.json(BaseFacade.cache_stats())
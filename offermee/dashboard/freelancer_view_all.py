@@ -31,7 +31,7 @@ def freelancer_view_all_render():
     operator = Config.get_instance().get_current_user()
 
     try:
-        freelancers = FreelancerFacade.get_all()
+        freelancers = FreelancerFacade.get_all(as_dicts=True)
         log_info(__name__, f"Fetched {len(freelancers)} Freelancers:\n{freelancers}")
         if freelancers:
             # Definiere die Spalten, die du anzeigen möchtest
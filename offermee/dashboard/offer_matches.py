@@ -17,10 +17,12 @@ from offermee.dashboard.helpers.web_dashboard import (
     stop_if_not_logged_in,
 )
 from offermee.dashboard.widgets.selectors import render_freelancer_selection_form
+from offermee.database.database_manager import DatabaseManager
 from offermee.database.facades.main_facades import (
     CVFacade,
     CapabilitiesFacade,
     FreelancerFacade,
+    MatchingFacade,
     ProjectFacade,
     RFPFacade,
     ReadFacade,
@@ -28,8 +30,7 @@ from offermee.database.facades.main_facades import (
 )
 from offermee.database.models.main_models import OfferStatus, ProjectStatus, RFPStatus
 from offermee.enums.process_status import Status
-from offermee.matcher.skill_matcher import SkillMatcher
-from offermee.matcher.price_matcher import PriceMatcher
+from offermee.matcher.skill_match_engine import requirements_of
 from offermee.offers.generator import OfferGenerator
 from offermee.offers.dynamic_price_suggestor import DynamicPriceSuggester
 from offermee.utils.email_utils import EmailUtils
@@ -112,7 +113,7 @@ def offer_matcher_render():
         ):
             # fetch for new RFPs in database
             rfp_records: List[Dict[str, Any]] = RFPFacade.get_all_by(
-                {"status": RFPStatus.NEW}
+                {"status": RFPStatus.NEW}, as_dicts=True
             )
             rfp_count = len(rfp_records)
             print(rfp_records)
@@ -170,12 +171,22 @@ def offer_matcher_render():
                     freelancer_id=current_process.get("freelancer-id"),
                 )
                 freelancers.append(freelancer_entry)
+                # scores only the pairs whose RFP or freelancer data changed, in its
+                # own short transaction; on failure the stored scores are shown
+                try:
+                    MatchingFacade.refresh(
+                        freelancer_ids=[current_process.get("freelancer-id")]
+                    )
+                except Exception as e:
+                    log_error(__name__, f"Refreshing the matching scores failed: {e}")
+                    st.warning(f"{_T('Matching scores could not be refreshed')}: {e}")
             freelancer: Dict[str, Any] = freelancer_entry.get("data", None)
             cvs: List[Dict[str, Any]] = freelancer_entry.get("cvs", [])
             # log_debug(__name__, f"Fetched Freelancer:\n{freelancer}")
-            freelancer_tech_skills = " ,".join(
-                freelancer.get("capabilities", {}).get("tech-skills", [])
+            freelancer_skill_list = freelancer.get("capabilities", {}).get(
+                "tech-skills", []
             )
+            freelancer_tech_skills = ", ".join(freelancer_skill_list)
             current_process["freelancer-tech-skills"] = freelancer_tech_skills
             st.write(f"{_T('Freelancer Tech-Skills')}:\n{freelancer_tech_skills}")
             freelancer_desired_rate = freelancer.get("desired_rate_min", 0.0)
@@ -184,26 +195,20 @@ def offer_matcher_render():
                 __name__, f"Freelancer #{current_process.get('freelancer-id')} is found"
             )
             st.success(f"{_T('Freelancer')} {freelancer.get('name')} {_T('is found')}")
-            for new_rfp in new_rfps:
+            # stored scores (see MatchingService), best match first
+            new_rfps_by_id = {
+                new_rfp.get("data", {}).get("id"): new_rfp for new_rfp in new_rfps
+            }
+            for match in MatchingFacade.get_matches(freelancer.get("id")):
+                new_rfp = new_rfps_by_id.get(match["rfp_id"])
+                if new_rfp is None:
+                    continue  # stored after this page loaded its RFPs
                 new_rfp_record = new_rfp.get("data")
-                log_info(__name__, f"Matching project {new_rfp_record.get('title')}")
                 key_rfp = f"rfp#{new_rfp_record.get('id')}"
-                match_score, skill_details = SkillMatcher.match_skills(
-                    new_rfp_record, freelancer_tech_skills
-                )
-                if new_rfp_record.get("hourly_rate"):
-                    if freelancer_desired_rate:
-                        price_score = PriceMatcher.match_price(
-                            new_rfp_record, freelancer_desired_rate
-                        )
-                    else:
-                        # freelancer would accept any rate
-                        price_score = 1
-                else:
-                    price_score = 0
-                total_score = (match_score * 0.7) + (
-                    price_score * 0.3
-                )  # Gewichtung anpassen
+                must_haves, nice_to_haves = requirements_of(new_rfp_record)
+                skill_details = match["match_details"] or {}
+                price_score = match["price_score"]
+                total_score = match["matching_score"]
 
                 st.subheader(new_rfp_record.get("title"))
                 st.write(
@@ -217,19 +222,11 @@ def offer_matcher_render():
                 with st.expander(_T("Details")):
                     st.write(f"**{_T('Must-Have Skills')}:**")
                     for skill, details in skill_details.items():
-                        if (
-                            details["matched"]
-                            and new_rfp_record.get("must_haves")
-                            and skill in new_rfp_record.get("must_haves").lower()
-                        ):
+                        if details["matched"] and skill in must_haves:
                             st.write(f"- {skill} ({_T('Score')}: {details['score']})")
                     st.write(f"**{_T('Nice-To-Have Skills')}:**")
                     for skill, details in skill_details.items():
-                        if (
-                            details["matched"]
-                            and new_rfp_record.get("nice_to_haves")
-                            and skill in new_rfp_record.get("nice_to_haves").lower()
-                        ):
+                        if details["matched"] and skill in nice_to_haves:
                             st.write(f"- {skill} ({_T('Score')}: {details['score']})")
                     st.write(f"**{_T('Preis-Matching-Score')}:** {price_score:.2f}%")
 
@@ -613,29 +610,30 @@ def send_offer_callback(
     )
     st.success(_T("Offer successfully sended!"))
 
-    # convert rfp to project
-    new_project = TransformFacade.create_project_from_rfp(
-        rfp=new_rfp,
-        created_by=operator,
-    )
-    # prepare update:
-    new_project["status"] = ProjectStatus.OFFER_SENT
-    new_project["offers"] = {
-        "project_id": new_rfp.get("id"),
-        "offer_number": datetime.date.today().isoformat(),
-        "title": new_rfp.get("title"),
-        "status": OfferStatus.SENT,
-        "offer_contact_person": new_rfp.get("contact_person"),
-        "offer_contact_person_email": new_rfp.get("contact_person_email"),
-        "offer_text": final_content,
-        "sent_date": datetime.datetime.now(),
-    }
-    # update project and offer records
-    ProjectFacade.update(
-        record_id=new_project.get("id"),
-        data=new_project,
-        created_by=operator,
-    )
+    # convert rfp to project, project and offer are stored together or not at all
+    with DatabaseManager.unit_of_work():
+        new_project = TransformFacade.create_project_from_rfp(
+            rfp=new_rfp,
+            created_by=operator,
+        )
+        # prepare update:
+        new_project["status"] = ProjectStatus.OFFER_SENT
+        new_project["offers"] = {
+            "project_id": new_rfp.get("id"),
+            "offer_number": datetime.date.today().isoformat(),
+            "title": new_rfp.get("title"),
+            "status": OfferStatus.SENT,
+            "offer_contact_person": new_rfp.get("contact_person"),
+            "offer_contact_person_email": new_rfp.get("contact_person_email"),
+            "offer_text": final_content,
+            "sent_date": datetime.datetime.now(),
+        }
+        # update project and offer records
+        ProjectFacade.update(
+            record_id=new_project.get("id"),
+            data=new_project,
+            created_by=operator,
+        )
     new_rfp_entry["offer_written"] = True
     new_rfp_entry["sent"] = datetime.datetime.now()
     new_rfp_entry["status"] = Status.SAVED
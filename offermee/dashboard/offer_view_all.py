@@ -16,7 +16,7 @@ def offer_view_all_render():
     stop_if_not_logged_in()
 
     try:
-        offers = OfferFacade.get_all()
+        offers = OfferFacade.get_all(as_dicts=True)
 
         if offers:
             for offer in offers:
@@ -13,6 +13,7 @@ from offermee.dashboard.helpers.web_dashboard import (
     stop_if_not_logged_in,
 )
 from offermee.database.facades.main_facades import RFPFacade
+from offermee.dashboard.widgets.pager import render_paged_records
 from offermee.utils.international import _T
 from offermee.utils.container import Container
 from offermee.utils.utils import to_comma_separated_string
@@ -32,7 +33,7 @@ def rfp_view_all_render():
     operator = Config.get_instance().get_current_user()
 
     try:
-        rfps = RFPFacade.get_all()
+        rfps = render_paged_records("rfp_view_all", RFPFacade)
         log_info(__name__, f"Fetched {len(rfps)} RFPs:\n{rfps}")
         if rfps:
             # Definiere die Spalten, die du anzeigen möchtest
@@ -1,3 +1,4 @@
+import time
 from typing import Any, Dict, List
 import streamlit as st
 
@@ -6,15 +7,42 @@ from offermee.dashboard.widgets.to_sreamlit import (
     display_dict_as_widgets,
 )
 from offermee.dashboard.helpers.web_dashboard import stop_if_not_logged_in
-from offermee.database.facades.main_facades import ProjectFacade
+from offermee.database.facades.main_facades import ProjectFacade, SearchFacade
 from offermee.database.models.main_models import ProjectModel
 from offermee.database.transformers.to_json_schema import db_model_to_json_schema
 
+SEARCH_TABLE_LABELS = {"rfps": "Ausschreibungen", "projects": "Projekte", "cvs": "CVs"}
+
+
+def render_full_text_search():
+    st.subheader("Volltextsuche")
+    text = st.text_input("Suchbegriffe", placeholder="z.B. python django remote")
+    tables = st.multiselect(
+        "Suchen in",
+        options=list(SEARCH_TABLE_LABELS),
+        default=list(SEARCH_TABLE_LABELS),
+        format_func=SEARCH_TABLE_LABELS.get,
+    )
+    if not text or not tables:
+        return
+    started = time.perf_counter()
+    results = SearchFacade.search(text, limit=50, tables=tables)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    st.caption(f"{len(results)} Treffer in {elapsed_ms:.0f} ms")
+    for result in results:
+        st.markdown(
+            f"**{SEARCH_TABLE_LABELS[result['table']]} #{result['id']}: "
+            f"{result['title']}**  \n{result['snippet'] or ''}"
+        )
+
 
 def render():
     st.header("Projekte suchen")
     stop_if_not_logged_in()
 
+    render_full_text_search()
+
+    st.subheader("Projekte nach Feldern filtern")
     project_json_schema = db_model_to_json_schema(ProjectModel)
 
     project_search_fields = create_search_widget_from_json_schema(project_json_schema)
@@ -135,7 +135,7 @@ def edit(
         facade: BaseFacade = get_facade(model_name=model_name)
         if not facade:
             raise ValueError(f"Unknown model_name='{model_name}'")
-        flat_records = facade.get_all()
+        flat_records = facade.get_all(as_dicts=True)
         record_selection_form(
             label=label,
             data=flat_records,
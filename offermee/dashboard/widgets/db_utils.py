@@ -5,12 +5,14 @@ from typing import Any, Dict, List
 import streamlit as st
 from offermee.AI.cv_processor import CVProcessor
 from offermee.dashboard.helpers.web_dashboard import log_error, log_info
+from offermee.database.database_manager import DatabaseManager
 from offermee.database.facades.main_facades import (
     CVFacade,
     FreelancerFacade,
     RFPFacade,
     ReadFacade,
     SchemaFacade,
+    SkillFacade,
 )
 from offermee.database.models.main_models import ContactRole, RFPSource
 from offermee.utils.utils import safe_type
@@ -53,6 +55,9 @@ def save_cv_to_db(
     cv_soft_skills = CVProcessor.get_all_soft_skills(uploaded_cv["cv_structured_data"])
     uploaded_cv["cv_soft_skills"] = cv_soft_skills
     cv_tech_skills = CVProcessor.get_all_tech_skills(uploaded_cv["cv_structured_data"])
+    # Kanonische Skill-Namen (Aliase wie "c sharp" -> "C#"), damit keine
+    # Beinahe-Duplikate in SkillModel entstehen
+    cv_tech_skills = SkillFacade.canonical_names(cv_tech_skills)
     uploaded_cv["cv_tech_skills"] = cv_tech_skills
     st.success(f"{_T('CV')} {name} {_T('is processed!')}")
     log_info(__name__, f"CV {name} is processed!")
@@ -109,108 +114,126 @@ def save_cv_to_db(
                 db_skills.append({"type": skill_type, "name": name})
         return db_skills
 
-    # Freelancer anlegen, falls nicht vorhanden
-    if not freelancer:
-        log_info(__name__, f"Adding new freelancer {name} to DB...")
-        new_freelancer = {
-            "name": name,
-            "role": "DEVELOPER",
-            "availability": "Sofort",
-            "desired_rate_min": desired_rate_min,
-            "desired_rate_max": desired_rate_max,
-            "offer_template": "Standard-Template",
-            "capabilities": {
-                "soft_skills": skills_to_db("soft", uploaded_cv.get("cv_soft_skills")),
-                "tech_skills": skills_to_db("tech", uploaded_cv.get("cv_tech_skills")),
-            },
-            "contact": {
-                "first_name": uploaded_cv.get("firstnames"),
-                "last_name": uploaded_cv.get("lastname"),
-                "phone": phone,
-                "email": email,
-                "type": ContactRole.FREELANCER,
-                "address": {
-                    "street": address,
-                    "city": city,
-                    "zip_code": zip_code,
-                    "country": country,
+    # Freelancer, Schema und CV gemeinsam speichern (eine Transaktion), damit kein
+    # Freelancer ohne CV zurückbleibt
+    with DatabaseManager.unit_of_work():
+        # Freelancer anlegen, falls nicht vorhanden
+        if not freelancer:
+            log_info(__name__, f"Adding new freelancer {name} to DB...")
+            new_freelancer = {
+                "name": name,
+                "role": "DEVELOPER",
+                "availability": "Sofort",
+                "desired_rate_min": desired_rate_min,
+                "desired_rate_max": desired_rate_max,
+                "offer_template": "Standard-Template",
+                "capabilities": {
+                    "soft_skills": skills_to_db(
+                        "soft", uploaded_cv.get("cv_soft_skills")
+                    ),
+                    "tech_skills": skills_to_db(
+                        "tech", uploaded_cv.get("cv_tech_skills")
+                    ),
                 },
-            },
-            "website": website,
-        }
-        freelancer = FreelancerFacade.create(data=new_freelancer, created_by=operator)
-    else:
-        log_info(
-            __name__,
-            f"Updating existing freelancer {freelancer.get('id')} of {name} to DB.",
-        )
-        update_freelancer = {
-            "name": name,
-            "role": "DEVELOPER",
-            "availability": "Sofort",
-            "desired_rate_min": desired_rate_min,
-            "desired_rate_max": desired_rate_max,
-            "offer_template": "Standard-Template",
-            "capabilities": {
-                "soft_skills": skills_to_db("soft", uploaded_cv.get("cv_soft_skills")),
-                "tech_skills": skills_to_db("tech", uploaded_cv.get("cv_tech_skills")),
-            },
-            "contact": {
-                "first_name": uploaded_cv.get("firstnames"),
-                "last_name": uploaded_cv.get("lastname"),
-                "phone": phone,
-                "email": email,
-                "type": ContactRole.FREELANCER,
-                "address": {
-                    "street": address,
-                    "city": city,
-                    "zip_code": zip_code,
-                    "country": country,
+                "contact": {
+                    "first_name": uploaded_cv.get("firstnames"),
+                    "last_name": uploaded_cv.get("lastname"),
+                    "phone": phone,
+                    "email": email,
+                    "type": ContactRole.FREELANCER,
+                    "address": {
+                        "street": address,
+                        "city": city,
+                        "zip_code": zip_code,
+                        "country": country,
+                    },
                 },
-            },
-            "website": website,
-        }
-        FreelancerFacade.update(
-            freelancer.get("id"), data=update_freelancer, updated_by=operator
-        )
-    # Fetch or Create CV Schema:
-    schema_definition = uploaded_cv.get("cv_schema_reference")
-    schema: Dict[str, Any] = SchemaFacade.get_first_by(
-        {"schema_definition": schema_definition},
-    )
-    if not schema:
-        schema: Dict[str, Any] = SchemaFacade.create(
-            {
-                "name": "cv.schema.json",
-                "schema_definition": schema_definition,
-                "description": "JSON Schema of Structured CV Data.",
-            },
-        )
-    # CV aktualisieren oder anlegen
-    cv = ReadFacade.get_cv_by_freelancer_id(freelancer.get("id"))
-    if cv:
-        log_info(__name__, f"Existing CV found with ID: {cv.get('id')}")
-        log_info(__name__, f"Updating CV of {name} in DB.")
-        update_cv = {
-            "name": name,
-            "cv_raw_text": uploaded_cv.get("cv_raw_text"),
-            "cv_structured_data": json.dumps(uploaded_cv.get("cv_structured_data")),
-            "cv_schema_reference_id": schema.get("id"),
-        }
-        CVFacade.update(record_id=cv.get("id"), data=update_cv, updated_by=operator)
-    else:
-        log_info(
-            __name__,
-            f"No existing CV found for freelancer_id: {freelancer.get('id')}, creating a new CV.",
+                "website": website,
+            }
+            freelancer = FreelancerFacade.create(
+                data=new_freelancer, created_by=operator
+            )
+        else:
+            log_info(
+                __name__,
+                f"Updating existing freelancer {freelancer.get('id')} of {name} "
+                "to DB.",
+            )
+            update_freelancer = {
+                "name": name,
+                "role": "DEVELOPER",
+                "availability": "Sofort",
+                "desired_rate_min": desired_rate_min,
+                "desired_rate_max": desired_rate_max,
+                "offer_template": "Standard-Template",
+                "capabilities": {
+                    "soft_skills": skills_to_db(
+                        "soft", uploaded_cv.get("cv_soft_skills")
+                    ),
+                    "tech_skills": skills_to_db(
+                        "tech", uploaded_cv.get("cv_tech_skills")
+                    ),
+                },
+                "contact": {
+                    "first_name": uploaded_cv.get("firstnames"),
+                    "last_name": uploaded_cv.get("lastname"),
+                    "phone": phone,
+                    "email": email,
+                    "type": ContactRole.FREELANCER,
+                    "address": {
+                        "street": address,
+                        "city": city,
+                        "zip_code": zip_code,
+                        "country": country,
+                    },
+                },
+                "website": website,
+            }
+            FreelancerFacade.update(
+                freelancer.get("id"), data=update_freelancer, updated_by=operator
+            )
+        # Fetch or Create CV Schema:
+        schema_definition = uploaded_cv.get("cv_schema_reference")
+        schema: Dict[str, Any] = SchemaFacade.get_first_by(
+            {"schema_definition": schema_definition},
         )
-        new_cv = {
-            "freelancer_id": freelancer.get("id"),
-            "name": name,
-            "cv_raw_text": uploaded_cv.get("cv_raw_text"),
-            "cv_structured_data": json.dumps(uploaded_cv.get("cv_structured_data")),
-            "cv_schema_reference_id": schema.get("id"),
-        }
-        CVFacade.create(data=new_cv, created_by=operator)
+        if not schema:
+            schema: Dict[str, Any] = SchemaFacade.create(
+                {
+                    "name": "cv.schema.json",
+                    "schema_definition": schema_definition,
+                    "description": "JSON Schema of Structured CV Data.",
+                },
+            )
+        # CV aktualisieren oder anlegen
+        cv = ReadFacade.get_cv_by_freelancer_id(freelancer.get("id"))
+        if cv:
+            log_info(__name__, f"Existing CV found with ID: {cv.get('id')}")
+            log_info(__name__, f"Updating CV of {name} in DB.")
+            update_cv = {
+                "name": name,
+                "cv_raw_text": uploaded_cv.get("cv_raw_text"),
+                "cv_structured_data": json.dumps(
+                    uploaded_cv.get("cv_structured_data")
+                ),
+                "cv_schema_reference_id": schema.get("id"),
+            }
+            CVFacade.update(record_id=cv.get("id"), data=update_cv, updated_by=operator)
+        else:
+            log_info(
+                __name__,
+                f"No existing CV found for freelancer_id: {freelancer.get('id')}, creating a new CV.",
+            )
+            new_cv = {
+                "freelancer_id": freelancer.get("id"),
+                "name": name,
+                "cv_raw_text": uploaded_cv.get("cv_raw_text"),
+                "cv_structured_data": json.dumps(
+                    uploaded_cv.get("cv_structured_data")
+                ),
+                "cv_schema_reference_id": schema.get("id"),
+            }
+            CVFacade.create(data=new_cv, created_by=operator)
 
     log_info(__name__, f"CV for {name} has been saved successfully.")
 
@@ -60,6 +60,10 @@ from offermee.dashboard.data_import import (
     get_title as data_imports_get_title,
 )
 from offermee.dashboard.settings import settings_render, get_title as settings_get_title
+from offermee.dashboard.diagnostics import (
+    diagnostics_render,
+    get_title as diagnostics_get_title,
+)
 from offermee.dashboard.logout import logout_render, get_title as logout_get_title
 from offermee.dashboard.signup import signup_render, get_title as signup_get_title
 from offermee.dashboard.login import login_render, get_title as login_get_title
@@ -151,6 +155,11 @@ LOGGED_IN_PAGES = {
             title=settings_get_title(),
             icon=":material/settings:",
         ),
+        st.Page(
+            diagnostics_render,
+            title=diagnostics_get_title(),
+            icon=":material/monitoring:",
+        ),
     ],
     _T("Logout"): [
         st.Page(
@@ -0,0 +1,56 @@
+from typing import Any, Dict, List, Optional
+import streamlit as st
+from offermee.database.facades.main_facades import BaseFacade
+from offermee.utils.international import _T
+
+
+def render_paged_records(
+    key: str,
+    facade: BaseFacade,
+    pattern: Optional[Dict[str, Any]] = None,
+    page_size: int = 100,
+    order_by: str = "-id",
+) -> List[Dict[str, Any]]:
+    """
+    Loads the current page of records via keyset pagination (facade.get_page) and renders
+    Previous / Next buttons. The cursors of the visited pages are kept in st.session_state.
+
+    Args:
+        key (str): Unique key of the pager, e.g. "rfp_view_all".
+        facade (BaseFacade): The facade to read from, e.g. RFPFacade.
+        pattern (Optional[Dict[str, Any]]): Optional equality filter.
+        page_size (int): Rows per page.
+        order_by (str): Column to order by, prefixed with "-" for descending order.
+
+    Returns:
+        List[Dict[str, Any]]: The records of the current page.
+    """
+    state_key = f"pager_{key}"
+    # cursor (after_id) of every visited page, None for the first page
+    cursors: List[Optional[int]] = st.session_state.setdefault(state_key, [None])
+    records, next_cursor = facade.get_page(
+        pattern=pattern,
+        after_id=cursors[-1],
+        page_size=page_size,
+        order_by=order_by,
+    )
+
+    col_previous, col_page, col_next = st.columns([1, 2, 1])
+    if col_previous.button(
+        _T("Previous"),
+        key=f"{state_key}_previous",
+        icon=":material/chevron_left:",
+        disabled=len(cursors) == 1,
+    ):
+        cursors.pop()
+        st.rerun()
+    col_page.markdown(f"{_T('Page')} {len(cursors)}")
+    if col_next.button(
+        _T("Next"),
+        key=f"{state_key}_next",
+        icon=":material/chevron_right:",
+        disabled=next_cursor is None,
+    ):
+        cursors.append(next_cursor)
+        st.rerun()
+    return records
@@ -43,9 +43,11 @@ def render_cv_selection_form(label: str, pre_selected_candidate: Optional[str] =
                 )
                 st.stop()
 
-        # Retrieve CVs from the database
+        # Retrieve CVs from the database (only the listed columns, not the raw CV text)
         try:
-            cvs: List[Dict[str, Any]] = CVFacade.get_all()
+            cvs: List[Dict[str, Any]] = list(
+                CVFacade.iter_all(columns=["freelancer_id", "name", "updated_at"])
+            )
         except Exception as e:
             log_error("Failed to fetch CVs from the database: {}", str(e))
             st.error(_T("An error occurred while fetching CVs from the database."))
@@ -63,11 +65,7 @@ def render_cv_selection_form(label: str, pre_selected_candidate: Optional[str] =
                     "CV-ID": cv.get("id"),
                     "Freelancer-ID": cv.get("freelancer_id"),
                     "Name": cv.get("name"),
-                    "Last Update": (
-                        cv.get("structured_data", "")[:50] + "..."
-                        if cv.get("structured_data")
-                        else "<EMPTY>"
-                    ),
+                    "Last Update": cv.get("updated_at") or "<EMPTY>",
                 }
             )
 
@@ -99,9 +97,7 @@ def render_cv_selection_form(label: str, pre_selected_candidate: Optional[str] =
         ):
             log_info(__name__, f"Setting CV selection: CV#{selected_cv_id} ...")
             st.session_state["selected_cv_id"] = selected_cv_id
-            st.session_state["selected_cv"] = next(
-                (cv for cv in cvs if cv.get("id") == selected_cv_id), None
-            )
+            st.session_state["selected_cv"] = CVFacade.get_by_id(selected_cv_id)
             log_info(__name__, f"CV selection done: CV#{selected_cv_id}")
 
 
@@ -145,7 +141,7 @@ def render_freelancer_selection_form(
 
         # Retrieve freelancers from the database
         try:
-            freelancers: List[Dict[str, Any]] = FreelancerFacade.get_all()
+            freelancers: List[Dict[str, Any]] = list(FreelancerFacade.iter_all())
         except Exception as e:
             log_error("Failed to fetch freelancers from the database: {}", str(e))
             st.error(
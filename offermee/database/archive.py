@@ -0,0 +1,144 @@
+"""
+Archival of stale RFPs.
+
+RFPs past their end date or older than max_age_days are moved, in batches, from
+the rfps working set into the rfps_archive table (same columns plus archived_at).
+Only RFPs nobody works on are archived: offered RFPs and RFPs with an open project
+(linked by the original link) stay in the working set.
+The hot queries on rfps then only touch live RFPs; archived ones are still found
+by find_archived_rfp, so the scrapers do not import them again.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, exists, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from offermee.database.history_sink import record_history
+from offermee.database.models.main_models import (
+    HistoryType,
+    ProjectModel,
+    ProjectStatus,
+    RFPModel,
+    RFPStatus,
+    rfps_archive,
+    skill_index,
+)
+from offermee.database.models.matching_score_model import MatchingScoreModel
+from offermee.database.skill_index import RFP_OWNER
+from offermee.database.soft_delete import INCLUDE_DELETED
+from offermee.utils.date_parser import parse_date
+
+DEFAULT_MAX_AGE_DAYS = 90
+# RFP statuses that may be archived, an OFFERED RFP waits for the customer's answer
+ARCHIVABLE_RFP_STATUSES = (RFPStatus.NEW, RFPStatus.OUTDATED, RFPStatus.REJECTED)
+# projects in these statuses do not keep their RFP in the working set
+CLOSED_PROJECT_STATUSES = (ProjectStatus.COMPLETED, ProjectStatus.REJECTED)
+
+
+def _is_stale(
+    end_date: Optional[str], created_at: Optional[datetime], cutoff: datetime, today: date
+) -> bool:
+    if created_at is not None and created_at < cutoff:
+        return True
+    end = parse_date(end_date) if end_date else None
+    return end is not None and end < today
+
+
+def stale_rfp_ids(
+    session: Session, max_age_days: int = DEFAULT_MAX_AGE_DAYS, now: Optional[datetime] = None
+) -> List[int]:
+    """
+    IDs of the RFPs (soft-deleted ones included) past their end date or created
+    more than max_age_days ago. end_date is free text, so it is parsed here.
+    RFPs in other than the ARCHIVABLE_RFP_STATUSES and RFPs with an open project
+    (one with the same original link, not in CLOSED_PROJECT_STATUSES) are kept.
+    """
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=max_age_days)
+    open_project = exists().where(
+        ProjectModel.original_link == RFPModel.original_link,
+        or_(
+            ProjectModel.status.is_(None),
+            ProjectModel.status.not_in(CLOSED_PROJECT_STATUSES),
+        ),
+    )
+    rows = session.execute(
+        select(RFPModel.id, RFPModel.end_date, RFPModel.created_at)
+        .where(RFPModel.status.in_(ARCHIVABLE_RFP_STATUSES), ~open_project)
+        .execution_options(**{INCLUDE_DELETED: True})
+    )
+    return [
+        row.id
+        for row in rows
+        if _is_stale(row.end_date, row.created_at, cutoff, now.date())
+    ]
+
+
+def archive_rfps(
+    session: Session,
+    max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+    now: Optional[datetime] = None,
+    archived_by: str = "system",
+    batch_size: int = 500,
+) -> int:
+    """
+    Moves the stale RFPs (see stale_rfp_ids) to rfps_archive. The caller commits.
+
+    Returns:
+        int: The number of archived RFPs.
+    """
+    now = now or datetime.utcnow()
+    ids = stale_rfp_ids(session, max_age_days=max_age_days, now=now)
+    columns = [col.name for col in RFPModel.__table__.columns]
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start : start + batch_size]
+        session.execute(
+            insert(rfps_archive).from_select(
+                [*columns, "archived_at"],
+                select(
+                    *(RFPModel.__table__.c[name] for name in columns),
+                    literal(now, rfps_archive.c.archived_at.type),
+                ).where(RFPModel.__table__.c.id.in_(batch)),
+            )
+        )
+        # derived data, not archived (SQLite does not enforce the ON DELETE CASCADE)
+        session.execute(
+            delete(MatchingScoreModel).where(MatchingScoreModel.rfp_id.in_(batch)),
+            execution_options={"synchronize_session": False},
+        )
+        session.execute(
+            delete(skill_index).where(
+                skill_index.c.owner_type == RFP_OWNER,
+                skill_index.c.owner_id.in_(batch),
+            )
+        )
+        # ORM delete, so the session and entity cache forget the rows
+        session.execute(
+            delete(RFPModel).where(RFPModel.id.in_(batch)),
+            execution_options={"synchronize_session": False},
+        )
+        for rfp_id in batch:
+            record_history(
+                session,
+                related_type=HistoryType.RFP,
+                related_id=rfp_id,
+                description=f"Archived RFPModel with ID={rfp_id}",
+                created_by=archived_by,
+            )
+    return len(ids)
+
+
+def find_archived_rfp(
+    session: Session, pattern: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    The first archived RFP matching the pattern (column name -> value) as a dict,
+    None if there is none.
+    """
+    stmt = select(rfps_archive).limit(1)
+    for key, value in pattern.items():
+        stmt = stmt.where(rfps_archive.c[key] == value)
+    row = session.execute(stmt).first()
+    return dict(row._mapping) if row else None
@@ -1,7 +1,11 @@
 # offermee/database/db_connection.py
 from contextlib import contextmanager
 
-from offermee.database.database_manager import DatabaseManager
+from offermee.database.database_manager import (
+    UNIT_OF_WORK_FAILED_KEY,
+    DatabaseManager,
+    UnitOfWorkFailedError,
+)
 from offermee.utils.logger import CentralLogger
 from sqlalchemy.orm import Session
 
@@ -15,7 +19,25 @@ def session_scope():
 
     Ensures that the session is committed on success,
     rolled back on error, and closed afterwards.
+    Inside DatabaseManager.unit_of_work() the session of the unit of work is reused.
     """
+    unit_of_work: Session = DatabaseManager.current_unit_of_work()
+    if unit_of_work is not None:
+        # inside DatabaseManager.unit_of_work(): it commits and closes the shared session
+        error = unit_of_work.info.get(UNIT_OF_WORK_FAILED_KEY)
+        if error is not None:
+            # the work before the failed call is gone, later writes must not commit
+            raise UnitOfWorkFailedError(
+                f"Unit of work was rolled back because of: {error}"
+            ) from error
+        try:
+            yield unit_of_work
+        except Exception as e:
+            unit_of_work.rollback()  # discards the work of the unit so far
+            unit_of_work.info[UNIT_OF_WORK_FAILED_KEY] = e
+            db_logger.error(f"Unit of work rollback because of: {e}")
+            raise
+        return
     session: Session = connect_to_db()  # Open a new database session
     try:
         yield session  # Provide the session to the context block
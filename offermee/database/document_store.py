@@ -0,0 +1,175 @@
+"""
+Document raw texts in the blob store.
+
+Raw texts of OFFLOAD_MIN_LENGTH characters or more are not stored in the
+documents table: on insert / update the text goes to the content-addressed
+BlobStore and the row keeps only its hash (document_blob_hash), so the main
+database stays small. Loading a document through the ORM puts the text back
+into document_raw_text, load_raw_texts does the same for rows read as plain
+dicts (select_dicts).
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from sqlalchemy import event, func, inspect, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from offermee.database.models.main_models import DocumentModel
+from offermee.utils.blob_store import BlobStore
+
+OFFLOAD_MIN_LENGTH = 2048
+_OFFLOADED_KEY = "offloaded_raw_text"
+
+
+def _raw_text_changed(target: DocumentModel, is_insert: bool) -> bool:
+    state = inspect(target)
+    if is_insert:
+        return "document_raw_text" in state.dict
+    return state.attrs.document_raw_text.history.has_changes()
+
+
+def _offload(target: DocumentModel, is_insert: bool) -> None:
+    if not _raw_text_changed(target, is_insert):
+        return
+    text = target.document_raw_text
+    if text is None or len(text) < OFFLOAD_MIN_LENGTH:
+        target.document_blob_hash = None
+        return
+    target.document_blob_hash = BlobStore.get_instance().put(text)
+    target.document_raw_text = None
+    # restored after the flush, the instance keeps showing the text
+    inspect(target).info[_OFFLOADED_KEY] = text
+
+
+def _restore(target: DocumentModel) -> None:
+    text = inspect(target).info.pop(_OFFLOADED_KEY, None)
+    if text is not None:
+        set_committed_value(target, "document_raw_text", text)
+
+
+@event.listens_for(DocumentModel, "before_insert")
+def _offload_on_insert(mapper, connection, target: DocumentModel) -> None:
+    _offload(target, is_insert=True)
+
+
+@event.listens_for(DocumentModel, "before_update")
+def _offload_on_update(mapper, connection, target: DocumentModel) -> None:
+    _offload(target, is_insert=False)
+
+
+@event.listens_for(DocumentModel, "after_insert")
+@event.listens_for(DocumentModel, "after_update")
+def _restore_after_flush(mapper, connection, target: DocumentModel) -> None:
+    _restore(target)
+
+
+def _load_text(target: DocumentModel) -> None:
+    state = inspect(target)
+    digest = state.dict.get("document_blob_hash")
+    if not digest or "document_raw_text" not in state.dict:
+        return
+    if state.dict["document_raw_text"] is not None:
+        return
+    try:
+        text = BlobStore.get_instance().get_text(digest)
+    except (KeyError, OSError) as e:
+        logging.error(f"Raw text of document {target.id} not readable: {e}")
+        return
+    set_committed_value(target, "document_raw_text", text)
+
+
+@event.listens_for(DocumentModel, "load")
+def _load_text_on_load(target: DocumentModel, context) -> None:
+    _load_text(target)
+
+
+@event.listens_for(DocumentModel, "refresh")
+def _load_text_on_refresh(target: DocumentModel, context, attrs) -> None:
+    # also fired when the deferred raw text is loaded on access
+    if attrs is None or "document_raw_text" in attrs:
+        _load_text(target)
+
+
+def load_raw_texts(
+    session: Session, model: Any, rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Puts the offloaded raw texts into document rows read without the ORM, like the
+    load event above does for instances. The hashes of rows selected without the
+    document_blob_hash column are read with one query. Rows of other models and rows
+    without the document_raw_text column are returned unchanged.
+    """
+    if model is not DocumentModel:
+        return rows
+    missing = [
+        row
+        for row in rows
+        if "document_raw_text" in row and row["document_raw_text"] is None
+    ]
+    if not missing:
+        return rows
+    hashes = {
+        row["id"]: row["document_blob_hash"]
+        for row in missing
+        if "document_blob_hash" in row
+    }
+    unselected = [row["id"] for row in missing if row["id"] not in hashes]
+    if unselected:
+        hashes.update(
+            session.execute(
+                select(DocumentModel.id, DocumentModel.document_blob_hash).where(
+                    DocumentModel.id.in_(unselected)
+                )
+            ).all()
+        )
+    store = BlobStore.get_instance()
+    for row in missing:
+        digest = hashes.get(row["id"])
+        if not digest:
+            continue
+        try:
+            row["document_raw_text"] = store.get_text(digest)
+        except (KeyError, OSError) as e:
+            logging.error(f"Raw text of document {row['id']} not readable: {e}")
+    return rows
+
+
+def offload_existing_texts(session: Session, batch_size: int = 200) -> Dict[str, int]:
+    """
+    Moves the long raw texts of existing documents to the blob store, e.g. of rows
+    written before the blob store existed. The caller commits; run VACUUM afterwards
+    to give the space back.
+
+    Returns:
+        Dict[str, int]: Number of moved documents and of moved characters.
+    """
+    ids = session.scalars(
+        select(DocumentModel.id).where(
+            func.length(DocumentModel.document_raw_text) >= OFFLOAD_MIN_LENGTH
+        )
+    ).all()
+    store = BlobStore.get_instance()
+    moved_chars = 0
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start : start + batch_size]
+        rows = session.execute(
+            select(DocumentModel.id, DocumentModel.document_raw_text).where(
+                DocumentModel.id.in_(batch)
+            )
+        ).all()
+        # bulk UPDATE by primary key, bypasses the mapper events above
+        session.execute(
+            update(DocumentModel),
+            [
+                {
+                    "id": row.id,
+                    "document_blob_hash": store.put(row.document_raw_text),
+                    "document_raw_text": None,
+                }
+                for row in rows
+            ],
+        )
+        moved_chars += sum(len(row.document_raw_text) for row in rows)
+    return {"documents": len(ids), "characters": moved_chars}
@@ -0,0 +1,183 @@
+"""
+In-process read-through cache for the facades.
+
+Entries are keyed by (table, kind, arguments), e.g.
+("freelancers", "get_by_id", (3, None)), and evicted by TTL and LRU. All
+Streamlit sessions of a server process share one cache, access is guarded by
+a lock.
+
+Every ORM write invalidates the cached entries of the written tables: the tables
+are collected when a session flushes (or executes an INSERT / UPDATE / DELETE
+statement), invalidated right away and once more when the transaction commits,
+so a read racing with the commit cannot keep the old state. Writes of other
+processes become visible after the TTL.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+
+from offermee.database.database_manager import UNIT_OF_WORK_KEY
+
+_DIRTY_TABLES_KEY = "entity_cache_dirty_tables"
+
+
+def _copy(value: Any) -> Any:
+    # callers modify the returned dicts, also nested JSON values (e.g. a list of
+    # requirements), so every caller gets its own deep copy of the cached value
+    return copy.deepcopy(value)
+
+
+class EntityCache:
+    """
+    Thread-safe TTL / LRU cache of facade read results with per-table invalidation.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 120.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_load(
+        self, table: str, key: Tuple[Hashable, ...], load: Callable[[], Any]
+    ) -> Any:
+        """
+        Returns a copy of the cached value of key or loads, caches and returns it.
+        Uncommitted data of a unit of work that already wrote is never cached.
+        """
+        full_key = (table, *key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return _copy(entry[1])
+            if entry is not None:
+                del self._entries[full_key]
+            self.misses += 1
+            generation = self._generations.get(table, 0)
+        value = load()
+        if _unit_of_work_wrote():
+            return value
+        with self._lock:
+            # skip the result if the table was written while it was loaded
+            if self._generations.get(table, 0) == generation:
+                self._entries[full_key] = (now + self.ttl, value)
+                self._entries.move_to_end(full_key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return _copy(value)
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        """
+        Drops the cached entries of the given tables.
+        """
+        tables = set(tables)
+        if not tables:
+            return
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+            stale = [key for key in self._entries if key[0] in tables]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for table in self._generations:
+                self._generations[table] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+entity_cache = EntityCache()
+
+
+def _unit_of_work_wrote() -> bool:
+    from offermee.database.database_manager import DatabaseManager
+
+    session = DatabaseManager.current_unit_of_work()
+    return session is not None and bool(session.info.get(_DIRTY_TABLES_KEY))
+
+
+def _mark_dirty(session: Session, tables: Set[str]) -> None:
+    if not tables:
+        return
+    session.info.setdefault(_DIRTY_TABLES_KEY, set()).update(tables)
+    connection = session.info.get(UNIT_OF_WORK_KEY)
+    if connection is not None:
+        # a unit of work commits its connection later, see _invalidate_on_commit
+        connection.info.setdefault(_DIRTY_TABLES_KEY, set()).update(tables)
+    entity_cache.invalidate(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, flush_context) -> None:
+    _mark_dirty(
+        session,
+        {
+            obj.__table__.name
+            for obj in (*session.new, *session.dirty, *session.deleted)
+            if hasattr(obj, "__table__")
+        },
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_executed_tables(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or (
+        orm_execute_state.is_delete
+    ):
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _mark_dirty(orm_execute_state.session, {mapper.local_table.name})
+        else:
+            # Core statements on a Table, e.g. assign_rfp_skill_ids
+            table = getattr(orm_execute_state.statement, "table", None)
+            if table is not None and hasattr(table, "name"):
+                _mark_dirty(orm_execute_state.session, {table.name})
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_on_session_end(session: Session) -> None:
+    if UNIT_OF_WORK_KEY in session.info:
+        return  # the commits of a unit of work only flush
+    entity_cache.invalidate(session.info.pop(_DIRTY_TABLES_KEY, ()))
+
+
+@event.listens_for(Engine, "commit")
+@event.listens_for(Engine, "rollback")
+def _invalidate_on_commit(connection) -> None:
+    tables: Optional[Set[str]] = connection.info.pop(_DIRTY_TABLES_KEY, None)
+    if tables:
+        entity_cache.invalidate(tables)
@@ -1,13 +1,18 @@
 # offermee/database/facades/freelancer_facade.py
 import json
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Hashable, Iterator, List, Optional, Tuple
+
+from offermee.database.archive import DEFAULT_MAX_AGE_DAYS
+from offermee.database.facades.entity_cache import entity_cache
 
 from offermee.database.models.main_models import (
     DocumentRelatedType,
     HistoryType,
     ProjectStatus,
     RFPSource,
+    RFPStatus,
 )
+from offermee.database.matching import RefreshResult
 from offermee.database.services.main_services import (
     AddressService,
     ApplicantService,
@@ -22,11 +27,14 @@ from offermee.database.services.main_services import (
     CVService,
     HistoryService,
     InterviewService,
+    MatchingService,
     OfferService,
     ProjectService,
     RFPService,
     ReadService,
     SchemaService,
+    SearchService,
+    SkillAliasService,
     SkillService,
     TransformService,
     WorkPackageService,
@@ -46,6 +54,49 @@ class BaseFacade:
     SERVICE: BaseService = None  # z.B. AddressService
     HISTORY_TYPE = None  # z.B. "ADDRESS" oder HistoryType.ADDRESS.value
     DOCUMENT_TYPE = None  # z.B. "ADDRESS" oder DocumentRelatedType.ADDRESS.value
+    CACHED = True  # Lesezugriffe über den gemeinsamen EntityCache (siehe entity_cache.py)
+
+    @classmethod
+    def _cached(cls, kind: str, args: Optional[Tuple[Hashable, ...]], load: Callable):
+        """
+        Liest über den EntityCache. args=None (z.B. ein Muster mit Listen als Wert)
+        umgeht den Cache.
+        """
+        if not cls.CACHED or args is None:
+            return load()
+        return entity_cache.get_or_load(
+            cls.SERVICE.MODEL.__tablename__, (kind, args), load
+        )
+
+    @staticmethod
+    def _cache_args(*args: Any) -> Optional[Tuple[Hashable, ...]]:
+        """
+        Cache-Schlüssel aus den Argumenten; Dicts und Listen werden zu Tupeln,
+        None wenn ein Wert nicht hashbar ist.
+        """
+        frozen = []
+        for arg in args:
+            if isinstance(arg, dict):
+                arg = tuple(sorted(arg.items()))
+            elif isinstance(arg, list):
+                arg = tuple(arg)
+            try:
+                hash(arg)
+            except TypeError:
+                return None
+            frozen.append(arg)
+        return tuple(frozen)
+
+    @staticmethod
+    def cache_stats() -> Dict[str, Any]:
+        """
+        Treffer, Fehlzugriffe, Verdrängungen und Größe des EntityCache.
+        """
+        return entity_cache.stats()
+
+    @staticmethod
+    def clear_cache() -> None:
+        entity_cache.clear()
 
     @classmethod
     def create(
@@ -62,33 +113,171 @@ class BaseFacade:
         )
 
     @classmethod
-    def get_by_id(cls, record_id: int) -> Optional[Dict[str, Any]]:
+    def bulk_create(
+        cls, records: List[Dict[str, Any]], created_by: str = "system"
+    ) -> List[Dict[str, Any]]:
+        """
+        Legt viele Datensätze in einer einzigen Transaktion an.
+        Gibt die neu erzeugten Datensätze als Dicts zurück.
+        """
+        return cls.SERVICE.bulk_create(records=records, created_by=created_by)
+
+    @classmethod
+    def odd_fields(cls, record: Dict[str, Any]) -> List[str]:
+        """
+        Gibt die Felder des Datensatzes zurück, die das Modell nicht kennt
+        (ohne Datenbankzugriff). Ein Bulk-Schreibvorgang scheitert an solchen Feldern.
+        """
+        return cls.SERVICE.odd_fields(record)
+
+    @classmethod
+    def bulk_upsert(
+        cls,
+        records: List[Dict[str, Any]],
+        conflict_keys: List[str],
+        created_by: str = "system",
+    ) -> List[Dict[str, Any]]:
+        """
+        Legt neue Datensätze an bzw. aktualisiert vorhandene, erkannt über die
+        Spalten in conflict_keys (z.B. ["original_link"]). Eine Transaktion.
+        """
+        return cls.SERVICE.bulk_upsert(
+            records=records, conflict_keys=conflict_keys, created_by=created_by
+        )
+
+    @classmethod
+    def get_by_id(
+        cls, record_id: int, columns: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Gibt den Freelancer als Dict zurück oder None, falls nicht gefunden.
+        columns schränkt die gelesenen Spalten ein (die ID ist immer enthalten).
         """
-        return cls.SERVICE.get_by_id(record_id)
+        return cls._cached(
+            "get_by_id",
+            cls._cache_args(record_id, columns),
+            lambda: cls.SERVICE.get_by_id(record_id, columns=columns),
+        )
 
     @classmethod
-    def get_all(cls, limit: int = 1000) -> List[Dict[str, Any]]:
+    def get_all(
+        cls,
+        limit: int = 1000,
+        as_dicts: bool = False,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Liste aller Freelancer (als Dict) zurückgeben, optional mit Limit.
-        """
-        return cls.SERVICE.get_all(limit=limit)
+        as_dicts=True liest die Zeilen direkt als Dicts, ohne ORM-Objekte (schneller bei vielen Zeilen).
+        columns schränkt die gelesenen Spalten ein, z.B. ["name"] für Auswahllisten.
+        """
+        return cls._cached(
+            "get_all",
+            cls._cache_args(limit, as_dicts, columns),
+            lambda: cls.SERVICE.get_all(
+                limit=limit, as_dicts=as_dicts, columns=columns
+            ),
+        )
 
     @classmethod
     def get_all_by(
-        cls, pattern: Dict[str, Any], limit: int = 1000
+        cls,
+        pattern: Dict[str, Any],
+        limit: int = 1000,
+        as_dicts: bool = False,
+        columns: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        return cls.SERVICE.get_all_by(pattern=pattern, limit=limit)
+        return cls._cached(
+            "get_all_by",
+            cls._cache_args(pattern, limit, as_dicts, columns),
+            lambda: cls.SERVICE.get_all_by(
+                pattern=pattern, limit=limit, as_dicts=as_dicts, columns=columns
+            ),
+        )
 
     @classmethod
-    def get_first_by(cls, pattern: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        return cls.SERVICE.get_first_by(pattern=pattern)
+    def get_page(
+        cls,
+        pattern: Optional[Dict[str, Any]] = None,
+        after_id: Optional[int] = None,
+        page_size: int = 100,
+        order_by: str = "id",
+        columns: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Eine Seite Datensätze (als Dicts) nach dem Datensatz mit der ID after_id.
+        order_by ist ein Spaltenname, mit "-" davor absteigend.
+        Gibt die Seite und den Cursor für die nächste Seite zurück (None auf der letzten Seite).
+        """
+        return cls.SERVICE.get_page(
+            pattern=pattern,
+            after_id=after_id,
+            page_size=page_size,
+            order_by=order_by,
+            columns=columns,
+        )
 
     @classmethod
-    def get_by_id_with_relations(cls, record_id: int):
-        """Eager loading"""
-        return cls.SERVICE.get_by_id_with_relations(record_id=record_id)
+    def iter_all(
+        cls,
+        pattern: Optional[Dict[str, Any]] = None,
+        batch_size: int = 500,
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Liefert alle passenden Datensätze (als Dicts) nacheinander, ohne Limit,
+        in Blöcken von batch_size Zeilen.
+        """
+        return cls.SERVICE.iter_all(
+            pattern=pattern, batch_size=batch_size, columns=columns
+        )
+
+    @classmethod
+    def get_first_by(
+        cls, pattern: Dict[str, Any], include_deleted: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Erster Datensatz, der dem Muster (Spalte -> Wert) entspricht.
+        include_deleted findet auch soft-gelöschte Datensätze.
+        """
+        return cls._cached(
+            "get_first_by",
+            cls._cache_args(pattern, include_deleted),
+            lambda: cls.SERVICE.get_first_by(
+                pattern=pattern, include_deleted=include_deleted
+            ),
+        )
+
+    @classmethod
+    def get_by_id_with_relations(
+        cls,
+        record_id: int,
+        include: Optional[List[str]] = None,
+        depth: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Eager loading: der Datensatz mit seinen verknüpften Datensätzen als
+        verschachteltes Dict. include (z.B. ["offers", "offers.documents"]) oder
+        depth (Anzahl Ebenen) schränken die geladenen Beziehungen ein.
+        """
+        return cls.SERVICE.get_by_id_with_relations(
+            record_id=record_id, include=include, depth=depth
+        )
+
+    @classmethod
+    def get_many_with_relations(
+        cls,
+        record_ids: List[int],
+        include: Optional[List[str]] = None,
+        depth: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Wie get_by_id_with_relations für viele Datensätze, mit einer Abfrage pro
+        Beziehung statt pro Datensatz. Reihenfolge wie record_ids.
+        """
+        return cls.SERVICE.get_many_with_relations(
+            record_ids=record_ids, include=include, depth=depth
+        )
 
     @classmethod
     def update(
@@ -110,14 +299,26 @@ class BaseFacade:
 
     @classmethod
     def delete(
-        cls, record_id: int, deleted_by: str = "system"
-    ) -> bool:  # TODO soft_delete: bool = False,
+        cls,
+        record_id: int,
+        deleted_by: str = "system",
+        soft_delete: Optional[bool] = None,
+    ) -> bool:
         """
         Löscht einen Datensatz via Service. Gibt True/False zurück, je nach Erfolg.
+        Modelle mit deleted_at werden standardmäßig soft gelöscht,
+        soft_delete=False löscht endgültig.
         """
         return cls.SERVICE.delete(
-            record_id, deleted_by=deleted_by
-        )  # TODO soft_delete=soft_delete,
+            record_id, deleted_by=deleted_by, soft_delete=soft_delete
+        )
+
+    @classmethod
+    def restore(cls, record_id: int, restored_by: str = "system") -> bool:
+        """
+        Stellt einen soft gelöschten Datensatz wieder her.
+        """
+        return cls.SERVICE.restore(record_id, restored_by=restored_by)
 
 
 # ------------------------------------------------------------
@@ -148,12 +349,14 @@ class DocumentFacade(BaseFacade):
     SERVICE = DocumentService
     HISTORY_TYPE = SERVICE.HISTORY_TYPE
     DOCUMENT_TYPE = SERVICE.DOCUMENT_TYPE
+    CACHED = False  # große Inhalte bzw. nur angehängt, selten wiederholt gelesen
 
 
 class HistoryFacade(BaseFacade):
     SERVICE = HistoryService
     HISTORY_TYPE = SERVICE.HISTORY_TYPE
     DOCUMENT_TYPE = SERVICE.DOCUMENT_TYPE
+    CACHED = False  # große Inhalte bzw. nur angehängt, selten wiederholt gelesen
 
 
 class SkillFacade(BaseFacade):
@@ -161,6 +364,20 @@ class SkillFacade(BaseFacade):
     HISTORY_TYPE = SERVICE.HISTORY_TYPE
     DOCUMENT_TYPE = SERVICE.DOCUMENT_TYPE
 
+    @classmethod
+    def canonical_names(cls, names: List[str]) -> List[str]:
+        """
+        Kanonische Namen der Skills (Aliase aufgelöst, z.B. "c sharp" -> "C#"),
+        ohne Duplikate.
+        """
+        return cls.SERVICE.canonical_names(names)
+
+
+class SkillAliasFacade(BaseFacade):
+    SERVICE = SkillAliasService
+    HISTORY_TYPE = SERVICE.HISTORY_TYPE
+    DOCUMENT_TYPE = SERVICE.DOCUMENT_TYPE
+
 
 class CapabilitiesFacade(BaseFacade):
     SERVICE = CapabilitiesService
@@ -203,6 +420,32 @@ class RFPFacade(BaseFacade):
     HISTORY_TYPE = SERVICE.HISTORY_TYPE
     DOCUMENT_TYPE = SERVICE.DOCUMENT_TYPE
 
+    @classmethod
+    def get_all_requiring(
+        cls, requirements: List[str], limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        RFPs, deren Must-have-Anforderungen alle angegebenen Anforderungen enthalten.
+        """
+        return cls._cached(
+            "get_all_requiring",
+            cls._cache_args(requirements, limit),
+            lambda: cls.SERVICE.get_all_requiring(requirements, limit=limit),
+        )
+
+    @classmethod
+    def archive_stale(
+        cls, max_age_days: int = DEFAULT_MAX_AGE_DAYS, archived_by: str = "system"
+    ) -> int:
+        """
+        Verschiebt RFPs nach ihrem Enddatum oder älter als max_age_days in das Archiv,
+        außer angebotenen RFPs und RFPs mit einem offenen Projekt.
+        Gibt die Anzahl der archivierten RFPs zurück.
+        """
+        return cls.SERVICE.archive_stale(
+            max_age_days=max_age_days, archived_by=archived_by
+        )
+
 
 class ProjectFacade(BaseFacade):
     SERVICE = ProjectService
@@ -234,6 +477,46 @@ class OfferFacade(BaseFacade):
     DOCUMENT_TYPE = SERVICE.DOCUMENT_TYPE
 
 
+class MatchingFacade(BaseFacade):
+    SERVICE = MatchingService
+    HISTORY_TYPE = None
+    DOCUMENT_TYPE = None
+    CACHED = False  # Ergebnisse hängen auch von rfps ab (Status, Soft Delete)
+
+    @classmethod
+    def refresh(
+        cls,
+        rfp_ids: Optional[List[int]] = None,
+        freelancer_ids: Optional[List[int]] = None,
+        force: bool = False,
+    ) -> RefreshResult:
+        """
+        Berechnet die Matching-Scores der (neuen) RFPs x Freelancer neu, deren
+        Anforderungen, Skills oder Stundensätze sich seit der letzten Bewertung
+        geändert haben.
+        """
+        return cls.SERVICE.refresh(
+            rfp_ids=rfp_ids, freelancer_ids=freelancer_ids, force=force
+        )
+
+    @classmethod
+    def get_matches(
+        cls,
+        freelancer_id: int,
+        status: Optional[RFPStatus] = RFPStatus.NEW,
+        min_score: float = 0.0,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Gespeicherte Scores eines Freelancers für die RFPs (mit status), bester
+        zuerst. Jeder Eintrag enthält rfp_id, matching_score, skill_score,
+        price_score, match_details und matched_at.
+        """
+        return cls.SERVICE.get_matches(
+            freelancer_id, status=status, min_score=min_score, limit=limit
+        )
+
+
 # ----------------------------------------------------------
 # SPEZIFISCHE Lese-Hilfsmethoden
 # ----------------------------------------------------------
@@ -377,6 +660,32 @@ class ReadFacade:
                 return None
 
 
+# ----------------------------------------------------------
+# Volltextsuche
+# ----------------------------------------------------------
+class SearchFacade:
+    """
+    Volltextsuche über Ausschreibungen (rfps), Projekte (projects) und CVs (cvs).
+    """
+
+    @staticmethod
+    def search(
+        text: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 50,
+        tables: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Findet Datensätze, die alle Wörter aus text enthalten, bestes Ergebnis zuerst.
+        filters sind Gleichheitsbedingungen, meist zusammen mit einer Tabelle,
+        z.B. filters={"status": RFPStatus.NEW}, tables=["rfps"].
+        Jedes Ergebnis enthält table, id, title, snippet und rank.
+        """
+        return SearchService.search(
+            text=text, filters=filters, limit=limit, tables=tables
+        )
+
+
 # ----------------------------------------------------------
 # SPEZIFISCHE Transformation-Hilfsmethoden
 # ----------------------------------------------------------
@@ -0,0 +1,223 @@
+"""
+History (audit) sink.
+
+History entries are buffered on the session and written with one executemany
+INSERT when the session commits, instead of an add and a flush per entry. In
+the optional background mode the committed entries are handed to a writer
+thread, which inserts them batched in its own transaction, so the committing
+request does not wait for the audit rows.
+
+Entries carry a compact diff of the changed fields instead of the whole payload.
+"""
+
+import atexit
+import enum
+import json
+import logging
+import queue
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Engine, event, insert, inspect
+from sqlalchemy.orm import Session
+
+from offermee.database.database_manager import UNIT_OF_WORK_KEY
+from offermee.database.models.main_models import HistoryModel
+
+HISTORY_BUFFER_KEY = "history_buffer"
+_COMMITTED_KEY = "history_committed"
+MAX_VALUE_LENGTH = 200  # longer values are shortened in the stored diff
+
+
+def compact_value(value: Any) -> Any:
+    """
+    Converts a field value into a short JSON-serializable value for the history diff.
+    """
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, str):
+        if len(value) <= MAX_VALUE_LENGTH:
+            return value
+        return f"{value[:MAX_VALUE_LENGTH]}... ({len(value)} chars)"
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    text = json.dumps(value, default=str)
+    if len(text) <= MAX_VALUE_LENGTH:
+        return json.loads(text)
+    size = len(value) if hasattr(value, "__len__") else len(text)
+    return f"<{type(value).__name__} with {size} entries>"
+
+
+def created_fields(flat_fields: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    The diff of a new record: every field that was set.
+    """
+    return {
+        key: {"new": compact_value(value)}
+        for key, value in flat_fields.items()
+        if value is not None
+    }
+
+
+def field_changes(instance: Any, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    The diff of the given attributes of a persistent instance, read from the
+    attribute history; must be called before the next flush. Unchanged values are
+    skipped; the old value of an attribute that was not loaded (e.g. deferred) is omitted.
+    """
+    attrs = inspect(instance).attrs
+    changes: Dict[str, Dict[str, Any]] = {}
+    for key in keys:
+        history = attrs[key].history
+        if not history.added:
+            continue
+        change = {}
+        if history.deleted:
+            change["old"] = compact_value(history.deleted[0])
+        change["new"] = compact_value(history.added[0])
+        changes[key] = change
+    return changes
+
+
+def record_history(
+    session: Session,
+    related_type: Any,
+    related_id: int,
+    description: str,
+    created_by: str = "system",
+    changes: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Buffers a history entry on the session; it is written when the session commits
+    and discarded on rollback.
+    """
+    session.info.setdefault(HISTORY_BUFFER_KEY, []).append(
+        {
+            "related_type": related_type,
+            "related_id": related_id,
+            "description": description,
+            "changes": changes or None,
+            "event_date": datetime.utcnow(),
+            "created_by": created_by,
+        }
+    )
+
+
+class BackgroundHistoryWriter:
+    """
+    Writer thread inserting committed history entries in batches.
+    """
+
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[Optional[Tuple[Engine, List[Dict[str, Any]]]]]" = (
+            queue.Queue()
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="history-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, engine: Engine, rows: List[Dict[str, Any]]) -> None:
+        self._queue.put((engine, rows))
+
+    def flush(self) -> None:
+        """
+        Blocks until all submitted entries are written.
+        """
+        self._queue.join()
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batches: Dict[Engine, List[Dict[str, Any]]] = {item[0]: list(item[1])}
+            taken = 1
+            stop = False
+            # collect whatever else is already queued into the same batch
+            while sum(len(rows) for rows in batches.values()) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is None:
+                    stop = True
+                    break
+                batches.setdefault(item[0], []).extend(item[1])
+            for engine, rows in batches.items():
+                try:
+                    with engine.begin() as connection:
+                        connection.execute(insert(HistoryModel.__table__), rows)
+                except Exception as e:
+                    logging.error(f"Writing {len(rows)} history entries failed: {e}")
+            for _ in range(taken):
+                self._queue.task_done()
+            if stop:
+                return
+
+
+_background_writer: Optional[BackgroundHistoryWriter] = None
+
+
+def enable_background_writer(batch_size: int = 500) -> BackgroundHistoryWriter:
+    """
+    Switches to the background mode: committed history entries are written by a writer thread.
+    """
+    global _background_writer
+    if _background_writer is None:
+        _background_writer = BackgroundHistoryWriter(batch_size=batch_size)
+        atexit.register(disable_background_writer)
+    return _background_writer
+
+
+def disable_background_writer() -> None:
+    """
+    Writes the pending entries, stops the writer thread and switches back to writing on commit.
+    """
+    global _background_writer
+    writer, _background_writer = _background_writer, None
+    if writer is not None:
+        writer.stop()
+
+
+def flush_background_writer() -> None:
+    """
+    Blocks until the background writer has written all committed entries (no-op otherwise).
+    """
+    if _background_writer is not None:
+        _background_writer.flush()
+
+
+@event.listens_for(Session, "before_commit")
+def _write_buffered_history(session: Session) -> None:
+    rows = session.info.pop(HISTORY_BUFFER_KEY, None)
+    if not rows:
+        return
+    # a unit of work commits later, its entries are written within its transaction
+    if _background_writer is not None and UNIT_OF_WORK_KEY not in session.info:
+        session.info[_COMMITTED_KEY] = (session.get_bind(), rows)
+    else:
+        session.execute(insert(HistoryModel), rows)
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_committed_history(session: Session) -> None:
+    committed = session.info.pop(_COMMITTED_KEY, None)
+    if committed is not None and _background_writer is not None:
+        _background_writer.submit(*committed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_buffered_history(session: Session) -> None:
+    session.info.pop(HISTORY_BUFFER_KEY, None)
+    session.info.pop(_COMMITTED_KEY, None)
@@ -0,0 +1,308 @@
+"""
+Persisted RFP x freelancer matching scores.
+
+refresh_matching_scores() scores the live RFPs against the freelancers in one
+batch (SkillMatchEngine.match_matrix, one similarity matrix for all pairs) and
+writes the results to matching_scores. Every row keeps content hashes of its
+inputs: the RFP requirements and max hourly rate, the freelancer's tech skills
+and desired rate. A refresh only recomputes the pairs whose RFP or freelancer
+hash changed (or that have no row yet), so repeated refreshes are cheap.
+
+Requirements and tech skills are compared by their canonical skill IDs first
+(skill_aliases.py), fuzzily only as fallback.
+
+Only pairs sharing a skill term in the inverted skill index (skill_index.py) are
+fuzzy-scored; the others are stored with a skill score of 0.
+
+The total score weights the skill score with 70% and the price score with 30%,
+like the matcher page did.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from offermee.database.models.main_models import (
+    FreelancerModel,
+    RFPModel,
+    RFPStatus,
+    SkillModel,
+    tech_skills_table,
+)
+from offermee.database.models.matching_score_model import MatchingScoreModel
+from offermee.database.skill_aliases import compiled_aliases
+from offermee.database.skill_index import candidate_pairs
+from offermee.matcher.price_matcher import PriceMatcher
+from offermee.matcher.skill_match_engine import MatchResult, SkillMatchEngine
+
+SKILL_WEIGHT = 0.7
+PRICE_WEIGHT = 0.3
+
+# scores only the skill pairs sharing an index term, like candidate_pairs() the
+# RFP x freelancer pairs
+matching_engine = SkillMatchEngine(prune=True)
+
+
+@dataclass
+class RFPInput:
+    id: int
+    must_have_requirements: List[str]
+    nice_to_have_requirements: List[str]
+    max_hourly_rate: Optional[float]
+    must_have_skill_ids: List[Optional[int]] = field(default_factory=list)
+    nice_to_have_skill_ids: List[Optional[int]] = field(default_factory=list)
+
+    @property
+    def content_hash(self) -> str:
+        return content_hash(
+            self.must_have_requirements,
+            self.nice_to_have_requirements,
+            self.max_hourly_rate,
+            self.must_have_skill_ids,
+            self.nice_to_have_skill_ids,
+        )
+
+
+@dataclass
+class FreelancerInput:
+    id: int
+    capabilities_id: Optional[int]
+    tech_skills: List[str]
+    desired_rate_min: Optional[float]
+    # canonical skill IDs of the tech skills, None where unknown
+    skill_ids: List[Optional[int]] = field(default_factory=list)
+
+    @property
+    def content_hash(self) -> str:
+        return content_hash(
+            sorted(self.tech_skills),
+            self.desired_rate_min,
+            sorted({skill_id for skill_id in self.skill_ids if skill_id is not None}),
+        )
+
+
+@dataclass
+class RefreshResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    pruned: int = 0  # stale pairs without a shared skill term, not fuzzy-scored
+
+
+def content_hash(*values: Any) -> str:
+    """
+    SHA-256 of the JSON form of the values, the fingerprint of scoring inputs.
+    """
+    payload = json.dumps(values, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def price_score(
+    max_hourly_rate: Optional[float], desired_rate_min: Optional[float]
+) -> float:
+    if not max_hourly_rate:
+        return 0
+    if not desired_rate_min:
+        return 1  # freelancer would accept any rate
+    return PriceMatcher.match_rate(max_hourly_rate, desired_rate_min)
+
+
+def load_rfp_inputs(
+    session: Session, rfp_ids: Optional[Iterable[int]] = None
+) -> List[RFPInput]:
+    """
+    The scoring inputs of the given (default: all new) RFPs, soft-deleted ones are
+    skipped.
+    """
+    stmt = select(
+        RFPModel.id,
+        RFPModel.must_have_requirements,
+        RFPModel.nice_to_have_requirements,
+        RFPModel.max_hourly_rate,
+        RFPModel.must_have_skill_ids,
+        RFPModel.nice_to_have_skill_ids,
+    ).order_by(RFPModel.id)
+    if rfp_ids is None:
+        stmt = stmt.where(RFPModel.status == RFPStatus.NEW)
+    else:
+        stmt = stmt.where(RFPModel.id.in_(list(rfp_ids)))
+    return [
+        RFPInput(
+            id=row.id,
+            must_have_requirements=row.must_have_requirements or [],
+            nice_to_have_requirements=row.nice_to_have_requirements or [],
+            max_hourly_rate=row.max_hourly_rate,
+            must_have_skill_ids=row.must_have_skill_ids or [],
+            nice_to_have_skill_ids=row.nice_to_have_skill_ids or [],
+        )
+        for row in session.execute(stmt)
+    ]
+
+
+def load_freelancer_inputs(
+    session: Session, freelancer_ids: Optional[Iterable[int]] = None
+) -> List[FreelancerInput]:
+    """
+    The scoring inputs of the given (default: all) freelancers, tech skills in one
+    query, resolved to their canonical skill IDs.
+    """
+    aliases = compiled_aliases(session)
+    stmt = select(
+        FreelancerModel.id,
+        FreelancerModel.capabilities_id,
+        FreelancerModel.desired_rate_min,
+    ).order_by(FreelancerModel.id)
+    if freelancer_ids is not None:
+        stmt = stmt.where(FreelancerModel.id.in_(list(freelancer_ids)))
+    freelancers = session.execute(stmt).all()
+    capabilities_ids = {row.capabilities_id for row in freelancers}
+    skills: Dict[int, List[str]] = {}
+    if capabilities_ids - {None}:
+        skill_rows = session.execute(
+            select(tech_skills_table.c.capabilities_id, SkillModel.name)
+            .join(SkillModel, SkillModel.id == tech_skills_table.c.skill_id)
+            .where(tech_skills_table.c.capabilities_id.in_(capabilities_ids - {None}))
+        )
+        for capabilities_id, name in skill_rows:
+            skills.setdefault(capabilities_id, []).append(name)
+    return [
+        FreelancerInput(
+            id=row.id,
+            capabilities_id=row.capabilities_id,
+            tech_skills=skills.get(row.capabilities_id, []),
+            desired_rate_min=row.desired_rate_min,
+            skill_ids=aliases.skill_ids(skills.get(row.capabilities_id, [])),
+        )
+        for row in freelancers
+    ]
+
+
+def _existing_scores(
+    session: Session, rfp_ids: Sequence[int], freelancer_ids: Sequence[int]
+) -> Dict[Tuple[int, int], Any]:
+    rows: Dict[Tuple[int, int], Any] = {}
+    chunk_size = 500
+    for start in range(0, len(rfp_ids), chunk_size):
+        stmt = select(
+            MatchingScoreModel.id,
+            MatchingScoreModel.rfp_id,
+            MatchingScoreModel.freelancer_id,
+            MatchingScoreModel.rfp_hash,
+            MatchingScoreModel.freelancer_hash,
+        ).where(
+            MatchingScoreModel.rfp_id.in_(rfp_ids[start : start + chunk_size]),
+            MatchingScoreModel.freelancer_id.in_(freelancer_ids),
+        )
+        for row in session.execute(stmt):
+            rows[(row.rfp_id, row.freelancer_id)] = row
+    return rows
+
+
+def refresh_matching_scores(
+    session: Session,
+    rfp_ids: Optional[Iterable[int]] = None,
+    freelancer_ids: Optional[Iterable[int]] = None,
+    force: bool = False,
+    engine: SkillMatchEngine = matching_engine,
+) -> RefreshResult:
+    """
+    Scores the given (default: all new) RFPs against the given (default: all)
+    freelancers and upserts the changed pairs into matching_scores (all pairs if
+    force). The caller commits.
+    """
+    rfps = load_rfp_inputs(session, rfp_ids)
+    freelancers = load_freelancer_inputs(session, freelancer_ids)
+    result = RefreshResult()
+    if not rfps or not freelancers:
+        return result
+    rfp_hashes = {rfp.id: rfp.content_hash for rfp in rfps}
+    freelancer_hashes = {f.id: f.content_hash for f in freelancers}
+    existing = _existing_scores(session, list(rfp_hashes), list(freelancer_hashes))
+
+    stale: Set[Tuple[int, int]] = set()
+    for rfp in rfps:
+        for freelancer in freelancers:
+            row = existing.get((rfp.id, freelancer.id))
+            if (
+                force
+                or row is None
+                or row.rfp_hash != rfp_hashes[rfp.id]
+                or row.freelancer_hash != freelancer_hashes[freelancer.id]
+            ):
+                stale.add((rfp.id, freelancer.id))
+    result.unchanged = len(rfps) * len(freelancers) - len(stale)
+    if not stale:
+        return result
+
+    # only the stale pairs sharing a skill term (skill_index) are fuzzy-scored,
+    # in one batch over their RFPs and freelancers
+    terms_shared = candidate_pairs(
+        session,
+        {rfp_id for rfp_id, _ in stale},
+        {f.capabilities_id for f in freelancers if f.capabilities_id is not None},
+    )
+    candidates = {
+        (rfp.id, f.id)
+        for rfp in rfps
+        for f in freelancers
+        if (rfp.id, f.id) in stale and (rfp.id, f.capabilities_id) in terms_shared
+    }
+    scored_rfps = [
+        rfp for rfp in rfps if any((rfp.id, f.id) in candidates for f in freelancers)
+    ]
+    scored_freelancers = [
+        f for f in freelancers if any((rfp.id, f.id) in candidates for rfp in rfps)
+    ]
+    matches: Dict[Tuple[int, int], MatchResult] = {}
+    if candidates:
+        matrix = engine.match_matrix(
+            scored_rfps,
+            [freelancer.tech_skills for freelancer in scored_freelancers],
+            [freelancer.skill_ids for freelancer in scored_freelancers],
+        )
+        for rfp, row_matches in zip(scored_rfps, matrix):
+            for freelancer, match in zip(scored_freelancers, row_matches):
+                matches[(rfp.id, freelancer.id)] = match
+
+    now = datetime.utcnow()
+    inserts: List[Dict[str, Any]] = []
+    updates: List[Dict[str, Any]] = []
+    for rfp in rfps:
+        for freelancer in freelancers:
+            pair = (rfp.id, freelancer.id)
+            if pair not in stale:
+                continue
+            if pair in candidates:
+                skill_score, details = matches[pair]
+            else:
+                skill_score, details = engine.no_match(rfp)
+            price = price_score(rfp.max_hourly_rate, freelancer.desired_rate_min)
+            values = {
+                "matching_score": skill_score * SKILL_WEIGHT + price * PRICE_WEIGHT,
+                "skill_score": skill_score,
+                "price_score": price,
+                "match_details": details,
+                "rfp_hash": rfp_hashes[rfp.id],
+                "freelancer_hash": freelancer_hashes[freelancer.id],
+                "matched_at": now,
+            }
+            row = existing.get(pair)
+            if row is None:
+                inserts.append(
+                    {"rfp_id": rfp.id, "freelancer_id": freelancer.id, **values}
+                )
+            else:
+                updates.append({"id": row.id, **values})
+    if inserts:
+        session.execute(insert(MatchingScoreModel), inserts)
+    if updates:
+        # ORM bulk UPDATE by primary key (executemany)
+        session.execute(update(MatchingScoreModel), updates)
+    result.created, result.updated = len(inserts), len(updates)
+    result.pruned = len(stale) - len(candidates)
+    return result
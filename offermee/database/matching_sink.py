@@ -0,0 +1,169 @@
+"""
+Matching on RFP ingestion.
+
+New RFPs (stored by the scrapers, the email import or the dashboard) are
+collected on the session after every flush. Once their transaction is committed,
+their IDs are handed to a worker thread, which scores them against all
+freelancers (refresh_matching_scores) in its own transaction and stores the
+results in matching_scores. Freelancers see the ranked matches right away and
+the matcher page only reads them, however long the backlog grows.
+
+The worker is enabled with enable_matching_worker() (the scrapers do so);
+without it nothing is scored on ingestion and the matcher page refreshes the
+scores when it is opened.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.orm import Session
+
+from offermee.database.database_manager import UNIT_OF_WORK_KEY
+from offermee.database.matching import refresh_matching_scores
+from offermee.database.models.main_models import RFPModel
+
+_NEW_RFPS_KEY = "matching_new_rfps"
+
+
+class MatchingWorker:
+    """
+    Worker thread scoring newly committed RFPs in batches.
+    """
+
+    def __init__(self, batch_size: int = 100):
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[Optional[Tuple[Engine, List[int]]]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="matching-worker", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, engine: Engine, rfp_ids: List[int]) -> None:
+        self._queue.put((engine, rfp_ids))
+
+    def flush(self) -> None:
+        """
+        Blocks until all submitted RFPs are scored.
+        """
+        self._queue.join()
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _score(self, engine: Engine, rfp_ids: List[int]) -> None:
+        try:
+            with Session(bind=engine) as session:
+                result = refresh_matching_scores(session, rfp_ids=rfp_ids)
+                session.commit()
+            logging.info(
+                f"Scored {len(rfp_ids)} new RFPs: {result.created} matching scores "
+                f"created, {result.updated} updated"
+            )
+        except Exception as e:
+            logging.error(f"Scoring the new RFPs {rfp_ids} failed: {e}")
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batches: Dict[Engine, List[int]] = {item[0]: list(item[1])}
+            taken = 1
+            stop = False
+            # collect whatever else is already queued into the same batch
+            while sum(len(ids) for ids in batches.values()) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is None:
+                    stop = True
+                    break
+                batches.setdefault(item[0], []).extend(item[1])
+            for engine, rfp_ids in batches.items():
+                self._score(engine, sorted(set(rfp_ids)))
+            for _ in range(taken):
+                self._queue.task_done()
+            if stop:
+                return
+
+
+_matching_worker: Optional[MatchingWorker] = None
+
+
+def enable_matching_worker(batch_size: int = 100) -> MatchingWorker:
+    """
+    Scores every newly committed RFP against all freelancers in a worker thread.
+    """
+    global _matching_worker
+    if _matching_worker is None:
+        _matching_worker = MatchingWorker(batch_size=batch_size)
+        atexit.register(disable_matching_worker)
+    return _matching_worker
+
+
+def disable_matching_worker() -> None:
+    """
+    Scores the pending RFPs, stops the worker thread and switches scoring on
+    ingestion off.
+    """
+    global _matching_worker
+    worker, _matching_worker = _matching_worker, None
+    if worker is not None:
+        worker.stop()
+
+
+def flush_matching_worker() -> None:
+    """
+    Blocks until the worker has scored all committed RFPs (no-op otherwise).
+    """
+    if _matching_worker is not None:
+        _matching_worker.flush()
+
+
+def _submit(engine: Engine, rfp_ids: Set[int]) -> None:
+    if _matching_worker is not None:
+        _matching_worker.submit(engine, sorted(rfp_ids))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_rfps(session: Session, flush_context) -> None:
+    if _matching_worker is None:
+        return
+    rfp_ids = {
+        instance.id for instance in session.new if isinstance(instance, RFPModel)
+    }
+    if rfp_ids:
+        session.info.setdefault(_NEW_RFPS_KEY, set()).update(rfp_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_new_rfps(session: Session) -> None:
+    rfp_ids = session.info.pop(_NEW_RFPS_KEY, None)
+    if not rfp_ids:
+        return
+    connection = session.info.get(UNIT_OF_WORK_KEY)
+    if connection is not None and connection.in_transaction():
+        # a unit of work commits its connection after the session, the worker must
+        # not read before that
+        event.listen(
+            connection,
+            "commit",
+            lambda conn: _submit(conn.engine, rfp_ids),
+            once=True,
+        )
+        return
+    bind = session.get_bind()
+    _submit(bind.engine if isinstance(bind, Connection) else bind, rfp_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_new_rfps(session: Session) -> None:
+    session.info.pop(_NEW_RFPS_KEY, None)
@@ -0,0 +1,381 @@
+"""
+Versioned schema migrations for existing databases.
+
+Base.metadata.create_all() only creates missing tables; new indexes and columns
+on tables that already exist never reach an existing database file. Every
+schema change to an existing table is therefore registered here as a numbered
+migration. The applied versions are recorded in the schema_migrations table,
+so each migration runs exactly once per database.
+
+The operations (MigrationOps) take their definitions from the same Base
+metadata the models declare and are idempotent, because a database created by
+create_all() already has the final schema.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    insert,
+    inspect,
+    literal,
+    select,
+)
+from sqlalchemy.schema import CreateColumn, CreateTable
+from sqlalchemy.sql import column as sql_column
+from sqlalchemy.sql import table as sql_table
+
+from offermee.database.search_index import SEARCH_INDEXES, create_search_index
+
+_migration_metadata = MetaData()
+
+# indexes an earlier migration creates and a later one drops, no longer declared on
+# the models: (table, index) -> columns
+RETIRED_INDEXES: Dict[Tuple[str, str], List[str]] = {
+    ("rfps", "idx_rfp_status"): ["status"],  # replaced by idx_rfp_status_live (5)
+}
+
+schema_migrations = Table(
+    "schema_migrations",
+    _migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class MigrationOps:
+    """
+    Schema operations available to a migration, bound to one connection.
+    Column and index definitions are looked up in the model metadata.
+    """
+
+    def __init__(self, connection: Connection, metadata: MetaData):
+        self.connection = connection
+        self.metadata = metadata
+        self.is_sqlite = connection.dialect.name == "sqlite"
+
+    def _quote(self, name: str) -> str:
+        return self.connection.dialect.identifier_preparer.quote(name)
+
+    def _inspector(self):
+        # a fresh inspector per call, earlier operations may have changed the schema
+        return inspect(self.connection)
+
+    def create_index(self, table_name: str, index_name: str) -> bool:
+        """
+        Creates the index declared on the table if it does not exist yet.
+        On SQLite (WAL) readers are not blocked while the index is built; writers wait
+        for the short migration transaction.
+        Returns True if the index was created.
+        """
+        table = self.metadata.tables[table_name]
+        index = next((idx for idx in table.indexes if idx.name == index_name), None)
+        retired = RETIRED_INDEXES.get((table_name, index_name))
+        if index is None and retired is None:
+            raise ValueError(f"Index {index_name} is not declared on {table_name}")
+        existing = {idx["name"] for idx in self._inspector().get_indexes(table_name)}
+        if index_name in existing:
+            return False
+        if index is not None:
+            index.create(self.connection)
+        else:
+            columns = ", ".join(self._quote(column) for column in retired)
+            self.connection.exec_driver_sql(
+                f"CREATE INDEX {self._quote(index_name)} "
+                f"ON {self._quote(table_name)} ({columns})"
+            )
+        logging.info(f"Created index {index_name} on {table_name}")
+        return True
+
+    def drop_index(self, table_name: str, index_name: str) -> bool:
+        """
+        Drops an index that is no longer declared, if it exists.
+        Returns True if the index was dropped.
+        """
+        existing = {idx["name"] for idx in self._inspector().get_indexes(table_name)}
+        if index_name not in existing:
+            return False
+        self.connection.exec_driver_sql(f"DROP INDEX {self._quote(index_name)}")
+        logging.info(f"Dropped index {index_name} on {table_name}")
+        return True
+
+    def create_table(self, table_name: str) -> bool:
+        """
+        Creates the declared table with its indexes if it does not exist yet, for
+        tables added to an existing database without create_all().
+        Returns True if the table was created.
+        """
+        if table_name in self._inspector().get_table_names():
+            return False
+        self.metadata.tables[table_name].create(self.connection)
+        logging.info(f"Created table {table_name}")
+        return True
+
+    def add_column(self, table_name: str, column_name: str) -> bool:
+        """
+        Adds the column declared on the table if it does not exist yet.
+        Columns SQLite cannot add with ALTER TABLE (NOT NULL without server default,
+        primary key, unique) are added by rebuilding the table, existing rows get the
+        Python default of a NOT NULL column (see rebuild_table).
+        Returns True if the column was added.
+        """
+        table = self.metadata.tables[table_name]
+        column = table.c[column_name]
+        existing = {col["name"] for col in self._inspector().get_columns(table_name)}
+        if column_name in existing:
+            return False
+        needs_rebuild = (
+            (not column.nullable and column.server_default is None)
+            or column.primary_key
+            or column.unique
+        )
+        if self.is_sqlite and needs_rebuild:
+            self.rebuild_table(table_name)
+        else:
+            column_ddl = CreateColumn(column).compile(dialect=self.connection.dialect)
+            self.connection.exec_driver_sql(
+                f"ALTER TABLE {self._quote(table_name)} ADD COLUMN {column_ddl}"
+            )
+        logging.info(f"Added column {column_name} to {table_name}")
+        return True
+
+    @staticmethod
+    def _fill_value(column: Column) -> Any:
+        """
+        The value of a new NOT NULL column (without server default) in the existing
+        rows: its declared scalar or callable Python default.
+        """
+        default = column.default
+        if default is None or not (default.is_scalar or default.is_callable):
+            raise ValueError(
+                f"Cannot add the NOT NULL column {column.table.name}.{column.name} to "
+                "existing rows: it has neither a server default nor a Python default"
+            )
+        return default.arg if default.is_scalar else default.arg(None)
+
+    def rebuild_table(self, table_name: str) -> None:
+        """
+        Batch rebuild of a table to its declared definition, the SQLite way to change
+        column types, constraints or nullability: create the new table, copy the common
+        columns, drop the old table, rename the new one and recreate its indexes.
+        New NOT NULL columns are filled with their server default or, without one, with
+        their Python default; a ValueError is raised if they have neither.
+        Requires PRAGMA foreign_keys=OFF (the SQLite default, not changed by the engine profile).
+        """
+        table = self.metadata.tables[table_name]
+        existing = {col["name"] for col in self._inspector().get_columns(table_name)}
+        copied = [col.name for col in table.columns if col.name in existing]
+        filled = {
+            col.name: self._fill_value(col)
+            for col in table.columns
+            if col.name not in existing
+            and not col.nullable
+            and not col.primary_key
+            and col.server_default is None
+        }
+        tmp_name = f"_migrate_{table_name}"
+        quoted_table, quoted_tmp = self._quote(table_name), self._quote(tmp_name)
+        table_ddl = str(CreateTable(table).compile(dialect=self.connection.dialect))
+        # only the table name of the CREATE TABLE clause, references stay untouched
+        table_ddl = table_ddl.replace(
+            f"CREATE TABLE {quoted_table}", f"CREATE TABLE {quoted_tmp}", 1
+        )
+        self.connection.exec_driver_sql(f"DROP TABLE IF EXISTS {quoted_tmp}")
+        self.connection.exec_driver_sql(table_ddl)
+        source = sql_table(table_name, *(sql_column(name) for name in copied))
+        target = sql_table(tmp_name, *(sql_column(name) for name in [*copied, *filled]))
+        self.connection.execute(
+            insert(target).from_select(
+                [*copied, *filled],
+                select(
+                    *(source.c[name] for name in copied),
+                    *(
+                        literal(value, type_=table.c[name].type)
+                        for name, value in filled.items()
+                    ),
+                ),
+            )
+        )
+        self.connection.exec_driver_sql(f"DROP TABLE {quoted_table}")
+        self.connection.exec_driver_sql(
+            f"ALTER TABLE {quoted_tmp} RENAME TO {quoted_table}"
+        )
+        for index in table.indexes:
+            index.create(self.connection)
+        # e.g. the full-text index triggers, dropped with the old table
+        table.dispatch.after_create(table, self.connection)
+        logging.info(f"Rebuilt table {table_name}")
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[MigrationOps], None]
+
+
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, description: str):
+    """
+    Registers the decorated function as migration with the given version.
+    Versions must be unique and increasing.
+    """
+
+    def register(upgrade: Callable[[MigrationOps], None]):
+        if MIGRATIONS and version <= MIGRATIONS[-1].version:
+            raise ValueError(f"Migration version {version} is not increasing")
+        MIGRATIONS.append(Migration(version, description, upgrade))
+        return upgrade
+
+    return register
+
+
+def _begin(connection: Connection) -> None:
+    # pysqlite does not open a transaction before DDL statements; an explicit
+    # BEGIN IMMEDIATE makes each migration atomic and serializes concurrent starts
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _applied_versions(connection: Connection) -> Set[int]:
+    return set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+
+def _record(connection: Connection, entry: Migration) -> None:
+    connection.execute(
+        schema_migrations.insert().values(
+            version=entry.version,
+            description=entry.description,
+            applied_at=datetime.utcnow(),
+        )
+    )
+
+
+def upgrade_database(
+    engine: Engine, metadata: MetaData, create_tables: bool = True
+) -> List[int]:
+    """
+    Brings the database to the declared schema: creates missing tables (if create_tables)
+    and applies the pending migrations, each in its own transaction.
+    A database without any model table is created from the metadata and all migrations
+    are recorded as applied without running them.
+
+    Returns:
+        List[int]: The versions of the applied migrations.
+    """
+    with engine.connect() as connection:
+        existing_tables = set(inspect(connection).get_table_names())
+    fresh = not (existing_tables & set(metadata.tables))
+    if create_tables:
+        metadata.create_all(engine)
+    schema_migrations.create(engine, checkfirst=True)
+
+    with engine.connect() as connection:
+        done = _applied_versions(connection)
+    applied: List[int] = []
+    for entry in MIGRATIONS:
+        if entry.version in done:
+            continue
+        with engine.connect() as connection:
+            _begin(connection)
+            # checked inside the transaction, another process may have applied it meanwhile
+            if entry.version in _applied_versions(connection):
+                connection.rollback()
+                continue
+            if not (fresh and create_tables):
+                logging.info(f"Applying migration {entry.version}: {entry.description}")
+                entry.upgrade(MigrationOps(connection, metadata))
+                applied.append(entry.version)
+            _record(connection, entry)
+            connection.commit()
+    return applied
+
+
+@migration(1, "Indexes on the RFP, offer and history lookup columns")
+def _lookup_indexes(op: MigrationOps) -> None:
+    for table_name, index_name in [
+        ("rfps", "idx_rfp_original_link"),
+        ("rfps", "idx_rfp_contact_email_title"),
+        ("rfps", "idx_rfp_provider_title"),
+        ("rfps", "idx_rfp_status"),
+        ("offers", "idx_offer_status"),
+        ("histories", "idx_history_related"),
+    ]:
+        op.create_index(table_name, index_name)
+
+
+@migration(2, "Compact change diff on history entries")
+def _history_changes(op: MigrationOps) -> None:
+    op.add_column("histories", "changes")
+
+
+@migration(3, "Full-text indexes on RFPs, projects and CVs")
+def _search_indexes(op: MigrationOps) -> None:
+    for table_name in SEARCH_INDEXES:
+        create_search_index(op.connection, table_name)
+
+
+@migration(4, "Blob store reference on documents")
+def _document_blob_hash(op: MigrationOps) -> None:
+    op.add_column("documents", "document_blob_hash")
+
+
+@migration(5, "Soft delete and archive table for RFPs")
+def _rfp_soft_delete(op: MigrationOps) -> None:
+    op.add_column("rfps", "created_at")
+    op.add_column("rfps", "deleted_at")
+    # existing RFPs count as created with their first history entry
+    op.connection.exec_driver_sql(
+        "UPDATE rfps SET created_at = COALESCE("
+        "(SELECT MIN(event_date) FROM histories"
+        " WHERE related_type = 'RFP' AND related_id = rfps.id), CURRENT_TIMESTAMP)"
+        " WHERE created_at IS NULL"
+    )
+    op.drop_index("rfps", "idx_rfp_status")
+    op.create_index("rfps", "idx_rfp_status_live")
+    op.create_table("rfps_archive")
+
+
+@migration(6, "RFP scores and content hashes on matching scores")
+def _rfp_matching_scores(op: MigrationOps) -> None:
+    # project_id becomes nullable and the unique key moves to (rfp_id, freelancer_id)
+    if not op.create_table("matching_scores"):
+        op.rebuild_table("matching_scores")
+        # the former project-keyed scores have no RFP and can never be matched or
+        # updated again; the scores of the RFPs are recomputed on the next refresh
+        op.connection.exec_driver_sql(
+            "DELETE FROM matching_scores WHERE rfp_id IS NULL"
+        )
+
+
+@migration(7, "Inverted skill index of RFPs and capabilities")
+def _skill_index(op: MigrationOps) -> None:
+    # filled by migration 8, the index terms include the skill IDs added there
+    op.create_table("skill_index")
+
+
+@migration(8, "Skill aliases and canonical skill IDs of RFP requirements")
+def _skill_aliases(op: MigrationOps) -> None:
+    # imported here: skill_aliases needs the models, which need the DatabaseManager
+    from offermee.database.skill_aliases import assign_rfp_skill_ids
+    from offermee.database.skill_index import rebuild_skill_index
+
+    op.create_table("skill_aliases")
+    for table_name in ("rfps", "rfps_archive"):
+        op.add_column(table_name, "must_have_skill_ids")
+        op.add_column(table_name, "nice_to_have_skill_ids")
+    assign_rfp_skill_ids(op.connection)
+    rebuild_skill_index(op.connection)  # with the "#<id>" terms
@@ -19,6 +19,7 @@ from .main_models import (
     ProjectModel,
     RFPModel,
     SchemaModel,
+    SkillAliasModel,
     SkillModel,
     WorkPackageModel,
 )
@@ -14,11 +14,14 @@ from sqlalchemy import (
     Table,
     UniqueConstraint,
     Index,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import deferred, relationship
 from enum import Enum as PyEnum
 from datetime import datetime
 from offermee.database.database_manager import DatabaseManager
+from offermee.database.models.model_registry import SerializerMixin
 from offermee.utils.international import _T
 
 # Annahme: _T ist definiert, z.B.:
@@ -26,6 +29,27 @@ from offermee.utils.international import _T
 
 Base = DatabaseManager.Base
 
+# Large Text / JSON columns are deferred in this group: list views do not load them,
+# full-row reads in the services undefer the group explicitly.
+HEAVY_COLUMNS_GROUP = "payload"
+
+# JSON columns are stored as JSONB on PostgreSQL (indexable, comparable)
+JSONB_VARIANT = JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+# condition of the partial indexes over the live (not soft deleted) rows
+LIVE_ROWS = text("deleted_at IS NULL")
+
+
+class SoftDeleteMixin:
+    """
+    Soft delete: deleted rows keep a deleted_at timestamp and are hidden from all ORM
+    queries (see soft_delete.py), unless executed with include_deleted=True.
+    """
+
+    deleted_at = Column(
+        DateTime, nullable=True, info={"label": _T("Deleted At"), "read_only": True}
+    )
+
 
 class LocationType(PyEnum):
     Remote = "Remote"
@@ -219,7 +243,7 @@ class RFPStatus(PyEnum):
 
 
 # Main Models
-class AddressModel(Base):
+class AddressModel(SerializerMixin, Base):
     __tablename__ = "addresses"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     street = Column(String, nullable=False, info={"label": _T("Street")})
@@ -244,13 +268,8 @@ class AddressModel(Base):
         ),
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
 
-
-class ContactModel(Base):
+class ContactModel(SerializerMixin, Base):
     __tablename__ = "contacts"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     first_name = Column(String, nullable=False, info={"label": _T("First Name")})
@@ -289,20 +308,18 @@ class ContactModel(Base):
     )
     __table_args__ = (Index("idx_contact_name", "first_name", "last_name"),)
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
-
 
-class SchemaModel(Base):
+class SchemaModel(SerializerMixin, Base):
     __tablename__ = "schemas"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     name = Column(String, nullable=False, info={"label": _T("Name")})
     description = Column(Text, nullable=True, info={"label": _T("Description")})
     # must be unique and shall never be overwritten, because data depends on it
     schema_definition = Column(
-        JSON, nullable=False, unique=True, info={"label": _T("Schema Definition")}
+        JSONB_VARIANT,
+        nullable=False,
+        unique=True,
+        info={"label": _T("Schema Definition")},
     )
     created_at = Column(
         DateTime,
@@ -316,13 +333,8 @@ class SchemaModel(Base):
         info={"label": _T("Updated At"), "read_only": True},
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
-
 
-class DocumentModel(Base):
+class DocumentModel(SerializerMixin, Base):
     __tablename__ = "documents"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     related_type = Column(
@@ -331,11 +343,23 @@ class DocumentModel(Base):
     related_id = Column(Integer, nullable=False, info={"label": _T("Related ID")})
     document_name = Column(String, nullable=False, info={"label": _T("Document Name")})
     document_link = Column(String, nullable=False, info={"label": _T("Document Link")})
-    document_raw_text = Column(
-        Text, nullable=True, info={"label": _T("Document Raw Text")}
+    document_raw_text = deferred(
+        Column(Text, nullable=True, info={"label": _T("Document Raw Text")}),
+        group=HEAVY_COLUMNS_GROUP,
     )
-    document_structured_text = Column(
-        JSON, nullable=True, info={"label": _T("Document Structured Text")}
+    # long raw texts are kept in the blob store, see document_store
+    document_blob_hash = Column(
+        String(64),
+        nullable=True,
+        info={"label": _T("Document Blob Hash"), "read_only": True},
+    )
+    document_structured_text = deferred(
+        Column(
+            JSONB_VARIANT,
+            nullable=True,
+            info={"label": _T("Document Structured Text")},
+        ),
+        group=HEAVY_COLUMNS_GROUP,
     )
     document_schema_reference_id = Column(
         Integer,
@@ -361,13 +385,8 @@ class DocumentModel(Base):
         ),
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
-
 
-class HistoryModel(Base):
+class HistoryModel(SerializerMixin, Base):
     __tablename__ = "histories"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     related_type = Column(
@@ -375,6 +394,8 @@ class HistoryModel(Base):
     )
     related_id = Column(Integer, nullable=False, info={"label": _T("Related ID")})
     description = Column(Text, info={"label": _T("Description")})
+    # compact diff of the changed fields: {"field": {"old": ..., "new": ...}}
+    changes = Column(JSONB_VARIANT, nullable=True, info={"label": _T("Changes")})
     event_date = Column(DateTime, nullable=False, info={"label": _T("Event Date")})
     created_by = Column(
         String, nullable=False, info={"label": _T("Created By"), "read_only": True}
@@ -385,13 +406,10 @@ class HistoryModel(Base):
         info={"label": _T("Created At"), "read_only": True},
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
+    __table_args__ = (Index("idx_history_related", "related_type", "related_id"),)
 
 
-class SkillModel(Base):
+class SkillModel(SerializerMixin, Base):
     __tablename__ = "skills"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     name = Column(String, nullable=False, unique=True, info={"label": _T("Name")})
@@ -410,10 +428,24 @@ class SkillModel(Base):
         info={"label": _T("Tech Skills"), "read_only": True, "hide": True},
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
+
+class SkillAliasModel(SerializerMixin, Base):
+    """
+    A further spelling of a skill, e.g. "c sharp" for "C#" (see skill_aliases.py).
+    """
+
+    __tablename__ = "skill_aliases"
+    id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
+    # the normalized form (normalize_skill)
+    alias = Column(String, nullable=False, unique=True, info={"label": _T("Alias")})
+    skill_id = Column(
+        Integer,
+        ForeignKey("skills.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        info={"label": _T("Skill ID")},
+    )
+
 
 
 soft_skills_table = Table(
@@ -456,7 +488,7 @@ tech_skills_table = Table(
 )
 
 
-class CapabilitiesModel(Base):
+class CapabilitiesModel(SerializerMixin, Base):
     __tablename__ = "capabilities"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     soft_skills = relationship(
@@ -496,13 +528,8 @@ class CapabilitiesModel(Base):
         info={"label": _T("Updated At"), "read_only": True},
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
 
-
-class FreelancerModel(Base):
+class FreelancerModel(SerializerMixin, Base):
     __tablename__ = "freelancers"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     name = Column(String, nullable=False, info={"label": _T("Name")})
@@ -555,13 +582,8 @@ class FreelancerModel(Base):
     )
     __table_args__ = (Index("idx_freelancer_name", "name"),)
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
-
 
-class CVModel(Base):
+class CVModel(SerializerMixin, Base):
     __tablename__ = "cvs"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     freelancer_id = Column(
@@ -574,11 +596,15 @@ class CVModel(Base):
         Integer, ForeignKey("applicants.id"), info={"label": _T("Applicant ID")}
     )
     name = Column(String, nullable=False, info={"label": _T("Name")})
-    cv_raw_text = Column(
-        Text, nullable=False, info={"label": _T("CV Raw Text")}
+    cv_raw_text = deferred(
+        Column(Text, nullable=False, info={"label": _T("CV Raw Text")}),
+        group=HEAVY_COLUMNS_GROUP,
     )  # Raw text extracted from the document
-    cv_structured_data = Column(
-        JSON, nullable=False, info={"label": _T("CV Structured Data")}
+    cv_structured_data = deferred(
+        Column(
+            JSONB_VARIANT, nullable=False, info={"label": _T("CV Structured Data")}
+        ),
+        group=HEAVY_COLUMNS_GROUP,
     )  # Structured representation of the document
     cv_schema_reference_id = Column(
         Integer,
@@ -609,13 +635,8 @@ class CVModel(Base):
     )
     freelancer = relationship("FreelancerModel", backref="cv")
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
-
 
-class EmployeeModel(Base):
+class EmployeeModel(SerializerMixin, Base):
     __tablename__ = "employees"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     name = Column(String, nullable=False, info={"label": _T("Name")})
@@ -652,13 +673,8 @@ class EmployeeModel(Base):
         viewonly=True,
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
 
-
-class ApplicantModel(Base):
+class ApplicantModel(SerializerMixin, Base):
     __tablename__ = "applicants"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     name = Column(String, nullable=False, info={"label": _T("Name")})
@@ -697,10 +713,6 @@ class ApplicantModel(Base):
         viewonly=True,
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
 
 
 # Assoziationstabellen für Many-to-Many Beziehungen
@@ -719,7 +731,7 @@ company_regions = Table(
 )
 
 
-class IndustryModel(Base):
+class IndustryModel(SerializerMixin, Base):
     __tablename__ = "industries"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     name = Column(String, nullable=False, unique=True, info={"label": _T("Industry")})
@@ -727,13 +739,8 @@ class IndustryModel(Base):
     def __repr__(self):
         return f"<Industry(name='{self.name}')>"
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
-
 
-class RegionModel(Base):
+class RegionModel(SerializerMixin, Base):
     __tablename__ = "regions"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     name = Column(String, nullable=False, unique=True, info={"label": _T("Region")})
@@ -741,13 +748,8 @@ class RegionModel(Base):
     def __repr__(self):
         return f"<Region(name='{self.name}')>"
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
 
-
-class CompanyModel(Base):
+class CompanyModel(SerializerMixin, Base):
     __tablename__ = "companies"
     id = Column(
         Integer,
@@ -789,13 +791,8 @@ class CompanyModel(Base):
         viewonly=True,
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
-
 
-class RFPModel(Base):
+class RFPModel(SerializerMixin, SoftDeleteMixin, Base):
     """
     This model represents the JSON schema "Request For Proposal" in a relational database.
     All fields from the schema are stored in a single table "rfps".
@@ -818,11 +815,14 @@ class RFPModel(Base):
         info={"label": _T("Project Title")},
     )
     # "description" (optional)
-    description = Column(
-        Text,
-        nullable=True,
-        comment="The project description (summarized, up to 20 lines)",
-        info={"label": _T("Description")},
+    description = deferred(
+        Column(
+            Text,
+            nullable=True,
+            comment="The project description (summarized, up to 20 lines)",
+            info={"label": _T("Description")},
+        ),
+        group=HEAVY_COLUMNS_GROUP,
     )
     # "location" (required, can be null in the schema)
     location = Column(
@@ -846,36 +846,48 @@ class RFPModel(Base):
         info={"label": _T("Region")},
     )
     # "must-have-requirements" (required, array not null -> default=list)
-    must_have_requirements = Column(
-        JSON,  # or JSONB if Postgres
-        nullable=False,
-        default=list,
-        comment="Mandatory requirements for the project",
-        info={"label": _T("Must-have Requirements")},
+    must_have_requirements = deferred(
+        Column(
+            JSONB_VARIANT,
+            nullable=False,
+            default=list,
+            comment="Mandatory requirements for the project",
+            info={"label": _T("Must-have Requirements")},
+        ),
+        group=HEAVY_COLUMNS_GROUP,
     )
     # "nice-to-have-requirements" (required, array not null -> default=list)
-    nice_to_have_requirements = Column(
-        JSON,
-        nullable=False,
-        default=list,
-        comment="Desirable additional requirements",
-        info={"label": _T("Nice-to-have Requirements")},
+    nice_to_have_requirements = deferred(
+        Column(
+            JSONB_VARIANT,
+            nullable=False,
+            default=list,
+            comment="Desirable additional requirements",
+            info={"label": _T("Nice-to-have Requirements")},
+        ),
+        group=HEAVY_COLUMNS_GROUP,
     )
     # "tasks" (required, array not null -> default=list)
-    tasks = Column(
-        JSON,
-        nullable=False,
-        default=list,
-        comment="List of tasks in the project",
-        info={"label": _T("Tasks")},
+    tasks = deferred(
+        Column(
+            JSONB_VARIANT,
+            nullable=False,
+            default=list,
+            comment="List of tasks in the project",
+            info={"label": _T("Tasks")},
+        ),
+        group=HEAVY_COLUMNS_GROUP,
     )
     # "responsibilities" (required, array not null -> default=list)
-    responsibilities = Column(
-        JSON,
-        nullable=False,
-        default=list,
-        comment="List of responsibilities in the project",
-        info={"label": _T("Responsibilities")},
+    responsibilities = deferred(
+        Column(
+            JSONB_VARIANT,
+            nullable=False,
+            default=list,
+            comment="List of responsibilities in the project",
+            info={"label": _T("Responsibilities")},
+        ),
+        group=HEAVY_COLUMNS_GROUP,
     )
     # "max-hourly-rate" (required, but can be null)
     max_hourly_rate = Column(
@@ -972,13 +984,86 @@ class RFPModel(Base):
         },
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
+    created_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        info={"label": _T("Created At"), "read_only": True},
+    )
+    # canonical skill IDs (SkillModel.id, None if unknown) of the requirements,
+    # position by position, assigned on every flush (see skill_aliases.py)
+    must_have_skill_ids = deferred(
+        Column(
+            JSONB_VARIANT,
+            nullable=True,
+            info={"label": _T("Must-have Skill IDs"), "read_only": True},
+        ),
+        group=HEAVY_COLUMNS_GROUP,
+    )
+    nice_to_have_skill_ids = deferred(
+        Column(
+            JSONB_VARIANT,
+            nullable=True,
+            info={"label": _T("Nice-to-have Skill IDs"), "read_only": True},
+        ),
+        group=HEAVY_COLUMNS_GROUP,
+    )
+
+    # lookups of get_source_rule_unique_rfp_record (including soft deleted RFPs)
+    # and the status filter over the live working set
+    __table_args__ = (
+        Index("idx_rfp_original_link", "original_link"),
+        Index("idx_rfp_contact_email_title", "contact_person_email", "title"),
+        Index("idx_rfp_provider_title", "provider", "title"),
+        Index(
+            "idx_rfp_status_live",
+            "status",
+            sqlite_where=LIVE_ROWS,
+            postgresql_where=LIVE_ROWS,
+        ),
+        # containment queries (@>) on the requirement arrays, see requirements_contain
+        Index(
+            "idx_rfp_must_have_requirements_gin",
+            "must_have_requirements",
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_rfp_nice_to_have_requirements_gin",
+            "nice_to_have_requirements",
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+# RFPs moved out of the working set by archive_rfps(): the RFP columns without
+# constraints, plus the archiving time
+rfps_archive = Table(
+    "rfps_archive",
+    Base.metadata,
+    *(
+        Column(col.name, col.type, primary_key=col.primary_key)
+        for col in RFPModel.__table__.columns
+    ),
+    Column("archived_at", DateTime, nullable=False),
+    # the lookups of get_source_rule_unique_rfp_record
+    Index("idx_rfp_archive_original_link", "original_link"),
+    Index("idx_rfp_archive_contact_email_title", "contact_person_email", "title"),
+    Index("idx_rfp_archive_provider_title", "provider", "title"),
+)
 
 
-class ProjectModel(Base):
+# inverted index of the skill terms (see skill_index.py): term -> RFPs (requirements)
+# and capabilities (tech skills)
+skill_index = Table(
+    "skill_index",
+    Base.metadata,
+    Column("term", String, primary_key=True),
+    Column("owner_type", String(16), primary_key=True),
+    Column("owner_id", Integer, primary_key=True),
+    Index("idx_skill_index_owner", "owner_type", "owner_id"),
+)
+
+
+class ProjectModel(SerializerMixin, Base):
     """A Project record has a life time cycle from the first written offer to the last accomplished work package. An early opt out is in every state possible."""
 
     __tablename__ = "projects"
@@ -1051,13 +1136,8 @@ class ProjectModel(Base):
         viewonly=True,
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
 
-
-class InterviewModel(Base):
+class InterviewModel(SerializerMixin, Base):
     __tablename__ = "interviews"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     project_id = Column(
@@ -1079,13 +1159,8 @@ class InterviewModel(Base):
     )
     project = relationship("ProjectModel", back_populates="interviews")
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
-
 
-class ContractModel(Base):
+class ContractModel(SerializerMixin, Base):
     __tablename__ = "contracts"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     project_id = Column(
@@ -1112,13 +1187,8 @@ class ContractModel(Base):
         viewonly=True,
     )
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
 
-
-class WorkPackageModel(Base):
+class WorkPackageModel(SerializerMixin, Base):
     __tablename__ = "workpackages"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     project_id = Column(
@@ -1143,13 +1213,8 @@ class WorkPackageModel(Base):
     )
     project = relationship("ProjectModel", back_populates="workpackages")
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
-
 
-class OfferModel(Base):
+class OfferModel(SerializerMixin, Base):
     __tablename__ = "offers"
     id = Column(Integer, primary_key=True, info={"label": _T("ID"), "read_only": True})
     project_id = Column(
@@ -1199,7 +1264,4 @@ class OfferModel(Base):
     )
     project = relationship("ProjectModel", back_populates="offers")
 
-    def to_dict(self):
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
+    __table_args__ = (Index("idx_offer_status", "status"),)
@@ -19,15 +19,26 @@ Base = DatabaseManager.Base
 
 
 class MatchingScoreModel(Base):
+    """
+    Persisted skill / price scores of an RFP (or project) for a freelancer, written by
+    MatchingService. rfp_hash and freelancer_hash are the content hashes of the
+    inputs the score was computed from; a pair is recomputed only if one changed.
+    """
+
     __tablename__ = "matching_scores"
 
     id = Column(Integer, primary_key=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=True)
+    rfp_id = Column(Integer, ForeignKey("rfps.id", ondelete="CASCADE"), nullable=True)
     # Neuer FK:
     freelancer_id = Column(Integer, ForeignKey("freelancers.id"), nullable=False)
 
     matching_score = Column(Float, nullable=False, default=0.0)
+    skill_score = Column(Float, nullable=False, default=0.0)
+    price_score = Column(Float, nullable=False, default=0.0)
     match_details = Column(JSON, nullable=True)
+    rfp_hash = Column(String(64), nullable=True)
+    freelancer_hash = Column(String(64), nullable=True)
     matched_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     project = relationship("ProjectModel", backref="matching_scores")
@@ -35,8 +46,8 @@ class MatchingScoreModel(Base):
     freelancer = relationship("FreelancerModel", backref="matching_scores")
 
     __table_args__ = (
-        UniqueConstraint(
-            "project_id", "freelancer_id", name="uq_project_freelancer_score"
-        ),
+        UniqueConstraint("rfp_id", "freelancer_id", name="uq_rfp_freelancer_score"),
         Index("idx_project_freelancer_score", "project_id", "freelancer_id"),
+        # the matcher page: best scores of one freelancer first
+        Index("idx_matching_freelancer_score", "freelancer_id", "matching_score"),
     )
@@ -0,0 +1,174 @@
+"""
+Per-model metadata registry.
+
+The mapper introspection the CRUD helpers need (column keys, relationships,
+primary keys, unique constraints, DateTime columns) and a compiled to_dict
+serializer are computed once per model when SQLAlchemy configures its mapper
+and are cached afterwards.
+"""
+
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, UniqueConstraint, event, inspect
+from sqlalchemy.orm import Mapper, configure_mappers
+
+
+@dataclass(frozen=True)
+class RelationshipInfo:
+    """
+    Descriptor of one relationship of a model.
+    """
+
+    name: str
+    uselist: bool
+    target: type
+    attribute: Any  # the instrumented class attribute, e.g. CVModel.freelancer
+
+
+@dataclass(frozen=True)
+class ModelMetadata:
+    """
+    Cached mapper information of one model.
+    """
+
+    model: type
+    column_keys: Tuple[str, ...]
+    relationships: Dict[str, RelationshipInfo]
+    primary_keys: Tuple[str, ...]
+    single_unique_keys: Tuple[str, ...]
+    multi_unique_constraints: Tuple[Dict[str, Any], ...]
+    datetime_columns: FrozenSet[str]
+    column_names: Tuple[str, ...]  # table column names, the keys of to_dict
+    column_attributes: Dict[str, Any]  # table column name -> mapped class attribute
+    column_key_set: FrozenSet[str] = field(init=False)
+    _getter: Callable[[Any], Tuple[Any, ...]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "column_key_set", frozenset(self.column_keys))
+        names = self.column_names
+        if len(names) == 1:
+            getter = lambda instance: (getattr(instance, names[0]),)  # noqa: E731
+        else:
+            getter = attrgetter(*names)
+        object.__setattr__(self, "_getter", getter)
+
+    def to_dict(self, instance: Any) -> Dict[str, Any]:
+        """
+        Serializes the column values of a model instance.
+        """
+        return dict(zip(self.column_names, self._getter(instance)))
+
+    def projection(self, columns: Optional[Sequence[str]] = None) -> "Projection":
+        """
+        The table columns to select for the given column names (all columns if None),
+        to read plain rows without ORM hydration. The primary key is always included.
+        The columns are the mapped attributes, so ORM query criteria (e.g. the soft
+        delete filter) apply. Raises a ValueError on unknown column names.
+        """
+        if columns is None:
+            names = self.column_names
+        else:
+            unknown = [name for name in columns if name not in self.column_names]
+            if unknown:
+                raise ValueError(f"Unknown columns for {self.model.__name__}: {unknown}")
+            names = tuple(dict.fromkeys([*self.primary_keys, *columns]))
+        return Projection(
+            names=names,
+            columns=tuple(self.column_attributes[name] for name in names),
+        )
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    Selected table columns and the dict keys of the resulting rows.
+    """
+
+    names: Tuple[str, ...]
+    columns: Tuple[Any, ...]
+
+    def to_dict(self, row: Sequence[Any]) -> Dict[str, Any]:
+        return dict(zip(self.names, row))
+
+
+_REGISTRY: Dict[type, ModelMetadata] = {}
+
+
+def build_model_metadata(mapper: Mapper) -> ModelMetadata:
+    """
+    Collects the metadata of a configured mapper.
+    """
+    model = mapper.class_
+    single_unique_keys: List[str] = [
+        col.key for col in mapper.columns if getattr(col, "unique", False)
+    ]
+    multi_unique_constraints: List[Dict[str, Any]] = []
+    table = mapper.local_table
+    if table is not None:
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                cols = [c.name for c in constraint.columns]
+                constraint_name = constraint.name or "unnamed_unique_constraint"
+                if len(cols) > 1:
+                    multi_unique_constraints.append(
+                        {"name": constraint_name, "columns": cols}
+                    )
+                elif cols[0] not in single_unique_keys:
+                    single_unique_keys.append(cols[0])
+
+    return ModelMetadata(
+        model=model,
+        column_keys=tuple(mapper.columns.keys()),
+        relationships={
+            name: RelationshipInfo(
+                name=name,
+                uselist=bool(rel.uselist),
+                target=rel.mapper.class_,
+                attribute=getattr(model, name),
+            )
+            for name, rel in mapper.relationships.items()
+        },
+        primary_keys=tuple(col.key for col in mapper.primary_key),
+        column_names=tuple(col.name for col in model.__table__.columns),
+        column_attributes={
+            col.name: getattr(model, mapper.get_property_by_column(col).key)
+            for col in model.__table__.columns
+        },
+        single_unique_keys=tuple(single_unique_keys),
+        multi_unique_constraints=tuple(multi_unique_constraints),
+        datetime_columns=frozenset(
+            key for key, col in mapper.columns.items() if isinstance(col.type, DateTime)
+        ),
+    )
+
+
+@event.listens_for(Mapper, "mapper_configured")
+def _register_model(mapper: Mapper, class_: type) -> None:
+    _REGISTRY[class_] = build_model_metadata(mapper)
+
+
+def get_model_metadata(model: Any) -> ModelMetadata:
+    """
+    Returns the cached metadata of the given model class (or instance).
+    Models configured before this module was imported are registered on first access.
+    """
+    if not isinstance(model, type):
+        model = type(model)
+    metadata = _REGISTRY.get(model)
+    if metadata is None:
+        configure_mappers()  # resolves relationships, fires mapper_configured
+        metadata = _REGISTRY.get(model)
+        if metadata is None:
+            metadata = _REGISTRY[model] = build_model_metadata(inspect(model))
+    return metadata
+
+
+class SerializerMixin:
+    """
+    Provides to_dict() over the model's table columns with the cached serializer.
+    """
+
+    def to_dict(self) -> Dict[str, Any]:
+        return get_model_metadata(type(self)).to_dict(self)
@@ -0,0 +1,309 @@
+"""
+Query instrumentation for the service layer.
+
+Every SQL statement executed by any engine is timed through the
+before_cursor_execute / after_cursor_execute events and aggregated per calling
+facade method (or service method for direct service calls) and statement:
+count, total / max latency and rows. Statements slower than slow_query_ms are
+logged (logger "db.slow_query") and kept in a short slow-query log.
+
+Row counts are the DBAPI cursor rowcount: always known for INSERT / UPDATE /
+DELETE, for SELECT only on drivers that report it (PostgreSQL, not SQLite).
+
+track_queries() counts the statements of a block (e.g. one page render) against
+an optional budget; tests assert on the counter.
+"""
+
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Engine, event
+
+from offermee.utils.logger import CentralLogger
+
+SLOW_QUERY_MS = 200.0
+_START_TIMES_KEY = "query_metrics_start_times"
+_FACADE_FILE = "main_facades.py"
+_SERVICE_FILE = "main_services.py"
+# expanded IN lists / multi-value parameters: (?, ?, ?) or (%(p_1)s, %(p_2)s)
+_IN_LIST = re.compile(
+    r"\((?:\s*\?\s*,)+\s*\?\s*\)|\((?:\s*%\(\w+\)s\s*,)+\s*%\(\w+\)s\s*\)"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+metrics_logger = CentralLogger.getLogger("db.metrics")
+slow_query_logger = CentralLogger.getLogger("db.slow_query")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Collapses whitespace and expanded IN lists, so that the executions of one
+    statement with different parameter counts share one entry.
+    """
+    return _IN_LIST.sub("(…)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def calling_method() -> str:
+    """
+    The innermost public facade method on the call stack, e.g.
+    "RFPFacade.get_all_by", else the innermost service method, else "-".
+    """
+    frame = sys._getframe(1)
+    service = None
+    while frame is not None:
+        code = frame.f_code
+        if not code.co_name.startswith(("_", "<")):
+            is_facade = code.co_filename.endswith(_FACADE_FILE)
+            is_service = code.co_filename.endswith(_SERVICE_FILE)
+            if is_facade or (is_service and service is None):
+                owner = frame.f_locals.get("cls")
+                name = f"{owner.__name__}.{code.co_name}" if owner else code.co_name
+                if is_facade:
+                    return name
+                service = name
+        frame = frame.f_back
+    return service or "-"
+
+
+@dataclass
+class StatementStats:
+    caller: str
+    statement: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0  # sum of the known row counts
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "caller": self.caller,
+            "statement": self.statement,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "rows": self.rows,
+        }
+
+
+@dataclass
+class QueryCounter:
+    """
+    Statements executed inside one track_queries() block.
+    """
+
+    label: str
+    budget: Optional[int] = None
+    count: int = 0
+    elapsed_ms: float = 0.0
+    statements: List[str] = field(default_factory=list)
+
+    @property
+    def exceeded(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+
+_counters: ContextVar[Tuple[QueryCounter, ...]] = ContextVar(
+    "offermee_query_counters", default=()
+)
+
+
+class QueryMetrics:
+    """
+    Thread-safe collector of the statement statistics and the slow-query log.
+    """
+
+    def __init__(
+        self,
+        slow_query_ms: float = SLOW_QUERY_MS,
+        max_statements: int = 500,
+        slow_log_size: int = 100,
+    ):
+        self.enabled = True
+        self.slow_query_ms = slow_query_ms
+        self.max_statements = max_statements
+        self._stats: "OrderedDict[Tuple[str, str], StatementStats]" = OrderedDict()
+        self._slow: "deque[Dict[str, Any]]" = deque(maxlen=slow_log_size)
+        self._requests: "deque[Dict[str, Any]]" = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+
+    def record(
+        self, statement: str, elapsed_ms: float, rows: Optional[int], caller: str
+    ) -> None:
+        normalized = normalize_statement(statement)
+        key = (caller, normalized)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = StatementStats(caller, normalized)
+                while len(self._stats) > self.max_statements:
+                    self._stats.popitem(last=False)
+            else:
+                self._stats.move_to_end(key)
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            if rows is not None:
+                stats.rows += rows
+            if elapsed_ms >= self.slow_query_ms:
+                self._slow.append(
+                    {
+                        "at": time.time(),
+                        "caller": caller,
+                        "statement": normalized,
+                        "elapsed_ms": round(elapsed_ms, 3),
+                        "rows": rows,
+                    }
+                )
+        if elapsed_ms >= self.slow_query_ms:
+            slow_query_logger.warning(
+                f"Slow query ({elapsed_ms:.0f} ms, {caller}): {normalized[:500]}"
+            )
+
+    def summary(
+        self, top: int = 20, order_by: str = "total_ms"
+    ) -> List[Dict[str, Any]]:
+        """
+        The top statements, ordered by total_ms, max_ms or count (descending).
+        """
+        with self._lock:
+            rows = [stats.as_dict() for stats in self._stats.values()]
+        rows.sort(key=lambda row: row[order_by], reverse=True)
+        return rows[:top]
+
+    def by_caller(self) -> List[Dict[str, Any]]:
+        """
+        Statement count and latency per calling method, slowest first.
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for stats in self._stats.values():
+                total = totals.setdefault(
+                    stats.caller,
+                    {
+                        "caller": stats.caller,
+                        "count": 0,
+                        "total_ms": 0.0,
+                        "max_ms": 0.0,
+                    },
+                )
+                total["count"] += stats.count
+                total["total_ms"] += stats.total_ms
+                total["max_ms"] = max(total["max_ms"], stats.max_ms)
+        return sorted(totals.values(), key=lambda row: row["total_ms"], reverse=True)
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        """
+        The latest slow queries, newest first.
+        """
+        with self._lock:
+            return list(reversed(self._slow))
+
+    def record_request(self, counter: QueryCounter) -> None:
+        with self._lock:
+            self._requests.append(
+                {
+                    "at": time.time(),
+                    "label": counter.label,
+                    "count": counter.count,
+                    "elapsed_ms": round(counter.elapsed_ms, 3),
+                    "budget": counter.budget,
+                    "exceeded": counter.exceeded,
+                }
+            )
+
+    def requests(self) -> List[Dict[str, Any]]:
+        """
+        The latest track_queries() blocks with a label (e.g. page renders), newest first.
+        """
+        with self._lock:
+            return list(reversed(self._requests))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._slow.clear()
+            self._requests.clear()
+
+    def log_summary(self, top: int = 10) -> None:
+        """
+        Writes the slowest callers and statements to the "db.metrics" log.
+        """
+        callers = self.by_caller()
+        if not callers:
+            metrics_logger.info("No queries recorded.")
+            return
+        lines = [
+            f"{row['caller']}: {row['count']} queries, {row['total_ms']:.1f} ms"
+            for row in callers[:top]
+        ]
+        lines += [
+            f"{row['count']}x {row['total_ms']:.1f} ms (max {row['max_ms']:.1f} ms) "
+            f"{row['caller']}: {row['statement'][:200]}"
+            for row in self.summary(top)
+        ]
+        metrics_logger.info("Query summary:\n" + "\n".join(lines))
+
+
+query_metrics = QueryMetrics()
+
+
+@contextmanager
+def track_queries(
+    label: str = "", budget: Optional[int] = None
+) -> Iterator[QueryCounter]:
+    """
+    Counts the statements executed in the block (in this thread / task) and logs a
+    warning if there are more than budget. Nested blocks count for all open
+    counters. Blocks with a label are kept in the request log of query_metrics.
+    """
+    counter = QueryCounter(label=label, budget=budget)
+    token = _counters.set((*_counters.get(), counter))
+    try:
+        yield counter
+    finally:
+        _counters.reset(token)
+        if label:
+            query_metrics.record_request(counter)
+        if counter.exceeded:
+            metrics_logger.warning(
+                f"Query budget exceeded in {label or 'block'}: {counter.count} "
+                f"queries (budget {budget}), {counter.elapsed_ms:.1f} ms"
+            )
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    if query_metrics.enabled or _counters.get():
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not start_times:
+        return
+    elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+    for counter in _counters.get():
+        counter.count += 1
+        counter.elapsed_ms += elapsed_ms
+        counter.statements.append(statement)
+    if query_metrics.enabled:
+        rowcount = getattr(cursor, "rowcount", -1)
+        rows = rowcount if rowcount is not None and rowcount >= 0 else None
+        query_metrics.record(statement, elapsed_ms, rows, calling_method())
+
+
+@event.listens_for(Engine, "handle_error")
+def _drop_timer(exception_context) -> None:
+    # a failed statement has no after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_START_TIMES_KEY):
+        connection.info[_START_TIMES_KEY].pop()
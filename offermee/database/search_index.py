@@ -0,0 +1,103 @@
+"""
+SQLite FTS5 full-text indexes.
+
+Every table in SEARCH_INDEXES gets an external-content FTS5 table "<table>_fts"
+over the listed text columns, kept in sync by triggers on the table, so the
+index never stores a second copy of the text and needs no application code on
+writes. The first column is the title of a search result and weighted highest
+by the BM25 ranking.
+
+New databases get the indexes when create_all() creates the tables, existing
+databases by migration 3.
+"""
+
+import logging
+import re
+from typing import Dict, List
+
+from sqlalchemy import Connection, Table, event
+
+# table -> indexed columns, the first one is the result title
+SEARCH_INDEXES: Dict[str, List[str]] = {
+    "rfps": [
+        "title",
+        "description",
+        "must_have_requirements",
+        "nice_to_have_requirements",
+        "tasks",
+        "responsibilities",
+    ],
+    "projects": [
+        "title",
+        "description",
+        "must_haves",
+        "nice_to_haves",
+        "tasks",
+        "responsibilities",
+    ],
+    "cvs": ["name", "cv_raw_text"],
+}
+TITLE_WEIGHT = 10.0
+
+
+def fts_table(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+
+def match_query(text: str) -> str:
+    """
+    Converts free text into an FTS5 query: every word is quoted (no FTS5 syntax
+    errors for input like "C++" or "node.js") and prefix-matched, all words must match.
+    """
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+
+def create_search_index(connection: Connection, table_name: str) -> bool:
+    """
+    Creates the FTS5 table and the sync triggers of the table if missing and fills
+    the index from the existing rows. Idempotent, SQLite only.
+    Returns True if the FTS5 table was created.
+    """
+    if connection.dialect.name != "sqlite":
+        return False
+    columns = SEARCH_INDEXES[table_name]
+    fts = fts_table(table_name)
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{col}" for col in columns)
+    old_values = ", ".join(f"old.{col}" for col in columns)
+    created = not connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+    ).first()
+    connection.exec_driver_sql(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, "
+        f"content='{table_name}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+    # the triggers are dropped with the table, e.g. by MigrationOps.rebuild_table()
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values}); END"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old_values}); END"
+    )
+    # only changes of the indexed columns touch the index, e.g. not status updates
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} "
+        f"ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values}); END"
+    )
+    if created:
+        connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        logging.info(f"Created full-text index {fts}")
+    return created
+
+
+@event.listens_for(Table, "after_create")
+def _create_search_index_after_table(target: Table, connection: Connection, **kw):
+    if target.name in SEARCH_INDEXES:
+        create_search_index(connection, target.name)
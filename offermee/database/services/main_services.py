@@ -6,14 +6,54 @@ All comments and code are in English.
 """
 
 from datetime import datetime
+from enum import Enum
+import re
 import traceback
-from typing import Any, Dict, List, Tuple, Optional, Set
-from dateutil import parser
-
-from sqlalchemy import DateTime, UniqueConstraint, inspect
-from sqlalchemy.orm import Session, joinedload
+from typing import Any, Dict, Iterator, List, Tuple, Optional
+
+from sqlalchemy import (
+    Select,
+    String,
+    and_,
+    cast,
+    column,
+    exists,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    type_coerce,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer_group
 
 from offermee.database.db_connection import session_scope
+from offermee.database import document_store  # also registers the blob offloading
+from offermee.database import query_metrics  # noqa: F401 registers the instrumentation
+from offermee.database.archive import (
+    DEFAULT_MAX_AGE_DAYS,
+    archive_rfps,
+    find_archived_rfp,
+)
+from offermee.database.matching import RefreshResult, refresh_matching_scores
+from offermee.database import skill_index  # noqa: F401 registers the index maintenance
+from offermee.database.skill_aliases import canonical_skill_names
+from offermee.database.soft_delete import INCLUDE_DELETED
+from offermee.database.history_sink import (
+    created_fields,
+    field_changes,
+    record_history,
+)
+from offermee.database.models.model_registry import get_model_metadata
+from offermee.database.search_index import (
+    SEARCH_INDEXES,
+    TITLE_WEIGHT,
+    fts_table,
+    match_query,
+)
 from offermee.database.models.main_models import (
     AddressModel,
     ContactModel,
@@ -24,6 +64,7 @@ from offermee.database.models.main_models import (
     SchemaModel,
     DocumentModel,
     HistoryModel,
+    SkillAliasModel,
     SkillModel,
     CapabilitiesModel,
     FreelancerModel,
@@ -38,8 +79,13 @@ from offermee.database.models.main_models import (
     OfferModel,
     HistoryType,
     DocumentRelatedType,
+    HEAVY_COLUMNS_GROUP,
     ProjectStatus,
+    RFPStatus,
+    SoftDeleteMixin,
 )
+from offermee.database.models.matching_score_model import MatchingScoreModel
+from offermee.utils.date_parser import parse_date
 from offermee.utils.logger import CentralLogger
 
 service_logger = CentralLogger.getLogger("service")
@@ -56,20 +102,39 @@ def create_history_entry(
     related_id: int,
     description: str,
     created_by: str = "system",
-) -> HistoryModel:
+    changes: Optional[Dict[str, Any]] = None,
+) -> None:
     """
-    Creates a new history entry.
+    Creates a new history entry. The entry is buffered and written in bulk when the
+    session commits (see history_sink), no flush is needed.
     """
-    history = HistoryModel(
+    record_history(
+        session,
         related_type=related_type,
         related_id=related_id,
         description=description,
-        event_date=datetime.utcnow(),
         created_by=created_by,
+        changes=changes,
     )
-    session.add(history)
-    session.flush()  # Ensures history.id is set
-    return history
+
+
+def history_description(
+    action: str,
+    model: Any,
+    record_id: int,
+    changes: Optional[Dict[str, Any]] = None,
+    relationships: Optional[List[str]] = None,
+) -> str:
+    """
+    Short history text, e.g. "Updated RFPModel (ID=3). Fields: title, status".
+    The values themselves are stored in the changes diff.
+    """
+    description = f"{action} {model.__name__} (ID={record_id})."
+    if changes:
+        description += f" Fields: {', '.join(changes)}."
+    if relationships:
+        description += f" Relationships: {', '.join(relationships)}."
+    return description
 
 
 def create_documents(
@@ -127,6 +192,132 @@ def expunge_all(instances: List[Any], session: Session) -> List[Dict[str, Any]]:
     return result
 
 
+def select_dicts(
+    session: Session,
+    model: Any,
+    pattern: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Selects the plain table columns of the model (optionally filtered by equality on pattern)
+    and serializes each row directly to a dict, skipping ORM instance hydration.
+    Without columns the dicts equal to_dict() of the loaded instances; with columns only
+    those columns (plus the primary key) are selected.
+    """
+    projection = get_model_metadata(model).projection(columns)
+    stmt = filter_by_pattern(select(*projection.columns), model, pattern)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    rows = [projection.to_dict(row) for row in session.execute(stmt)]
+    return document_store.load_raw_texts(session, model, rows)
+
+
+def filter_by_pattern(stmt: Select, model: Any, pattern: Optional[Dict[str, Any]]) -> Select:
+    """
+    Adds an equality filter per pattern entry (column name -> value) to the statement.
+    """
+    for key, value in (pattern or {}).items():
+        stmt = stmt.where(getattr(model, key) == value)
+    return stmt
+
+
+def json_array_contains(column: Any, values: List[Any], dialect_name: str) -> Any:
+    """
+    Condition that the JSON array column contains all values. On PostgreSQL this is
+    the JSONB containment operator @> (served by GIN indexes), elsewhere one
+    json_each lookup per value.
+    """
+    if dialect_name == "postgresql":
+        return type_coerce(column, JSONB).contains(list(values))
+    conditions = []
+    for value in values:
+        elements = func.json_each(column).table_valued("value")
+        matches = select(literal(1)).select_from(elements)
+        conditions.append(exists(matches.where(elements.c.value == value)))
+    return and_(*conditions)
+
+
+def select_page(
+    session: Session,
+    model: Any,
+    pattern: Optional[Dict[str, Any]] = None,
+    after_id: Optional[int] = None,
+    page_size: int = 100,
+    order_by: str = "id",
+    columns: Optional[List[str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Keyset pagination: selects the next page_size rows after the row with id after_id.
+    columns optionally restricts the selected columns (see select_dicts).
+    order_by is a column name, prefixed with "-" for descending order; ties are broken by id.
+    NULLs sort first in ascending and last in descending order on every dialect.
+    Returns the rows as dicts and the cursor (id of the last row) for the next page,
+    or None if there is no further page.
+    """
+    metadata = get_model_metadata(model)
+    descending = order_by.startswith("-")
+    column_name = order_by.lstrip("-")
+    if column_name not in metadata.column_key_set:
+        raise ValueError(f"Unknown order_by column for {model.__name__}: {order_by}")
+    order_col = getattr(model, column_name)
+    id_col = model.id
+
+    projection = metadata.projection(columns)
+    stmt = filter_by_pattern(select(*projection.columns), model, pattern)
+    if after_id is not None:
+        if column_name == "id":
+            stmt = stmt.where(id_col < after_id if descending else id_col > after_id)
+        else:
+            cursor_row = session.execute(
+                select(order_col).where(id_col == after_id)
+            ).first()
+            if cursor_row is None:
+                service_logger.warning(
+                    f"Page cursor {model.__name__}#{after_id} no longer exists, restarting from the first page."
+                )
+            else:
+                stmt = stmt.where(
+                    _keyset_condition(order_col, id_col, cursor_row[0], after_id, descending)
+                )
+    if column_name == "id":
+        ordering = [id_col.desc() if descending else id_col.asc()]
+    elif descending:
+        ordering = [order_col.desc().nulls_last(), id_col.desc()]
+    else:
+        ordering = [order_col.asc().nulls_first(), id_col.asc()]
+    # fetch one row more to know whether a next page exists
+    stmt = stmt.order_by(*ordering).limit(page_size + 1)
+    rows = [projection.to_dict(row) for row in session.execute(stmt)]
+    document_store.load_raw_texts(session, model, rows)
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, rows[-1]["id"]
+    return rows, None
+
+
+def _keyset_condition(
+    order_col: Any, id_col: Any, value: Any, after_id: int, descending: bool
+) -> Any:
+    """
+    WHERE clause for the rows after (value, after_id) in the (order_col, id) ordering of select_page.
+    """
+    if descending:  # NULLs last
+        if value is None:
+            return and_(order_col.is_(None), id_col < after_id)
+        return or_(
+            order_col < value,
+            and_(order_col == value, id_col < after_id),
+            order_col.is_(None),
+        )
+    # ascending, NULLs first
+    if value is None:
+        return or_(
+            and_(order_col.is_(None), id_col > after_id), order_col.is_not(None)
+        )
+    return or_(order_col > value, and_(order_col == value, id_col > after_id))
+
+
 def separate_relationship_data(
     model: Any, data: Dict[str, Any]
 ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
@@ -139,7 +330,7 @@ def separate_relationship_data(
              - relationships_list_data: dict of list-based relationship data
              - odd_fields: fields that do not match any column or relationship
     """
-    mapper = inspect(model)
+    metadata = get_model_metadata(model)
     flat_fields: Dict[str, Any] = {}
     relationships_dict_data: Dict[str, Any] = {}
     relationships_list_data: Dict[str, Any] = {}
@@ -148,9 +339,9 @@ def separate_relationship_data(
     for key, value in data.items():
         # sanatize jsonized key name to ORMized one:
         key = key.replace("-", "_")
-        if key in mapper.columns.keys():
+        if key in metadata.column_key_set:
             flat_fields[key] = value
-        elif key in mapper.relationships.keys():
+        elif key in metadata.relationships:
             if isinstance(value, dict):
                 relationships_dict_data[key] = value
             elif isinstance(value, list):
@@ -163,72 +354,149 @@ def separate_relationship_data(
     return flat_fields, relationships_dict_data, relationships_list_data, odd_fields
 
 
-def joined_load_by_id(session: Session, model: Any, record_id: int) -> Optional[Any]:
+RelationTree = Dict[str, "RelationTree"]  # relationship name -> nested relationships
+
+
+def plan_relation_tree(
+    model: Any, include: Optional[List[str]] = None, depth: Optional[int] = None
+) -> RelationTree:
     """
-    Eager-loads all relationships for the given model record.
+    The relationships to load with a record.
+    include lists dotted relationship paths (e.g. ["offers", "offers.documents"]);
+    without include all relationships are followed down to depth levels (unlimited
+    if None), skipping relationships back to a model already on the path, like
+    build_full_json_schema(). Raises a ValueError on unknown relationship names.
     """
-    mapper = inspect(model)
-    query = session.query(model)
-    for rel_name in mapper.relationships.keys():
-        rel_prop = getattr(model, rel_name).property
-        query = query.options(joinedload(rel_prop))
-    # Use session.get() when possible. Here we simulate a get with filtering by primary key.
-    # Assuming primary key column is 'id'
-    return query.filter(model.id == record_id).first()
+    if include is not None:
+        tree: RelationTree = {}
+        for path in include:
+            node, current = tree, model
+            for name in path.split("."):
+                rel = get_model_metadata(current).relationships.get(name)
+                if rel is None:
+                    raise ValueError(
+                        f"Unknown relationship '{name}' of {current.__name__} in '{path}'"
+                    )
+                node = node.setdefault(name, {})
+                current = rel.target
+        return tree
+
+    def expand(current: Any, ancestors: frozenset, level: int) -> RelationTree:
+        if depth is not None and level >= depth:
+            return {}
+        return {
+            name: expand(rel.target, ancestors | {rel.target}, level + 1)
+            for name, rel in get_model_metadata(current).relationships.items()
+            if rel.target not in ancestors
+        }
+
+    return expand(model, frozenset([model]), 0)
 
 
-def build_nested_dict(
-    model: Any, record: Any, visited: Optional[Set[Tuple[Any, int]]] = None
-) -> Dict[str, Any]:
+def relation_loader_options(
+    model: Any, tree: RelationTree, parent: Optional[Any] = None
+) -> List[Any]:
     """
-    Recursively builds a nested dictionary representing the record and its related objects.
+    Loader options for the relation tree: collections are loaded with one SELECT ... IN
+    per relationship path (selectinload), many-to-one relationships are joined
+    (joinedload); no collection is joined, so rows never multiply.
     """
-    if record is None:
-        return {}
-    if visited is None:
-        visited = set()
+    options: List[Any] = []
+    for name, subtree in tree.items():
+        rel = get_model_metadata(model).relationships[name]
+        if parent is None:
+            loader = (selectinload if rel.uselist else joinedload)(rel.attribute)
+        elif rel.uselist:
+            loader = parent.selectinload(rel.attribute)
+        else:
+            loader = parent.joinedload(rel.attribute)
+        options.append(loader.undefer_group(HEAVY_COLUMNS_GROUP))
+        options.extend(relation_loader_options(rel.target, subtree, loader))
+    return options
 
-    rec_id = (record.__class__, record.id)
-    if rec_id in visited:
-        return {}
-    visited.add(rec_id)
 
+def build_nested_dict(model: Any, record: Any, tree: RelationTree) -> Dict[str, Any]:
+    """
+    Builds a nested dictionary of the record and the related objects in the relation tree.
+    """
+    if record is None:
+        return {}
     data = record.to_dict()
-    mapper = inspect(model)
-    for rel_name in mapper.relationships.keys():
+    relationships = get_model_metadata(model).relationships
+    for rel_name, subtree in tree.items():
+        related_model = relationships[rel_name].target
         related_value = getattr(record, rel_name)
-        rel_prop = getattr(model, rel_name).property
-        related_model = rel_prop.mapper.class_
         if related_value is None:
             data[rel_name] = None
         elif isinstance(related_value, list):
             data[rel_name] = [
-                build_nested_dict(related_model, child, visited)
+                build_nested_dict(related_model, child, subtree)
                 for child in related_value
             ]
         else:
-            data[rel_name] = build_nested_dict(related_model, related_value, visited)
+            data[rel_name] = build_nested_dict(related_model, related_value, subtree)
     return data
 
 
+def get_records_with_relations(
+    session: Session,
+    model: Any,
+    record_ids: List[int],
+    include: Optional[List[str]] = None,
+    depth: Optional[int] = None,
+    batch_size: int = 500,
+) -> List[Dict[str, Any]]:
+    """
+    Loads the records and their relationships (see plan_relation_tree) set-based, one
+    query per relationship path and batch of batch_size IDs, and returns nested
+    dictionaries in the order of record_ids. Unknown IDs are skipped.
+    """
+    tree = plan_relation_tree(model, include=include, depth=depth)
+    options = [undefer_group(HEAVY_COLUMNS_GROUP), *relation_loader_options(model, tree)]
+    records: Dict[int, Any] = {}
+    unique_ids = list(dict.fromkeys(record_ids))
+    for start in range(0, len(unique_ids), batch_size):
+        batch = unique_ids[start : start + batch_size]
+        stmt = select(model).where(model.id.in_(batch)).options(*options)
+        records.update(
+            (record.id, record) for record in session.scalars(stmt).unique()
+        )
+    return [
+        build_nested_dict(model, records[record_id], tree)
+        for record_id in record_ids
+        if record_id in records
+    ]
+
+
 def get_record_with_relations(
-    session: Session, model: Any, record_id: int
+    session: Session,
+    model: Any,
+    record_id: int,
+    include: Optional[List[str]] = None,
+    depth: Optional[int] = None,
 ) -> Optional[Dict[str, Any]]:
     """
-    Loads a record with all its relationships (via joined load) and returns a nested dictionary.
+    Loads a record with its relationships (see plan_relation_tree) and returns a
+    nested dictionary.
     """
-    record = joined_load_by_id(session, model, record_id)
-    if not record:
-        return None
-    return build_nested_dict(model, record)
+    records = get_records_with_relations(
+        session, model, [record_id], include=include, depth=depth
+    )
+    return records[0] if records else None
+
+
+def get_model_columns(model: Any) -> List[str]:
+    """
+    Returns a list of column attribute names for the given model.
+    """
+    return list(get_model_metadata(model).column_keys)
 
 
 def get_primary_keys(model: Any) -> List[str]:
     """
     Returns a list of primary key column names for the given model.
     """
-    mapper = inspect(model)
-    return [col.key for col in mapper.primary_key]
+    return list(get_model_metadata(model).primary_keys)
 
 
 def get_primary_keyed_record(
@@ -256,25 +524,10 @@ def get_unique_key_constraints(model: Any) -> Tuple[List[Dict[str, Any]], List[s
              - List of multi-column unique constraints (each as a dict with name and columns)
              - List of single-column unique keys
     """
-    mapper = inspect(model)
-    single_unique_keys = [
-        col.key for col in mapper.columns if getattr(col, "unique", False)
-    ]
-    multi_unique_constraints = []
-    table = mapper.local_table
-    if table is not None:
-        for constraint in table.constraints:
-            if isinstance(constraint, UniqueConstraint):
-                cols = [c.name for c in constraint.columns]
-                constraint_name = constraint.name or "unnamed_unique_constraint"
-                if len(cols) > 1:
-                    multi_unique_constraints.append(
-                        {"name": constraint_name, "columns": cols}
-                    )
-                else:
-                    if cols[0] not in single_unique_keys:
-                        single_unique_keys.append(cols[0])
-    return multi_unique_constraints, single_unique_keys
+    metadata = get_model_metadata(model)
+    return [dict(c) for c in metadata.multi_unique_constraints], list(
+        metadata.single_unique_keys
+    )
 
 
 def get_unique_record(
@@ -317,6 +570,63 @@ def get_unique_record(
     return None
 
 
+def _lookup_value(value: Any) -> Any:
+    """
+    Normalizes a column value for the in-memory key lookup (Enum members compare by value).
+    """
+    return value.value if isinstance(value, Enum) else value
+
+
+def resolve_existing_records(
+    session: Session,
+    model: Any,
+    items: List[Dict[str, Any]],
+    primary_keys: List[str],
+    unique_key_constraints: Tuple[List[Dict[str, Any]], List[str]],
+    chunk_size: int = 500,
+) -> List[Optional[Any]]:
+    """
+    Set-based variant of get_primary_keyed_record and get_unique_record for many items.
+    Runs one IN query per primary key, per single-column unique key and per multi-column
+    unique constraint (in this order) and returns the existing record per item or None.
+    Items are expected with ORM (sanitized) keys.
+    """
+    multi_constraints, single_unique_keys = unique_key_constraints or ([], [])
+    key_sets = []
+    if primary_keys:
+        key_sets.append(list(primary_keys))
+    key_sets.extend([col] for col in single_unique_keys)
+    key_sets.extend(list(c.get("columns", [])) for c in multi_constraints)
+
+    resolved: List[Optional[Any]] = [None] * len(items)
+    for cols in key_sets:
+        pending = {
+            index: tuple(items[index][c] for c in cols)
+            for index in range(len(items))
+            if resolved[index] is None and all(c in items[index] for c in cols)
+        }
+        if not pending:
+            continue
+        values = list(dict.fromkeys(pending.values()))
+        columns = [getattr(model, c) for c in cols]
+        found: Dict[Tuple[Any, ...], Any] = {}
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start : start + chunk_size]
+            if len(columns) == 1:
+                condition = columns[0].in_([value[0] for value in chunk])
+            else:
+                condition = tuple_(*columns).in_(chunk)
+            service_logger.debug(
+                f"Resolving {len(chunk)} {model.__name__} records by {cols}"
+            )
+            for record in session.query(model).filter(condition):
+                key = tuple(_lookup_value(getattr(record, c)) for c in cols)
+                found[key] = record
+        for index, value in pending.items():
+            resolved[index] = found.get(tuple(_lookup_value(v) for v in value))
+    return resolved
+
+
 def get_new_skills(
     incoming_skills: List[Dict[str, Any]], existing_skills: List[SkillModel]
 ) -> List[Dict[str, Any]]:
@@ -396,9 +706,10 @@ def handle_related_data(
     Processes nested relationship data (assumed to be one-to-one or one-to-many)
     and updates or creates related records.
     """
+    relationships = get_model_metadata(model).relationships
     for rel_name, rel_data in relationships_data.items():
-        rel_prop = getattr(model, rel_name).property
-        related_model = rel_prop.mapper.class_
+        rel = relationships[rel_name]
+        related_model = rel.target
         unique_constraints = get_unique_key_constraints(related_model)
         primary_keys = get_primary_keys(related_model)
 
@@ -446,69 +757,145 @@ def handle_related_data(
             service_logger.debug(
                 f"Appending related instance '{related_model.__name__}' to relationship '{model.__name__}.{rel_name}'"
             )
-            if rel_prop.uselist:
+            if rel.uselist:
                 getattr(instance, rel_name).append(related_instance)
             else:
                 setattr(instance, rel_name, related_instance)
             session.flush()
 
         elif isinstance(rel_data, list):
-            related_instances = getattr(instance, rel_name) or []
-            for rel_item in rel_data:
-                if isinstance(rel_item, dict):
-                    related_instance = get_primary_keyed_record(
-                        session=session,
-                        model=related_model,
-                        data=rel_item,
-                        primary_keys=primary_keys,
-                    )
-                    if related_instance:
-                        related_instance = update_record(
-                            session=session,
-                            model=related_model,
-                            record_id=related_instance.id,
-                            data=rel_item,
-                            documents=None,
-                            updated_by=handled_by,
-                        )
-                    else:
-                        related_instance = get_unique_record(
-                            session=session,
-                            model=related_model,
-                            data=rel_item,
-                            unique_key_constraints=unique_constraints,
-                        )
-                        if related_instance:
-                            related_instance = update_record(
-                                session=session,
-                                model=related_model,
-                                record_id=related_instance.id,
-                                data=rel_item,
-                                documents=None,
-                                updated_by=handled_by,
-                            )
-                        else:
-                            related_instance = create_record(
-                                session=session,
-                                model=related_model,
-                                data=rel_item,
-                                documents=None,
-                                created_by=handled_by,
-                            )
-                    related_instances.append(related_instance)
-                    session.flush()
-                else:
-                    raise ValueError(
-                        f"Unsupported list entry type for relationship '{rel_name}': {type(rel_item)}"
-                    )
-            setattr(instance, rel_name, related_instances)
-            session.flush()
+            handle_related_list(
+                session=session,
+                model=model,
+                instance=instance,
+                rel_name=rel_name,
+                rel_items=rel_data,
+                handled_by=handled_by,
+            )
         else:
             raise ValueError(
                 f"Unsupported type for relationship '{rel_name}': {type(rel_data)}"
             )
 
 
+def handle_related_list(
+    session: Session,
+    model: Any,
+    instance: Any,
+    rel_name: str,
+    rel_items: List[Dict[str, Any]],
+    handled_by: str,
+) -> None:
+    """
+    Set-based processing of a list relationship: resolves all existing related records at once,
+    creates the missing flat ones in bulk and flushes once. Items that carry nested relationship
+    data themselves are handled one by one via update_record / create_record.
+    """
+    related_model = get_model_metadata(model).relationships[rel_name].target
+    for rel_item in rel_items:
+        if not isinstance(rel_item, dict):
+            raise ValueError(
+                f"Unsupported list entry type for relationship '{rel_name}': {type(rel_item)}"
+            )
+
+    prepared = [_prepare_bulk_record(related_model, rel_item) for rel_item in rel_items]
+    existing = resolve_existing_records(
+        session=session,
+        model=related_model,
+        items=[flat_fields for flat_fields, _, _ in prepared],
+        primary_keys=get_primary_keys(related_model),
+        unique_key_constraints=get_unique_key_constraints(related_model),
+    )
+
+    # remember every handled record, so duplicates within the incoming list map to the same row
+    multi_constraints, single_unique_keys = get_unique_key_constraints(related_model)
+    key_sets = [[col] for col in single_unique_keys] + [
+        list(c.get("columns", [])) for c in multi_constraints
+    ]
+    seen_by_key: Dict[Tuple[Any, ...], Any] = {}
+
+    def batch_keys(flat_fields: Dict[str, Any]) -> List[Tuple[Any, ...]]:
+        return [
+            (tuple(cols),) + tuple(_lookup_value(flat_fields[c]) for c in cols)
+            for cols in key_sets
+            if all(c in flat_fields for c in cols)
+        ]
+
+    related_instances = getattr(instance, rel_name) or []
+    created: List[Tuple[Any, Dict[str, Any], Optional[List[Dict[str, Any]]]]] = []
+    updated: List[Tuple[Any, Dict[str, Any], Optional[List[Dict[str, Any]]]]] = []
+    for rel_item, (flat_fields, rel_data, documents), related_instance in zip(
+        rel_items, prepared, existing
+    ):
+        if related_instance is None:
+            related_instance = next(
+                (
+                    seen_by_key[key]
+                    for key in batch_keys(flat_fields)
+                    if key in seen_by_key
+                ),
+                None,
+            )
+        item_data = {k: v for k, v in rel_item.items() if k != "documents"}
+        if rel_data:
+            if related_instance is not None and related_instance.id is not None:
+                related_instance = update_record(
+                    session=session,
+                    model=related_model,
+                    record_id=related_instance.id,
+                    data=item_data,
+                    documents=documents,
+                    updated_by=handled_by,
+                )
+            else:
+                related_instance = create_record(
+                    session=session,
+                    model=related_model,
+                    data=item_data,
+                    documents=documents,
+                    created_by=handled_by,
+                )
+        elif related_instance is not None:
+            assign_flat_fields(related_model, related_instance, flat_fields)
+            if related_instance.id is not None:
+                changes = field_changes(related_instance, flat_fields)
+                updated.append((related_instance, changes, documents))
+        else:
+            related_instance = related_model(**flat_fields)
+            session.add(related_instance)
+            created.append((related_instance, created_fields(flat_fields), documents))
+        for key in batch_keys(flat_fields):
+            seen_by_key.setdefault(key, related_instance)
+        if related_instance not in related_instances:
+            related_instances.append(related_instance)
+
+    setattr(instance, rel_name, related_instances)
+    session.flush()
+    _add_bulk_side_entries(
+        session,
+        related_model,
+        [("Created", inst, changes, docs) for inst, changes, docs in created]
+        + [("Updated", inst, changes, docs) for inst, changes, docs in updated],
+        handled_by=handled_by,
+    )
+
+
+def assign_flat_fields(model: Any, instance: Any, flat_fields: Dict[str, Any]) -> None:
+    """
+    Sets flat column values on the instance, converting ISO strings for DateTime columns.
+    """
+    datetime_columns = get_model_metadata(model).datetime_columns
+    for key, value in flat_fields.items():
+        if key in datetime_columns and isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError as e:
+                service_logger.error(f"Error parsing datetime for field {key}: {e}")
+                continue
+        setattr(instance, key, value)
+        service_logger.debug(f"Set {key} to {value}")
+
+
 def update_record(
     session: Session,
     model: Any,
@@ -533,16 +920,9 @@ def update_record(
     )
 
     # Update flat fields
-    for key, value in flat_fields.items():
-        col = getattr(model, key).property.columns[0]
-        if isinstance(col.type, DateTime) and isinstance(value, str):
-            try:
-                value = datetime.fromisoformat(value)
-            except ValueError as e:
-                service_logger.error(f"Error parsing datetime for field {key}: {e}")
-                continue
-        setattr(instance, key, value)
-        service_logger.debug(f"Set {key} to {value}")
+    assign_flat_fields(model, instance, flat_fields)
+    # read the diff before the flush resets the attribute history
+    changes = field_changes(instance, flat_fields)
     session.flush()
 
     # Process relationship data (both dict and list)
@@ -555,7 +935,9 @@ def update_record(
         raise ValueError(msg)
 
     # Create history entry if applicable
-    description = f"Updated {model.__name__} (ID={record_id}). Data: {data}"
+    description = history_description(
+        "Updated", model, record_id, changes, [*rel_dict_data, *rel_list_data]
+    )
     history_type = get_history_type(model)
     if history_type:
         create_history_entry(
@@ -564,6 +946,7 @@ def update_record(
             related_id=record_id,
             description=description,
             created_by=updated_by,
+            changes=changes,
         )
 
     # Process documents if provided
@@ -613,7 +996,10 @@ def create_record(
         service_logger.error(msg)
         raise ValueError(msg)
 
-    description = f"Created {model.__name__} (ID={record_id}). Data: {data}"
+    changes = created_fields(flat_fields)
+    description = history_description(
+        "Created", model, record_id, changes, [*rel_dict_data, *rel_list_data]
+    )
     history_type = get_history_type(model)
     if history_type:
         create_history_entry(
@@ -622,6 +1008,7 @@ def create_record(
             related_id=record_id,
             description=description,
             created_by=created_by,
+            changes=changes,
         )
 
     if documents:
@@ -638,6 +1025,206 @@ def create_record(
     return instance
 
 
+def _prepare_bulk_record(
+    model: Any, record: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[List[Dict[str, Any]]]]:
+    """
+    Splits a bulk record into flat fields, relationship data and documents.
+    Raises a ValueError on odd fields, like create_record does.
+    """
+    record = dict(record)
+    documents = record.pop("documents", None)
+    flat_fields, rel_dict_data, rel_list_data, odd_fields = separate_relationship_data(
+        model, record
+    )
+    if odd_fields:
+        msg = f"Odd fields found in {model.__name__} bulk record: {odd_fields}"
+        service_logger.error(msg)
+        raise ValueError(msg)
+    return flat_fields, {**rel_dict_data, **rel_list_data}, documents
+
+
+def _add_bulk_side_entries(
+    session: Session,
+    model: Any,
+    entries: List[Tuple[str, Any, Dict[str, Any], Optional[List[Dict[str, Any]]]]],
+    handled_by: str,
+) -> None:
+    """
+    Adds the history entries and documents of bulk written instances in one batch.
+    entries: (action, instance, changes, documents) tuples with action "Created" or "Updated".
+    """
+    history_type = get_history_type(model)
+    document_type = get_document_related_type(model)
+    new_documents = []
+    for action, instance, changes, documents in entries:
+        if history_type:
+            create_history_entry(
+                session,
+                related_type=history_type,
+                related_id=instance.id,
+                description=history_description(action, model, instance.id, changes),
+                created_by=handled_by,
+                changes=changes,
+            )
+        if documents and document_type:
+            for doc_data in documents:
+                new_documents.append(
+                    DocumentModel(
+                        related_type=document_type,
+                        related_id=instance.id,
+                        document_name=doc_data.get("document_name"),
+                        document_link=doc_data.get("document_link"),
+                        document_raw_text=doc_data.get("document_raw_text"),
+                        document_structured_text=doc_data.get(
+                            "document_structured_text"
+                        ),
+                        document_schema_reference_id=doc_data.get(
+                            "document_schema_reference_id"
+                        ),
+                    )
+                )
+    if new_documents:
+        session.add_all(new_documents)
+
+
+def bulk_create_records(
+    session: Session,
+    model: Any,
+    records: List[Dict[str, Any]],
+    created_by: str = "system",
+) -> List[Any]:
+    """
+    Creates many records of the given model with a single flush (executemany).
+    Records carrying nested relationship data fall back to create_record within the same session.
+    History entries and documents are written in one batch afterwards.
+    """
+    service_logger.info(f"Request to bulk create {len(records)} {model.__name__}.")
+    instances: List[Any] = []
+    pending: List[Tuple[Any, Dict[str, Any], Optional[List[Dict[str, Any]]]]] = []
+    for record in records:
+        flat_fields, rel_data, documents = _prepare_bulk_record(model, record)
+        if rel_data:
+            instances.append(
+                create_record(
+                    session=session,
+                    model=model,
+                    data={k: v for k, v in record.items() if k != "documents"},
+                    documents=documents,
+                    created_by=created_by,
+                )
+            )
+            continue
+        instance = model(**flat_fields)
+        instances.append(instance)
+        pending.append((instance, created_fields(flat_fields), documents))
+
+    session.add_all([instance for instance, _, _ in pending])
+    session.flush()  # one flush for all rows, assigns all primary keys
+    _add_bulk_side_entries(
+        session,
+        model,
+        [("Created", instance, changes, docs) for instance, changes, docs in pending],
+        handled_by=created_by,
+    )
+    service_logger.info(f"Bulk created {len(instances)} {model.__name__}.")
+    return instances
+
+
+def bulk_upsert_records(
+    session: Session,
+    model: Any,
+    records: List[Dict[str, Any]],
+    conflict_keys: List[str],
+    created_by: str = "system",
+    chunk_size: int = 500,
+) -> List[Any]:
+    """
+    Inserts or updates many records identified by the conflict_keys columns.
+    Existing rows are loaded with one IN query per chunk, new rows are inserted with one flush.
+    Records sharing the same conflict key within the batch are merged into one row.
+    """
+    columns = get_model_columns(model)
+    unknown_keys = [key for key in conflict_keys if key not in columns]
+    if not conflict_keys or unknown_keys:
+        raise ValueError(
+            f"Invalid conflict keys for {model.__name__}: {conflict_keys} (unknown: {unknown_keys})"
+        )
+    service_logger.info(
+        f"Request to bulk upsert {len(records)} {model.__name__} on {conflict_keys}."
+    )
+
+    prepared = [_prepare_bulk_record(model, record) for record in records]
+
+    def key_of(flat_fields: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        key = tuple(flat_fields.get(k) for k in conflict_keys)
+        return None if any(value is None for value in key) else key
+
+    # Load all existing rows for the incoming keys
+    keys = list({key for key in (key_of(flat) for flat, _, _ in prepared) if key})
+    existing: Dict[Tuple[Any, ...], Any] = {}
+    key_columns = [getattr(model, k) for k in conflict_keys]
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start : start + chunk_size]
+        if len(key_columns) == 1:
+            condition = key_columns[0].in_([key[0] for key in chunk])
+        else:
+            condition = tuple_(*key_columns).in_(chunk)
+        for instance in session.query(model).filter(condition):
+            existing[tuple(getattr(instance, k) for k in conflict_keys)] = instance
+
+    instances: List[Any] = []
+    created: List[Tuple[Any, Dict[str, Any], Optional[List[Dict[str, Any]]]]] = []
+    updated: List[Tuple[Any, Dict[str, Any], Optional[List[Dict[str, Any]]]]] = []
+    for record, (flat_fields, rel_data, documents) in zip(records, prepared):
+        key = key_of(flat_fields)
+        instance = existing.get(key) if key else None
+        if rel_data:
+            if instance is not None and instance.id is not None:
+                instance = update_record(
+                    session=session,
+                    model=model,
+                    record_id=instance.id,
+                    data={k: v for k, v in record.items() if k != "documents"},
+                    documents=documents,
+                    updated_by=created_by,
+                )
+            else:
+                instance = create_record(
+                    session=session,
+                    model=model,
+                    data={k: v for k, v in record.items() if k != "documents"},
+                    documents=documents,
+                    created_by=created_by,
+                )
+        elif instance is not None:
+            assign_flat_fields(model, instance, flat_fields)
+            if instance.id is not None:
+                changes = field_changes(instance, flat_fields)
+                updated.append((instance, changes, documents))
+        else:
+            instance = model(**flat_fields)
+            session.add(instance)
+            created.append((instance, created_fields(flat_fields), documents))
+        if key:
+            existing[key] = instance
+        instances.append(instance)
+
+    session.flush()  # one flush for all new and changed rows
+    _add_bulk_side_entries(
+        session,
+        model,
+        [("Created", instance, changes, docs) for instance, changes, docs in created]
+        + [("Updated", instance, changes, docs) for instance, changes, docs in updated],
+        handled_by=created_by,
+    )
+    service_logger.info(
+        f"Bulk upserted {model.__name__}: {len(created)} created, {len(updated)} updated."
+    )
+    # the same row may appear several times in the batch, return it once
+    return list(dict.fromkeys(instances))
+
+
 # ------------------------------------------------------------
 # Base Service for Generic CRUD Operations
 # ------------------------------------------------------------
@@ -680,50 +1267,231 @@ class BaseService:
             return expunge_instance(instance, session)
 
     @classmethod
-    def get_by_id(cls, record_id: int) -> Optional[Dict[str, Any]]:
+    def bulk_create(
+        cls,
+        records: List[Dict[str, Any]],
+        created_by: str = "system",
+    ) -> List[Dict[str, Any]]:
+        """
+        Creates all records in a single transaction with one flush plus batched history entries.
+        A record may carry its documents under the key "documents".
+        """
+        if not records:
+            return []
+        with session_scope() as session:
+            instances = bulk_create_records(
+                session=session,
+                model=cls.MODEL,
+                records=records,
+                created_by=created_by,
+            )
+            # serialize the flushed rows before the commit expires them
+            result = expunge_all(instances, session)
+            session.commit()
+            return result
+
+    @classmethod
+    def odd_fields(cls, record: Dict[str, Any]) -> List[str]:
+        """
+        Returns the fields of the record the model does not know, without touching the
+        database. A bulk write fails on a record with odd fields.
+        """
+        record = {k: v for k, v in record.items() if k != "documents"}
+        return list(separate_relationship_data(cls.MODEL, record)[3])
+
+    @classmethod
+    def bulk_upsert(
+        cls,
+        records: List[Dict[str, Any]],
+        conflict_keys: List[str],
+        created_by: str = "system",
+    ) -> List[Dict[str, Any]]:
         """
-        Retrieves a record by its ID.
+        Inserts new and updates existing records in a single transaction.
+        Rows are matched on the values of the conflict_keys columns (e.g. ["original_link"]).
         """
+        if not records:
+            return []
         with session_scope() as session:
-            record = session.get(cls.MODEL, record_id)
+            instances = bulk_upsert_records(
+                session=session,
+                model=cls.MODEL,
+                records=records,
+                conflict_keys=conflict_keys,
+                created_by=created_by,
+            )
+            result = expunge_all(instances, session)
+            session.commit()
+            return result
+
+    @classmethod
+    def get_by_id(
+        cls, record_id: int, columns: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a record by its ID, optionally only the given columns.
+        """
+        with session_scope() as session:
+            if columns is not None:
+                rows = select_dicts(
+                    session, cls.MODEL, pattern={"id": record_id}, columns=columns
+                )
+                return rows[0] if rows else None
+            record = session.get(
+                cls.MODEL, record_id, options=[undefer_group(HEAVY_COLUMNS_GROUP)]
+            )
             return expunge_instance(record, session)
 
     @classmethod
-    def get_all(cls, limit: int = 1000) -> List[Dict[str, Any]]:
+    def get_all(
+        cls,
+        limit: int = 1000,
+        as_dicts: bool = False,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Retrieves all records, with an optional limit.
+        With as_dicts=True the rows are serialized directly, without loading ORM instances.
+        With columns only those columns (plus the id) are selected, e.g. ["name"] for a list view.
         """
         with session_scope() as session:
-            instances = session.query(cls.MODEL).limit(limit).all()
+            if as_dicts or columns is not None:
+                return select_dicts(session, cls.MODEL, limit=limit, columns=columns)
+            instances = (
+                session.query(cls.MODEL)
+                .options(undefer_group(HEAVY_COLUMNS_GROUP))
+                .limit(limit)
+                .all()
+            )
             return expunge_all(instances, session)
 
     @classmethod
     def get_all_by(
-        cls, pattern: Dict[str, Any], limit: int = 1000
+        cls,
+        pattern: Dict[str, Any],
+        limit: int = 1000,
+        as_dicts: bool = False,
+        columns: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         with session_scope() as session:
-            query = session.query(cls.MODEL)
+            if as_dicts or columns is not None:
+                return select_dicts(
+                    session, cls.MODEL, pattern=pattern, limit=limit, columns=columns
+                )
+            query = session.query(cls.MODEL).options(
+                undefer_group(HEAVY_COLUMNS_GROUP)
+            )
             for key, value in pattern.items():
                 query = query.filter(getattr(cls.MODEL, key) == value)
             instances = query.limit(limit).all()
             return expunge_all(instances, session)
 
     @classmethod
-    def get_first_by(cls, pattern: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def get_page(
+        cls,
+        pattern: Optional[Dict[str, Any]] = None,
+        after_id: Optional[int] = None,
+        page_size: int = 100,
+        order_by: str = "id",
+        columns: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Returns one page of records (as dicts) after the record with id after_id and
+        the cursor for the next page (None on the last page). See select_page.
+        """
         with session_scope() as session:
-            query = session.query(cls.MODEL)
+            return select_page(
+                session,
+                cls.MODEL,
+                pattern=pattern,
+                after_id=after_id,
+                page_size=page_size,
+                order_by=order_by,
+                columns=columns,
+            )
+
+    @classmethod
+    def iter_all(
+        cls,
+        pattern: Optional[Dict[str, Any]] = None,
+        batch_size: int = 500,
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streams all matching records (as dicts) in id order, batch_size rows at a time.
+        Every batch is read in its own short session (keyset on id, rows fetched with yield_per),
+        so memory stays flat and no read transaction is held open between batches.
+        """
+        projection = get_model_metadata(cls.MODEL).projection(columns)
+        after_id: Optional[int] = None
+        while True:
+            with session_scope() as session:
+                stmt = filter_by_pattern(
+                    select(*projection.columns), cls.MODEL, pattern
+                )
+                if after_id is not None:
+                    stmt = stmt.where(cls.MODEL.id > after_id)
+                stmt = (
+                    stmt.order_by(cls.MODEL.id)
+                    .limit(batch_size)
+                    .execution_options(yield_per=batch_size)
+                )
+                batch = [projection.to_dict(row) for row in session.execute(stmt)]
+                document_store.load_raw_texts(session, cls.MODEL, batch)
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            after_id = batch[-1]["id"]
+
+    @classmethod
+    def get_first_by(
+        cls, pattern: Dict[str, Any], include_deleted: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves the first record matching the pattern (column name -> value).
+        include_deleted also finds soft-deleted records.
+        """
+        with session_scope() as session:
+            query = (
+                session.query(cls.MODEL)
+                .options(undefer_group(HEAVY_COLUMNS_GROUP))
+                .execution_options(**{INCLUDE_DELETED: include_deleted})
+            )
             for key, value in pattern.items():
                 query = query.filter(getattr(cls.MODEL, key) == value)
             instance = query.first()
             return expunge_instance(instance, session)
 
     @classmethod
-    def get_by_id_with_relations(cls, record_id: int) -> Optional[Dict[str, Any]]:
+    def get_by_id_with_relations(
+        cls,
+        record_id: int,
+        include: Optional[List[str]] = None,
+        depth: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
-        Retrieves a record by ID with all related objects loaded (eager loading).
+        Retrieves a record by ID with its related objects loaded (eager loading).
+        include (dotted relationship paths) or depth restrict the loaded relationships.
         """
         with session_scope() as session:
-            return get_record_with_relations(session, cls.MODEL, record_id)
+            return get_record_with_relations(
+                session, cls.MODEL, record_id, include=include, depth=depth
+            )
+
+    @classmethod
+    def get_many_with_relations(
+        cls,
+        record_ids: List[int],
+        include: Optional[List[str]] = None,
+        depth: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves the records with their related objects, set-based in batches.
+        """
+        with session_scope() as session:
+            return get_records_with_relations(
+                session, cls.MODEL, record_ids, include=include, depth=depth
+            )
 
     @classmethod
     def update(
@@ -753,27 +1521,75 @@ class BaseService:
             return expunge_instance(instance, session)
 
     @classmethod
-    def delete(cls, record_id: int, deleted_by: str = "system") -> bool:
+    def delete(
+        cls,
+        record_id: int,
+        deleted_by: str = "system",
+        soft_delete: Optional[bool] = None,
+    ) -> bool:
         """
-        Deletes a record by its ID (hard delete). Prior to deletion, a history entry is created.
+        Deletes a record by its ID. Prior to deletion, a history entry is created.
+        Models with a deleted_at column (SoftDeleteMixin) are soft deleted by default,
+        soft_delete=False deletes the row (also an already soft-deleted one).
         """
+        if soft_delete is None:
+            soft_delete = cls.supports_soft_delete()
+        elif soft_delete and not cls.supports_soft_delete():
+            raise ValueError(f"{cls.MODEL.__name__} does not support soft delete")
         with session_scope() as session:
-            instance = session.get(cls.MODEL, record_id)
+            instance = session.get(
+                cls.MODEL,
+                record_id,
+                execution_options={INCLUDE_DELETED: not soft_delete},
+            )
             if not instance:
                 service_logger.error(
                     f"{cls.MODEL.__name__} with ID={record_id} not found."
                 )
                 return False
 
-            description = f"Deleted {cls.MODEL.__name__} with ID={record_id}"
+            if soft_delete:
+                description = f"Soft deleted {cls.MODEL.__name__} with ID={record_id}"
+                instance.deleted_at = datetime.utcnow()
+            else:
+                description = f"Deleted {cls.MODEL.__name__} with ID={record_id}"
+                session.delete(instance)
             create_history_entry(
                 session, cls.HISTORY_TYPE, record_id, description, created_by=deleted_by
             )
-            session.delete(instance)
             session.commit()
             service_logger.info(description)
             return True
 
+    @classmethod
+    def restore(cls, record_id: int, restored_by: str = "system") -> bool:
+        """
+        Restores a soft-deleted record. Returns False if there is no such record.
+        """
+        if not cls.supports_soft_delete():
+            raise ValueError(f"{cls.MODEL.__name__} does not support soft delete")
+        with session_scope() as session:
+            instance = session.get(
+                cls.MODEL, record_id, execution_options={INCLUDE_DELETED: True}
+            )
+            if not instance or instance.deleted_at is None:
+                service_logger.error(
+                    f"Soft deleted {cls.MODEL.__name__} with ID={record_id} not found."
+                )
+                return False
+            instance.deleted_at = None
+            description = f"Restored {cls.MODEL.__name__} with ID={record_id}"
+            create_history_entry(
+                session, cls.HISTORY_TYPE, record_id, description, created_by=restored_by
+            )
+            session.commit()
+            service_logger.info(description)
+            return True
+
+    @classmethod
+    def supports_soft_delete(cls) -> bool:
+        return issubclass(cls.MODEL, SoftDeleteMixin)
+
 
 # ------------------------------------------------------------
 # Specific Service Classes per Model
@@ -815,6 +1631,21 @@ class SkillService(BaseService):
     HISTORY_TYPE = None
     DOCUMENT_TYPE = None
 
+    @classmethod
+    def canonical_names(cls, names: List[str]) -> List[str]:
+        """
+        The canonical skill names of the given ones (aliases resolved, duplicates
+        removed), see skill_aliases.py.
+        """
+        with session_scope() as session:
+            return canonical_skill_names(session, names)
+
+
+class SkillAliasService(BaseService):
+    MODEL = SkillAliasModel
+    HISTORY_TYPE = None
+    DOCUMENT_TYPE = None
+
 
 class CapabilitiesService(BaseService):
     MODEL = CapabilitiesModel
@@ -869,6 +1700,46 @@ class RFPService(BaseService):
     HISTORY_TYPE = HistoryType.RFP
     DOCUMENT_TYPE = DocumentRelatedType.RFP
 
+    @classmethod
+    def get_all_requiring(
+        cls, requirements: List[str], limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves the RFPs (as dicts) whose must-have requirements contain all given
+        requirements (exact entries). Uses the GIN index on PostgreSQL.
+        """
+        with session_scope() as session:
+            projection = get_model_metadata(RFPModel).projection()
+            stmt = (
+                select(*projection.columns)
+                .where(
+                    json_array_contains(
+                        RFPModel.must_have_requirements,
+                        requirements,
+                        session.get_bind().dialect.name,
+                    )
+                )
+                .limit(limit)
+            )
+            return [projection.to_dict(row) for row in session.execute(stmt)]
+
+    @classmethod
+    def archive_stale(
+        cls, max_age_days: int = DEFAULT_MAX_AGE_DAYS, archived_by: str = "system"
+    ) -> int:
+        """
+        Moves the RFPs past their end date or older than max_age_days to the archive
+        table, except offered RFPs and RFPs with an open project (see archive.py).
+        Returns the number of archived RFPs.
+        """
+        with session_scope() as session:
+            count = archive_rfps(
+                session, max_age_days=max_age_days, archived_by=archived_by
+            )
+            session.commit()
+        service_logger.info(f"Archived {count} RFPs")
+        return count
+
 
 class ProjectService(BaseService):
     MODEL = ProjectModel
@@ -900,6 +1771,74 @@ class OfferService(BaseService):
     DOCUMENT_TYPE = DocumentRelatedType.OFFER
 
 
+class MatchingService(BaseService):
+    """
+    Persisted RFP x freelancer matching scores, see matching.py.
+    """
+
+    MODEL = MatchingScoreModel
+
+    @classmethod
+    def refresh(
+        cls,
+        rfp_ids: Optional[List[int]] = None,
+        freelancer_ids: Optional[List[int]] = None,
+        force: bool = False,
+    ) -> RefreshResult:
+        """
+        Recomputes the scores of the given (default: all new) RFPs x the given
+        (default: all) freelancers whose inputs changed since they were scored.
+        """
+        with session_scope() as session:
+            result = refresh_matching_scores(
+                session, rfp_ids=rfp_ids, freelancer_ids=freelancer_ids, force=force
+            )
+            session.commit()
+        service_logger.info(
+            f"Refreshed matching scores: {result.created} created, "
+            f"{result.updated} updated, {result.unchanged} unchanged"
+        )
+        return result
+
+    @classmethod
+    def get_matches(
+        cls,
+        freelancer_id: int,
+        status: Optional[RFPStatus] = RFPStatus.NEW,
+        min_score: float = 0.0,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        The stored scores of a freelancer for the live RFPs (with the given status),
+        best first: one query on idx_matching_freelancer_score.
+        """
+        with session_scope() as session:
+            stmt = (
+                select(
+                    MatchingScoreModel.rfp_id,
+                    MatchingScoreModel.freelancer_id,
+                    MatchingScoreModel.matching_score,
+                    MatchingScoreModel.skill_score,
+                    MatchingScoreModel.price_score,
+                    MatchingScoreModel.match_details,
+                    MatchingScoreModel.matched_at,
+                )
+                .join(RFPModel, RFPModel.id == MatchingScoreModel.rfp_id)
+                .where(
+                    MatchingScoreModel.freelancer_id == freelancer_id,
+                    MatchingScoreModel.matching_score >= min_score,
+                )
+                .order_by(
+                    MatchingScoreModel.matching_score.desc(),
+                    MatchingScoreModel.rfp_id,
+                )
+                .limit(limit)
+            )
+            if status is not None:
+                stmt = stmt.where(RFPModel.status == status)
+            return [row._asdict() for row in session.execute(stmt)]
+
+
 # ------------------------------------------------------------
 # Additional Read and Transform Services
 # ------------------------------------------------------------
@@ -917,6 +1856,7 @@ class ReadService:
         with session_scope() as session:
             docs = (
                 session.query(DocumentModel)
+                .options(undefer_group(HEAVY_COLUMNS_GROUP))
                 .filter_by(related_type=related_type, related_id=record_id)
                 .all()
             )
@@ -970,6 +1910,7 @@ class ReadService:
             try:
                 cv = (
                     session.query(CVModel)
+                    .options(undefer_group(HEAVY_COLUMNS_GROUP))
                     .filter_by(freelancer_id=freelancer_id)
                     .first()
                 )
@@ -1052,8 +1993,15 @@ class ReadService:
                         f"If matching for {source}, argument '{field_name}' must not be None"
                     )
 
-            # Use the validated dictionary as query parameters
-            return RFPService.get_first_by(pattern=required_fields)
+            # Use the validated dictionary as query parameters. Soft-deleted and
+            # archived RFPs count as well, they must not be imported again.
+            record = RFPService.get_first_by(
+                pattern=required_fields, include_deleted=True
+            )
+            if record is None:
+                with session_scope() as session:
+                    record = find_archived_rfp(session, required_fields)
+            return record
         except Exception as error:
             service_logger.error(
                 f"Error retrieving RFP record for source: {source}, query: {required_fields}. Exception: {error}"
@@ -1062,6 +2010,101 @@ class ReadService:
             raise error  # do not hide critical exceptions here
 
 
+class SearchService:
+    """
+    Full-text search over RFPs, projects and CVs, backed by the FTS5 indexes of
+    search_index (BM25 ranking, snippets). Other databases fall back to LIKE matching.
+    """
+
+    MODELS: Dict[str, Any] = {"rfps": RFPModel, "projects": ProjectModel, "cvs": CVModel}
+
+    @classmethod
+    def search(
+        cls,
+        text: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 50,
+        tables: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Searches the indexed tables (default: all) for records containing all words of
+        text (prefix match, case and diacritics insensitive).
+        filters are equality conditions (column name -> value) on the searched tables,
+        usually given together with a single table, e.g. filters={"status": RFPStatus.NEW},
+        tables=["rfps"]; tables without one of the filter columns are skipped.
+
+        Returns:
+            List[Dict[str, Any]]: At most limit results, best first, each with table, id,
+            title, snippet (matches in **bold**) and rank (BM25, lower is better).
+        """
+        query = match_query(text or "")
+        if not query:
+            return []
+        results: List[Dict[str, Any]] = []
+        with session_scope() as session:
+            use_fts = session.get_bind().dialect.name == "sqlite"
+            for table_name in tables or list(SEARCH_INDEXES):
+                model = cls.MODELS[table_name]
+                if any(key not in model.__table__.c for key in filters or {}):
+                    continue
+                if use_fts:
+                    stmt = cls._fts_select(model, query)
+                else:
+                    stmt = cls._like_select(model, text)
+                stmt = filter_by_pattern(stmt, model, filters).limit(limit)
+                results.extend(
+                    {"table": table_name, **row._asdict()}
+                    for row in session.execute(stmt)
+                )
+        results.sort(key=lambda result: result["rank"])
+        return results[:limit]
+
+    @staticmethod
+    def _fts_select(model: Any, query: str) -> Select:
+        table_name = model.__tablename__
+        columns = SEARCH_INDEXES[table_name]
+        fts = fts_table(table_name)
+        weights = ", ".join([str(TITLE_WEIGHT)] + ["1.0"] * (len(columns) - 1))
+        rank = literal_column(f"bm25({fts}, {weights})")
+        fts_rows = table(fts, column("rowid"))
+        return (
+            select(
+                model.id,
+                getattr(model, columns[0]).label("title"),
+                literal_column(f"snippet({fts}, -1, '**', '**', ' … ', 16)").label(
+                    "snippet"
+                ),
+                rank.label("rank"),
+            )
+            .select_from(model.__table__.join(fts_rows, fts_rows.c.rowid == model.id))
+            .where(literal_column(fts).op("MATCH")(query))
+            .order_by(rank)
+        )
+
+    @staticmethod
+    def _like_select(model: Any, text: str) -> Select:
+        columns = [
+            # JSON(B) columns have no LIKE operator on PostgreSQL
+            col if isinstance(col.type, String) else cast(col, String)
+            for col in (
+                getattr(model, name) for name in SEARCH_INDEXES[model.__tablename__]
+            )
+        ]
+        words = re.findall(r"\w+", text)
+        return (
+            select(
+                model.id,
+                columns[0].label("title"),
+                literal_column("NULL").label("snippet"),
+                literal_column("0").label("rank"),
+            )
+            .where(
+                *[or_(*[col.ilike(f"%{word}%") for col in columns]) for word in words]
+            )
+            .order_by(model.id.desc())
+        )
+
+
 class TransformService:
     """
     Provides helper functions for transforming data, such as date parsing and converting lists to text.
@@ -1071,14 +2114,14 @@ class TransformService:
     def parse_date(cls, date_str: str) -> Optional[Any]:
         """
         Parses a date string (formats like "dd.mm.yyyy" or "mm.yyyy") and returns a date object.
+        Slash dates are read day first, "03/04/2025" is the 3rd of April.
         """
         if not date_str:
             return None
-        try:
-            return parser.parse(date_str, dayfirst=True).date()
-        except Exception as e:
-            service_logger.error(f"Error parsing date '{date_str}': {e}")
-            return None
+        parsed = parse_date(date_str, day_first=True)
+        if parsed is None:
+            service_logger.error(f"Error parsing date '{date_str}'")
+        return parsed
 
     @classmethod
     def convert_list_to_text(cls, lst: List[str]) -> str:
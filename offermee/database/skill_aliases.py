@@ -0,0 +1,231 @@
+"""
+Canonical skill IDs.
+
+Every skill name resolves to one canonical skill (a SkillModel row, its ID is the
+canonical skill ID) through a compiled alias map: the builtin aliases of
+skill_normalizer.py, the skill_aliases table (which overrides them) and the
+normalized names of the skills themselves. Of several skills with the same
+canonical key (e.g. "C#" and "c sharp" rows of older databases) the one named
+like the key wins, otherwise the oldest.
+
+The IDs are assigned at ingestion:
+- CVs: save_cv_to_db stores the canonical names of the tech skills
+  (canonical_skill_names), so aliases link the existing skill row.
+- RFPs: the must_have_skill_ids / nice_to_have_skill_ids columns are set on
+  every flush of a new RFP or changed requirements (None where unknown).
+A commit adding, renaming or deleting skills or aliases re-assigns the IDs of the
+RFPs whose requirements they may resolve (skill_index.py, same transaction).
+The matching then compares these integer sets and falls back to fuzzy scoring.
+
+The compiled map is cached per engine and recompiled after a commit that
+changed skills or aliases (inside that transaction it is compiled per call).
+Core writes to skills or skill_aliases must call clear_alias_cache().
+"""
+
+from typing import Dict, Iterable, List, Optional, Union
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import (
+    Connection,
+    Engine,
+    bindparam,
+    event,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from offermee.database.models.main_models import (
+    RFPModel,
+    SkillAliasModel,
+    SkillModel,
+)
+from offermee.matcher.skill_normalizer import SkillAliasMap, normalize_skill
+
+_CHANGED_KEY = "skill_aliases_changed"
+
+Executor = Union[Session, Connection]
+
+
+class CompiledSkillAliases:
+    """
+    Skill name -> canonical skill ID and name, one dict lookup per name.
+    """
+
+    def __init__(self, alias_map: SkillAliasMap, skills: Iterable[tuple]):
+        """
+        :param alias_map: The compiled aliases.
+        :param skills: (id, name) of all skills, ordered by id.
+        """
+        self.alias_map = alias_map
+        self.ids: Dict[str, int] = {}
+        self.names: Dict[int, str] = {}
+        for skill_id, name in skills:
+            key = alias_map.canonical_key(name)
+            named_like_key = normalize_skill(name) == key
+            current = self.ids.get(key)
+            if current is None or (
+                named_like_key and normalize_skill(self.names[current]) != key
+            ):
+                self.ids[key] = skill_id
+                self.names[skill_id] = name
+
+    def skill_id(self, name: str) -> Optional[int]:
+        if not isinstance(name, str) or not name.strip():
+            return None
+        return self.ids.get(self.alias_map.canonical_key(name))
+
+    def skill_ids(self, names: Iterable[str]) -> List[Optional[int]]:
+        return [self.skill_id(name) for name in names or []]
+
+    def canonical_name(self, name: str) -> str:
+        """
+        The name of the canonical skill, the canonical alias name for unknown ones.
+        """
+        skill_id = self.skill_id(name)
+        if skill_id is not None:
+            return self.names[skill_id]
+        return self.alias_map.canonical_name(name)
+
+
+def compile_aliases(executor: Executor) -> CompiledSkillAliases:
+    """
+    Compiles the alias map of the database (two queries).
+    """
+    aliases: Dict[str, List[str]] = {}
+    rows = executor.execute(
+        select(SkillModel.__table__.c.name, SkillAliasModel.__table__.c.alias).join(
+            SkillModel.__table__,
+            SkillModel.__table__.c.id == SkillAliasModel.__table__.c.skill_id,
+        )
+    )
+    for name, alias in rows:
+        aliases.setdefault(name, []).append(alias)
+    skills = executor.execute(
+        select(SkillModel.__table__.c.id, SkillModel.__table__.c.name).order_by(
+            SkillModel.__table__.c.id
+        )
+    ).all()
+    return CompiledSkillAliases(SkillAliasMap(aliases), skills)
+
+
+_compiled: "WeakKeyDictionary[Engine, CompiledSkillAliases]" = WeakKeyDictionary()
+
+
+def _engine_of(session: Session) -> Engine:
+    bind = session.get_bind()
+    return bind.engine if isinstance(bind, Connection) else bind
+
+
+def compiled_aliases(session: Session) -> CompiledSkillAliases:
+    """
+    The cached alias map of the session's database.
+    """
+    if session.info.get(_CHANGED_KEY):
+        return compile_aliases(session)  # uncommitted skill or alias changes
+    engine = _engine_of(session)
+    aliases = _compiled.get(engine)
+    if aliases is None:
+        aliases = _compiled[engine] = compile_aliases(session)
+    return aliases
+
+
+def clear_alias_cache() -> None:
+    _compiled.clear()
+
+
+def canonical_skill_names(session: Session, names: Iterable[str]) -> List[str]:
+    """
+    The canonical names of the skills, duplicates (after resolving) removed.
+    """
+    aliases = compiled_aliases(session)
+    canonical = (
+        aliases.canonical_name(name)
+        for name in names or []
+        if isinstance(name, str) and name.strip()
+    )
+    return list(dict.fromkeys(canonical))
+
+
+def assign_rfp_skill_ids(
+    executor: Executor, rfp_ids: Optional[Iterable[int]] = None
+) -> int:
+    """
+    (Re-)assigns the canonical skill IDs of the given (default: all) RFPs, e.g.
+    after new skills or aliases resolve requirements that were unknown before.
+    Returns the number of RFPs.
+    """
+    aliases = compile_aliases(executor)
+    rfps = RFPModel.__table__
+    stmt = select(
+        rfps.c.id, rfps.c.must_have_requirements, rfps.c.nice_to_have_requirements
+    )
+    if rfp_ids is not None:
+        stmt = stmt.where(rfps.c.id.in_(list(rfp_ids)))
+    rows = [
+        {
+            "rfp_id": row.id,
+            "must_ids": aliases.skill_ids(row.must_have_requirements),
+            "nice_ids": aliases.skill_ids(row.nice_to_have_requirements),
+        }
+        for row in executor.execute(stmt)
+    ]
+    if rows:
+        executor.execute(
+            update(rfps)
+            .where(rfps.c.id == bindparam("rfp_id"))
+            .values(
+                must_have_skill_ids=bindparam("must_ids"),
+                nice_to_have_skill_ids=bindparam("nice_ids"),
+            ),
+            rows,
+        )
+    return len(rows)
+
+
+def _requirements_changed(rfp: RFPModel) -> bool:
+    state = inspect(rfp)
+    return any(
+        state.attrs[key].history.has_changes()
+        for key in ("must_have_requirements", "nice_to_have_requirements")
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _assign_skill_ids(session: Session, flush_context, instances) -> None:
+    rfps = []
+    for instance in session.new | session.dirty:
+        if isinstance(instance, SkillAliasModel) and instance.alias:
+            instance.alias = normalize_skill(instance.alias)
+        elif isinstance(instance, RFPModel) and (
+            instance in session.new or _requirements_changed(instance)
+        ):
+            rfps.append(instance)
+    if not rfps:
+        return
+    with session.no_autoflush:
+        aliases = compiled_aliases(session)
+    for rfp in rfps:
+        rfp.must_have_skill_ids = aliases.skill_ids(rfp.must_have_requirements)
+        rfp.nice_to_have_skill_ids = aliases.skill_ids(rfp.nice_to_have_requirements)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_alias_changes(session: Session, flush_context) -> None:
+    if any(
+        isinstance(instance, (SkillModel, SkillAliasModel))
+        for instance in session.new | session.dirty | session.deleted
+    ):
+        session.info[_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _recompile_aliases(session: Session) -> None:
+    if session.info.pop(_CHANGED_KEY, None):
+        _compiled.pop(_engine_of(session), None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_alias_changes(session: Session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
@@ -0,0 +1,312 @@
+"""
+Inverted skill index for candidate pruning.
+
+The skill_index table maps every index term (see skill_terms: the words of a
+normalized skill and their character trigrams) to the RFPs whose must-have or
+nice-to-have requirements contain it and to the capabilities whose tech skills
+(SkillModel names) contain it. Canonical skill IDs (skill_aliases.py) are indexed
+as "#<id>" terms. candidate_pairs() returns the RFP x capabilities pairs sharing
+a term; the matching scores only those, all other pairs get a skill score of 0
+(see SkillMatchEngine prune for the trade-off).
+
+The index is maintained on every ORM flush: RFPs and capabilities that are
+created, deleted or change their requirements / tech skills, and capabilities of
+renamed skills, are collected after the flush and re-indexed from the database
+before the commit, in the same transaction. Skills and aliases that are added,
+renamed or deleted change how skill names resolve: the RFPs and capabilities
+indexed with a word of the affected names get their canonical skill IDs
+re-assigned (assign_rfp_skill_ids) and are re-indexed in the same step.
+Existing databases are indexed by migration 8 (rebuild_skill_index).
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple, Union
+
+from fuzzywuzzy import utils as fuzz_utils
+from sqlalchemy import Connection, delete, event, insert, inspect, select
+from sqlalchemy.orm import Session
+
+from offermee.database.models.main_models import (
+    CapabilitiesModel,
+    RFPModel,
+    SkillAliasModel,
+    SkillModel,
+    skill_index,
+    tech_skills_table,
+)
+from offermee.database.skill_aliases import (
+    CompiledSkillAliases,
+    assign_rfp_skill_ids,
+    compile_aliases,
+    compiled_aliases,
+)
+from offermee.matcher.skill_match_engine import skill_terms
+from offermee.matcher.skill_normalizer import normalize_skill
+
+RFP_OWNER = "rfp"
+CAPABILITIES_OWNER = "capabilities"
+_PENDING_KEY = "skill_index_pending"
+_CHUNK_SIZE = 500
+
+Executor = Union[Session, Connection]
+
+
+def _chunks(ids: Iterable[int]) -> Iterable[List[int]]:
+    ids = sorted(set(ids))
+    for start in range(0, len(ids), _CHUNK_SIZE):
+        yield ids[start : start + _CHUNK_SIZE]
+
+
+def _terms(skills: Iterable[str]) -> Set[str]:
+    terms: Set[str] = set()
+    for skill in skills:
+        if isinstance(skill, str):
+            terms |= skill_terms(skill)
+    return terms
+
+
+def skill_id_term(skill_id: int) -> str:
+    """
+    The index term of a canonical skill ID, "#" never occurs in skill_terms.
+    """
+    return f"#{skill_id}"
+
+
+def rfp_terms(executor: Executor, rfp_ids: List[int]) -> Dict[int, Set[str]]:
+    rfps = RFPModel.__table__
+    rows = executor.execute(
+        select(
+            rfps.c.id,
+            rfps.c.must_have_requirements,
+            rfps.c.nice_to_have_requirements,
+            rfps.c.must_have_skill_ids,
+            rfps.c.nice_to_have_skill_ids,
+        ).where(rfps.c.id.in_(rfp_ids))
+    )
+    terms: Dict[int, Set[str]] = {}
+    for row in rows:
+        skill_ids = (row.must_have_skill_ids or []) + (row.nice_to_have_skill_ids or [])
+        terms[row.id] = _terms(
+            (row.must_have_requirements or []) + (row.nice_to_have_requirements or [])
+        ) | {skill_id_term(id_) for id_ in skill_ids if id_ is not None}
+    return terms
+
+
+def capabilities_terms(
+    executor: Executor, capabilities_ids: List[int]
+) -> Dict[int, Set[str]]:
+    skills: Dict[int, List[str]] = {id_: [] for id_ in capabilities_ids}
+    rows = executor.execute(
+        select(tech_skills_table.c.capabilities_id, SkillModel.__table__.c.name)
+        .join(
+            SkillModel.__table__,
+            SkillModel.__table__.c.id == tech_skills_table.c.skill_id,
+        )
+        .where(tech_skills_table.c.capabilities_id.in_(capabilities_ids))
+    )
+    for capabilities_id, name in rows:
+        skills[capabilities_id].append(name)
+    aliases = (
+        compiled_aliases(executor)
+        if isinstance(executor, Session)
+        else compile_aliases(executor)
+    )
+    return {
+        id_: _terms(names)
+        | {
+            skill_id_term(skill_id)
+            for skill_id in aliases.skill_ids(names)
+            if skill_id is not None
+        }
+        for id_, names in skills.items()
+    }
+
+
+def index_owners(executor: Executor, owner_type: str, owner_ids: Iterable[int]) -> int:
+    """
+    Replaces the index entries of the given RFPs or capabilities by the terms of
+    their current skills; owners that no longer exist lose their entries.
+    Returns the number of written entries.
+    """
+    load = rfp_terms if owner_type == RFP_OWNER else capabilities_terms
+    written = 0
+    for chunk in _chunks(owner_ids):
+        executor.execute(
+            delete(skill_index).where(
+                skill_index.c.owner_type == owner_type,
+                skill_index.c.owner_id.in_(chunk),
+            )
+        )
+        rows = [
+            {"term": term, "owner_type": owner_type, "owner_id": owner_id}
+            for owner_id, terms in load(executor, chunk).items()
+            for term in sorted(terms)
+        ]
+        if rows:
+            executor.execute(insert(skill_index), rows)
+        written += len(rows)
+    return written
+
+
+def rebuild_skill_index(executor: Executor) -> int:
+    """
+    Indexes all RFPs (soft-deleted ones included) and capabilities from scratch.
+    """
+    executor.execute(delete(skill_index))
+    rfp_ids = executor.execute(select(RFPModel.__table__.c.id)).scalars().all()
+    capabilities_ids = (
+        executor.execute(select(CapabilitiesModel.__table__.c.id)).scalars().all()
+    )
+    return index_owners(executor, RFP_OWNER, rfp_ids) + index_owners(
+        executor, CAPABILITIES_OWNER, capabilities_ids
+    )
+
+
+def candidate_pairs(
+    executor: Executor, rfp_ids: Iterable[int], capabilities_ids: Iterable[int]
+) -> Set[Tuple[int, int]]:
+    """
+    The (rfp_id, capabilities_id) pairs of the given RFPs and capabilities sharing
+    at least one index term.
+    """
+    capabilities_ids = sorted(set(capabilities_ids))
+    if not capabilities_ids:
+        return set()
+    rfp_terms = skill_index.alias("rfp_terms")
+    skill_terms_ = skill_index.alias("skill_terms")
+    pairs: Set[Tuple[int, int]] = set()
+    for chunk in _chunks(rfp_ids):
+        stmt = (
+            select(rfp_terms.c.owner_id, skill_terms_.c.owner_id)
+            .distinct()
+            .join(
+                skill_terms_,
+                (skill_terms_.c.term == rfp_terms.c.term)
+                & (skill_terms_.c.owner_type == CAPABILITIES_OWNER),
+            )
+            .where(
+                rfp_terms.c.owner_type == RFP_OWNER,
+                rfp_terms.c.owner_id.in_(chunk),
+                skill_terms_.c.owner_id.in_(capabilities_ids),
+            )
+        )
+        pairs.update((row[0], row[1]) for row in executor.execute(stmt))
+    return pairs
+
+
+def owners_of_names(
+    executor: Executor, aliases: CompiledSkillAliases, names: Iterable[str]
+) -> Dict[str, Set[int]]:
+    """
+    The RFPs and capabilities whose skills may resolve to the given skill names or
+    aliases, or to the skills they name: the owners indexed with a word of any
+    alias of those skills. Returns {owner_type: owner IDs}.
+    """
+    keys = {normalize_skill(name) for name in names if name}
+    keys |= {aliases.alias_map.canonical_key(key) for key in keys}
+    keys |= {
+        lookup
+        for lookup, canonical in aliases.alias_map.lookup.items()
+        if canonical in keys
+    }
+    words = sorted(
+        {word for key in keys for word in fuzz_utils.full_process(key).split()}
+    )
+    owners: Dict[str, Set[int]] = {RFP_OWNER: set(), CAPABILITIES_OWNER: set()}
+    for start in range(0, len(words), _CHUNK_SIZE):
+        rows = executor.execute(
+            select(skill_index.c.owner_type, skill_index.c.owner_id)
+            .distinct()
+            .where(skill_index.c.term.in_(words[start : start + _CHUNK_SIZE]))
+        )
+        for owner_type, owner_id in rows:
+            owners[owner_type].add(owner_id)
+    return owners
+
+
+def _changed(instance, *keys: str) -> bool:
+    state = inspect(instance)
+    return any(state.attrs[key].history.has_changes() for key in keys)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_owners(session: Session, flush_context) -> None:
+    pending = session.info.setdefault(
+        _PENDING_KEY,
+        {RFP_OWNER: set(), CAPABILITIES_OWNER: set(), "skills": set(), "names": set()},
+    )
+    for instance in session.new | session.dirty | session.deleted:
+        is_new = instance in session.new
+        if isinstance(instance, RFPModel):
+            if is_new or instance in session.deleted or _changed(
+                instance, "must_have_requirements", "nice_to_have_requirements"
+            ):
+                pending[RFP_OWNER].add(instance.id)
+        elif isinstance(instance, CapabilitiesModel):
+            if is_new or instance in session.deleted or _changed(
+                instance, "tech_skills"
+            ):
+                pending[CAPABILITIES_OWNER].add(instance.id)
+        elif isinstance(instance, SkillModel):
+            if is_new or instance in session.deleted:
+                pending["names"].add(instance.name)
+            elif _changed(instance, "name"):
+                pending["skills"].add(instance.id)
+                pending["names"].update(_names(instance, "name"))
+        elif isinstance(instance, SkillAliasModel):
+            if is_new or instance in session.deleted:
+                pending["names"].add(instance.alias)
+            elif _changed(instance, "alias", "skill_id"):
+                pending["names"].update(_names(instance, "alias"))
+
+
+@event.listens_for(Session, "before_commit")
+def _index_changed_owners(session: Session) -> None:
+    # the commit flushes after this event, changes still pending are indexed now
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or not any(pending.values()):
+        return
+    capabilities_ids = set(pending[CAPABILITIES_OWNER])
+    if pending["skills"]:
+        capabilities_ids.update(
+            session.execute(
+                select(tech_skills_table.c.capabilities_id).where(
+                    tech_skills_table.c.skill_id.in_(pending["skills"])
+                )
+            ).scalars()
+        )
+    rfp_ids = set(pending[RFP_OWNER])
+    if pending["names"]:
+        # new, renamed or deleted skills and aliases: skill names may resolve to
+        # other canonical skill IDs now
+        owners = owners_of_names(session, compile_aliases(session), pending["names"])
+        rfp_ids |= owners[RFP_OWNER]
+        capabilities_ids |= owners[CAPABILITIES_OWNER]
+        if rfp_ids:
+            assign_rfp_skill_ids(session, rfp_ids)
+            _expire_skill_ids(session, rfp_ids)
+    index_owners(session, RFP_OWNER, rfp_ids)
+    index_owners(session, CAPABILITIES_OWNER, capabilities_ids)
+
+
+def _names(instance, key: str) -> Set[str]:
+    # the current and the former value of a renamed skill or alias
+    history = inspect(instance).attrs[key].history
+    return {
+        name
+        for name in (*history.added, *history.deleted, getattr(instance, key))
+        if isinstance(name, str)
+    }
+
+
+def _expire_skill_ids(session: Session, rfp_ids: Set[int]) -> None:
+    # assign_rfp_skill_ids writes with Core, loaded RFPs must read the new IDs
+    for instance in list(session.identity_map.values()):
+        if isinstance(instance, RFPModel) and instance.id in rfp_ids:
+            session.expire(instance, ["must_have_skill_ids", "nice_to_have_skill_ids"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_owners(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
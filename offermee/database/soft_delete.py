@@ -0,0 +1,33 @@
+"""
+Soft delete for models with the SoftDeleteMixin.
+
+Deleting such a record only sets deleted_at. Every ORM select (queries, session.get,
+relationship loads) gets the criterion deleted_at IS NULL added, so soft-deleted
+rows are invisible to the application. Statements executed with the execution
+option include_deleted=True (see INCLUDE_DELETED) see them, e.g. to restore a
+record or to skip already imported RFPs.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from offermee.database.models.main_models import SoftDeleteMixin
+
+INCLUDE_DELETED = "include_deleted"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _hide_deleted_rows(execute_state: ORMExecuteState) -> None:
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        return
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(
+            SoftDeleteMixin,
+            lambda cls: cls.deleted_at.is_(None),
+            include_aliases=True,
+        )
+    )
@@ -1,29 +1,13 @@
-from datetime import datetime
-from dateutil import parser
-
 from offermee.database.models.main_models import ProjectModel, ProjectStatus, RFPModel
+from offermee.utils import date_parser
 
 
 def parse_date(date_str):
     """
-    Parse a date string in dd.mm.yyyy or mm.yyyy format to a datetime.date object.
+    Parse a date string (e.g. dd.mm.yyyy or mm.yyyy) to a datetime.date object.
     Returns None if input is None or cannot be parsed.
     """
-    if not date_str:
-        return None
-    try:
-        # Try parsing full date first
-        return datetime.strptime(date_str, "%d.%m.%Y").date()
-    except ValueError:
-        try:
-            # Try parsing month and year
-            return datetime.strptime(date_str, "%m.%Y").date()
-        except ValueError:
-            # Fallback using dateutil for more flexibility
-            try:
-                return parser.parse(date_str).date()
-            except Exception:
-                return None
+    return date_parser.parse_date(date_str) if date_str else None
 
 
 def db_to_json(project: ProjectModel) -> dict:
@@ -43,8 +43,9 @@ def db_model_to_json_schema(model: Type[DeclarativeMeta]) -> Dict[str, Any]:
         # Bei ColumnDefault/ScalarElementColumnDefault liegt der eigentliche Wert oft in `arg`
         arg = getattr(default_obj, "arg", default_obj)
         # Falls callable (z. B. datetime.utcnow) – Rückgabe als String-Repräsentation
+        # ohne Speicheradresse, damit das Schema bei jedem Lauf identisch ist
         if callable(arg):
-            return str(arg)
+            return f"<function {getattr(arg, '__qualname__', repr(arg))}>"
         # Falls es sich um ein Enum-Objekt handelt, den zugehörigen Wert zurückgeben
         if isinstance(arg, enum.Enum):
             return arg.value
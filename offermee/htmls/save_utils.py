@@ -1,7 +1,10 @@
 import os
+from datetime import datetime
+from typing import Optional
 from urllib.parse import urlparse
 import re
 
+from offermee.utils.blob_store import BlobStore
 from offermee.utils.config import Config
 from offermee.utils.logger import CentralLogger
 
@@ -13,35 +16,77 @@ def sanitize_filename(filename):
     return re.sub(r"[^\w\-]", "_", filename)
 
 
+HTML_INDEX_FILENAME = "index.tsv"
+
+
+def _latest_index_digest(index_path: str, filename: str) -> Optional[str]:
+    """Der zuletzt für filename vermerkte Hash der Indexdatei, None falls unbekannt."""
+    if not os.path.exists(index_path):
+        return None
+    digest = None
+    with open(index_path, encoding="utf-8") as f:
+        for line in f:
+            _, name, line_digest = line.rstrip("\n").split("\t")
+            if name == filename:
+                digest = line_digest
+    return digest
+
+
 def save_html(html, filename: str, folder: str = "./saved_html"):
     """
-    Speichert HTML-Inhalt auf der Festplatte im Anwender Verzeichnis ~/{folder}.
+    Speichert HTML-Inhalt lesbar als Datei ~/{folder}/{filename} und zusätzlich
+    komprimiert im Blob-Store (gleicher Inhalt nur einmal). Dateiname und Hash werden
+    in der Indexdatei ~/{folder}/index.tsv vermerkt, aber nur, wenn sich der Inhalt
+    unter diesem Dateinamen geändert hat.
 
     Args:
-        html (bytes): Der HTML-Inhalt als Bytes.
+        html (str | bytes): Der HTML-Inhalt.
         filename (str): Der Name der Datei.
         folder (str): Der Zielordner im Anwenderverzeichnis (Standard: "./saved_html").
+
+    Returns:
+        Optional[str]: Der SHA-256-Hash des Inhalts, None bei einem Fehler.
     """
     save_utils_logger.info(f"Saving html to '{filename}' (folder='~/{folder}') ...")
     try:
+        digest = BlobStore.get_instance().put(html)
 
         save_folder = os.path.join(Config.get_instance().get_user_data_dir(), folder)
         # Erstelle den Zielordner, falls er nicht existiert
         os.makedirs(save_folder, exist_ok=True)
 
-        # Vollständigen Pfad erstellen
+        # HTML-Inhalt lesbar in Datei speichern
         filepath = os.path.join(save_folder, filename)
+        if isinstance(html, bytes):
+            with open(filepath, "wb") as f:
+                f.write(html)
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(html)
 
-        # HTML-Inhalt in Datei speichern
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html)
-        save_utils_logger.info(f"Saved html to '{filepath}'")
-        return True
+        # Verweis anhängen, der letzte Eintrag eines Dateinamens gilt
+        index_path = os.path.join(save_folder, HTML_INDEX_FILENAME)
+        if _latest_index_digest(index_path, filename) != digest:
+            with open(index_path, "a", encoding="utf-8") as f:
+                f.write(f"{datetime.utcnow().isoformat()}\t{filename}\t{digest}\n")
+        save_utils_logger.info(f"Saved html to '{filepath}' (blob {digest})")
+        return digest
     except Exception as e:
         save_utils_logger.error(
             f"Error while saving html to '{filename}' (folder='~/{folder}'):{e}"
         )
-        return False
+        return None
+
+
+def load_html(filename: str, folder: str = "./saved_html") -> Optional[str]:
+    """
+    Liest den zuletzt unter filename gespeicherten HTML-Inhalt, None falls unbekannt.
+    """
+    index_path = os.path.join(
+        Config.get_instance().get_user_data_dir(), folder, HTML_INDEX_FILENAME
+    )
+    digest = _latest_index_digest(index_path, filename)
+    return BlobStore.get_instance().get_text(digest) if digest else None
 
 
 def generate_filename_from_url(url: str, extension: str = ".html") -> str:
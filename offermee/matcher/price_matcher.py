@@ -12,8 +12,14 @@ class PriceMatcher:
         Returns:
             float: Preis-Matching-Score (0-100).
         """
-        project_rate = project.hourly_rate
+        return PriceMatcher.match_rate(project.hourly_rate, freelancer_desired_rate)
 
+    @staticmethod
+    def match_rate(project_rate, freelancer_desired_rate):
+        """
+        Preis-Matching-Score (0-100) für einen Stundensatz, z.B. den max_hourly_rate
+        eines RFP.
+        """
         if project_rate == 0:
             return 50  # Neutraler Score, wenn kein Rate angegeben ist
 
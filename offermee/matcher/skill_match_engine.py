@@ -0,0 +1,403 @@
+"""
+Batched skill matching.
+
+SkillMatchEngine scores the requirements of many RFPs against the skills of many
+freelancers at once. The distinct normalized requirements and freelancer skills
+are compared in a single similarity matrix (partial_ratio, fuzzywuzzy once per
+distinct pair). Every RFP x freelancer score is then read from that matrix with
+NumPy, so a requirement shared by many RFPs is scored only once.
+
+Scores and per-skill details equal the former per-requirement process.extractOne
+loop: a must-have requirement matches at a score of 80 or more, a nice-to-have
+one at 70 or more, and the total score weights the matched share of must-haves
+with 70 and of nice-to-haves with 30.
+
+prune=True compares only the skills sharing an index term (see skill_terms): a
+word or a character trigram. All other pairs score 0 without running the scorer.
+This skips most of the matrix, but pairs sharing no trigram lose their low
+scores, and words shorter than three characters match whole words only (e.g.
+"go" no longer matches "golang").
+
+Canonical skill IDs (see skill_normalizer.py and database/skill_aliases.py) are
+compared first: a requirement whose skill ID is among the freelancer's skill IDs
+scores 100 ("c sharp" matches "C#"). Where both sides have an ID, only the IDs
+are compared ("C#", "C++" and "C" normalize alike but never match each other);
+fuzzy scoring is the fallback for the pairs with an unknown side. Requirements
+every freelancer has by ID are left out of the similarity matrix.
+
+use_rapidfuzz=True computes the matrix with rapidfuzz's process.cdist instead,
+an order of magnitude faster. Its partial_ratio finds the optimal alignment,
+fuzzywuzzy's (difflib) does not, so short skills score higher there (e.g.
+"aws" / "pandas": 80 instead of 67) and some requirements match that did not.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from fuzzywuzzy import fuzz
+from fuzzywuzzy import utils as fuzz_utils
+
+try:
+    from rapidfuzz import fuzz as rapid_fuzz  # optional, C++ scorers and cdist
+    from rapidfuzz import process as rapid_process
+    from rapidfuzz import utils as rapid_utils
+except ImportError:
+    rapid_fuzz = rapid_process = rapid_utils = None
+
+MUST_HAVE_THRESHOLD = 80
+NICE_TO_HAVE_THRESHOLD = 70
+MUST_HAVE_WEIGHT = 70
+NICE_TO_HAVE_WEIGHT = 30
+
+Skills = Union[str, Sequence[str], None]
+MatchResult = Tuple[float, Dict[str, Dict[str, Any]]]
+Requirements = Tuple[List[str], List[str]]
+RequirementIds = Tuple[List[int], List[int]]
+SkillIds = Tuple[List[Optional[int]], List[Optional[int]]]
+ID_MATCH_SCORE = 100
+
+
+def split_skills(skills: Skills) -> List[str]:
+    """
+    Lower-cased, stripped skills of a list (e.g. the RFP requirement arrays) or of a
+    comma separated string (e.g. ProjectModel.must_haves). Empty entries are dropped.
+    """
+    if not skills:
+        return []
+    if isinstance(skills, str):
+        skills = skills.split(",")
+    return [skill.strip().lower() for skill in skills if skill and skill.strip()]
+
+
+def skill_terms(skill: str) -> Set[str]:
+    """
+    Index terms of a skill: the words of its normalized form and their character
+    trigrams, e.g. "PostgreSQL 15" -> {"postgresql", "pos", "ost", ..., "sql", "15"}.
+    """
+    terms: Set[str] = set()
+    for word in fuzz_utils.full_process(skill).split():
+        terms.add(word)
+        terms.update(word[i : i + 3] for i in range(len(word) - 2))
+    return terms
+
+
+def requirements_of(record: Any) -> Requirements:
+    """
+    The must-have and nice-to-have requirements of an RFP or project, given as dict
+    or model instance.
+    """
+    if isinstance(record, dict):
+        get = record.get
+    else:
+        get = lambda key: getattr(record, key, None)  # noqa: E731
+    must_haves = get("must_have_requirements") or get("must_haves")
+    nice_to_haves = get("nice_to_have_requirements") or get("nice_to_haves")
+    return split_skills(must_haves), split_skills(nice_to_haves)
+
+
+def skill_ids_of(
+    skills: Skills, skill_ids: Sequence[Optional[int]]
+) -> List[Optional[int]]:
+    """
+    The canonical skill IDs of a freelancer's skill list, aligned with split_skills;
+    None where unknown (or if the IDs do not align with the list).
+    """
+    if not isinstance(skills, (list, tuple)) or len(skill_ids) != len(skills):
+        return [None] * len(split_skills(skills))
+    return [
+        skill_id
+        for skill, skill_id in zip(skills, skill_ids)
+        if skill and skill.strip()
+    ]
+
+
+def requirement_skill_ids_of(record: Any) -> SkillIds:
+    """
+    The canonical skill IDs of the requirements of an RFP (must_have_skill_ids,
+    nice_to_have_skill_ids), aligned with requirements_of; None where unknown.
+    """
+    if isinstance(record, dict):
+        get = record.get
+    else:
+        get = lambda key: getattr(record, key, None)  # noqa: E731
+    result = []
+    for key in ("must_have", "nice_to_have"):
+        skills = get(f"{key}_requirements")
+        ids = get(f"{key}_skill_ids") or []
+        if isinstance(skills, list) and len(ids) == len(skills):
+            result.append(
+                [
+                    skill_id
+                    for skill, skill_id in zip(skills, ids)
+                    if skill and skill.strip()
+                ]
+            )
+        else:
+            result.append([None] * len(split_skills(skills)))
+    return result[0], result[1]
+
+
+class SkillMatchEngine:
+    def __init__(
+        self, use_rapidfuzz: bool = False, workers: int = 1, prune: bool = False
+    ):
+        """
+        :param use_rapidfuzz: Scores with rapidfuzz instead of fuzzywuzzy.
+        :param workers: Threads of rapidfuzz's cdist, -1 uses all cores.
+        :param prune: Scores only the skill pairs sharing an index term.
+        """
+        self.use_rapidfuzz = use_rapidfuzz
+        self.prune = prune
+        if self.use_rapidfuzz and rapid_process is None:
+            raise ImportError("use_rapidfuzz requires the rapidfuzz package")
+        self.workers = workers
+
+    def normalize(self, skill: str) -> str:
+        """
+        The form a skill is compared in: lower case, non-alphanumerics as spaces.
+        """
+        if self.use_rapidfuzz:
+            return rapid_utils.default_process(skill)
+        return fuzz_utils.full_process(skill)
+
+    def similarity_matrix(
+        self, queries: Sequence[str], choices: Sequence[str]
+    ) -> np.ndarray:
+        """
+        partial_ratio (0-100, rounded) of every normalized query x choice.
+        """
+        shape = (len(queries), len(choices))
+        if not queries or not choices:
+            return np.zeros(shape, dtype=np.int16)
+        if self.use_rapidfuzz:
+            scores = rapid_process.cdist(
+                queries, choices, scorer=rapid_fuzz.partial_ratio, workers=self.workers
+            )
+            return np.rint(scores).astype(np.int16)
+        scores = [
+            fuzz.partial_ratio(query, choice) for query in queries for choice in choices
+        ]
+        return np.array(scores, dtype=np.int16).reshape(shape)
+
+    def pruned_similarity_matrix(
+        self, queries: Sequence[str], choices: Sequence[str]
+    ) -> np.ndarray:
+        """
+        Like similarity_matrix, but scores only the query x choice pairs sharing an
+        index term (an in-memory inverted index over the choices), all others are 0.
+        """
+        similarity = np.zeros((len(queries), len(choices)), dtype=np.int16)
+        postings: Dict[str, List[int]] = {}
+        for column, choice in enumerate(choices):
+            for term in skill_terms(choice):
+                postings.setdefault(term, []).append(column)
+        scorer = rapid_fuzz.partial_ratio if self.use_rapidfuzz else fuzz.partial_ratio
+        for row, query in enumerate(queries):
+            candidates = set()
+            for term in skill_terms(query):
+                candidates.update(postings.get(term, ()))
+            for column in candidates:
+                similarity[row, column] = round(scorer(query, choices[column]))
+        return similarity
+
+    def _best_scores(
+        self,
+        rfps: Sequence[Any],
+        freelancers: Sequence[Skills],
+        freelancer_skill_ids: Optional[Sequence[Sequence[Optional[int]]]] = None,
+    ) -> Tuple[List[Requirements], List[RequirementIds], np.ndarray]:
+        """
+        Requirements per RFP, their indexes into the requirement vocabulary and the
+        best score of every requirement per freelancer (vocabulary x freelancers).
+        """
+        requirements = [requirements_of(rfp) for rfp in rfps]
+        # a requirement is scored by its compared form and its canonical skill ID:
+        # skills normalizing alike (e.g. "c#" and "c++" -> "c") keep their own IDs
+        vocabulary: Dict[Tuple[str, Optional[int]], int] = {}
+
+        def index(skill: str, skill_id: Optional[int]) -> int:
+            key = (self.normalize(skill), skill_id)
+            return vocabulary.setdefault(key, len(vocabulary))
+
+        indexes = []
+        for rfp, (must, nice) in zip(rfps, requirements):
+            must_ids, nice_ids = (
+                requirement_skill_ids_of(rfp)
+                if freelancer_skill_ids is not None
+                else ([None] * len(must), [None] * len(nice))
+            )
+            indexes.append(
+                (
+                    [index(skill, id_) for skill, id_ in zip(must, must_ids)],
+                    [index(skill, id_) for skill, id_ in zip(nice, nice_ids)],
+                )
+            )
+        queries = [query for query, _ in vocabulary]
+        vocabulary_ids = [skill_id for _, skill_id in vocabulary]
+        skill_vocabulary: Dict[str, int] = {}
+
+        def skill_index(skill: str) -> int:
+            key = self.normalize(skill)
+            return skill_vocabulary.setdefault(key, len(skill_vocabulary))
+
+        # per freelancer: all skill columns, the columns of skills without a known ID
+        # and the known IDs
+        skill_indexes: List[List[int]] = []
+        unknown_indexes: List[List[int]] = []
+        known_ids: List[Set[int]] = []
+        for column, skills in enumerate(freelancers):
+            names = split_skills(skills)
+            ids = (
+                skill_ids_of(skills, freelancer_skill_ids[column])
+                if freelancer_skill_ids is not None
+                else [None] * len(names)
+            )
+            skill_indexes.append(sorted({skill_index(name) for name in names}))
+            unknown_indexes.append(
+                sorted(
+                    {skill_index(name) for name, id_ in zip(names, ids) if id_ is None}
+                )
+            )
+            known_ids.append({id_ for id_ in ids if id_ is not None})
+        # fuzzy scoring is the fallback of the requirements without an ID and of
+        # those some freelancer lacks by ID but might have among the unknown skills
+        fuzzy_rows = [
+            i
+            for i, skill_id in enumerate(vocabulary_ids)
+            if skill_id is None
+            or any(
+                skill_id not in ids and unknown
+                for ids, unknown in zip(known_ids, unknown_indexes)
+            )
+        ]
+        similarity = (
+            self.pruned_similarity_matrix if self.prune else self.similarity_matrix
+        )([queries[i] for i in fuzzy_rows], list(skill_vocabulary))
+        unknown_rows = [
+            k for k, i in enumerate(fuzzy_rows) if vocabulary_ids[i] is None
+        ]
+        known_rows = [
+            k for k, i in enumerate(fuzzy_rows) if vocabulary_ids[i] is not None
+        ]
+        targets = np.array(fuzzy_rows, dtype=int)
+        best = np.zeros((len(vocabulary), len(freelancers)), dtype=np.int16)
+        for column, (columns, unknown) in enumerate(
+            zip(skill_indexes, unknown_indexes)
+        ):
+            if columns and unknown_rows:
+                best[targets[unknown_rows], column] = similarity[
+                    np.ix_(unknown_rows, columns)
+                ].max(axis=1)
+            if unknown and known_rows:
+                # known requirements are compared to the freelancer's unknown skills
+                # only, the known ones are compared by ID
+                best[targets[known_rows], column] = similarity[
+                    np.ix_(known_rows, unknown)
+                ].max(axis=1)
+            rows = [
+                i
+                for i, skill_id in enumerate(vocabulary_ids)
+                if skill_id in known_ids[column]
+            ]
+            best[rows, column] = ID_MATCH_SCORE
+        return requirements, indexes, best
+
+    def score_matrix(
+        self, rfps: Sequence[Any], freelancers: Sequence[Skills]
+    ) -> np.ndarray:
+        """
+        Total skill scores (0-100) of all RFPs x freelancers, shape (rfps, freelancers).
+        freelancers are the skill lists (or comma separated strings) of the freelancers.
+        """
+        _, indexes, best = self._best_scores(rfps, freelancers)
+        scores = np.zeros((len(rfps), len(freelancers)))
+        for part, threshold, weight in (
+            (0, MUST_HAVE_THRESHOLD, MUST_HAVE_WEIGHT),
+            (1, NICE_TO_HAVE_THRESHOLD, NICE_TO_HAVE_WEIGHT),
+        ):
+            pairs = [(row, i) for row, ids in enumerate(indexes) for i in ids[part]]
+            if not pairs:
+                continue
+            rows, requirement_ids = np.array(pairs).T
+            matched = np.zeros_like(scores)
+            np.add.at(matched, rows, best[requirement_ids] >= threshold)
+            totals = np.bincount(rows, minlength=len(rfps))
+            has = totals > 0
+            scores[has] += matched[has] / totals[has, None] * weight
+        return scores
+
+    def match_rfps(
+        self, rfps: Sequence[Any], freelancer_skills: Skills
+    ) -> List[MatchResult]:
+        """
+        Total score and per-skill details ({skill: {"matched", "score"}}) of every RFP
+        for one freelancer, as SkillMatcher.match_skills returns them.
+        """
+        return [row[0] for row in self.match_matrix(rfps, [freelancer_skills])]
+
+    def match_matrix(
+        self,
+        rfps: Sequence[Any],
+        freelancers: Sequence[Skills],
+        freelancer_skill_ids: Optional[Sequence[Sequence[Optional[int]]]] = None,
+    ) -> List[List[MatchResult]]:
+        """
+        Total score and per-skill details of all RFPs x freelancers (one row per RFP)
+        from a single similarity matrix. With freelancer_skill_ids (the canonical
+        skill IDs per freelancer, aligned with the skill lists, None where unknown),
+        the RFPs' requirement skill IDs are compared first.
+        """
+        requirements, indexes, best = self._best_scores(
+            rfps, freelancers, freelancer_skill_ids
+        )
+        columns = best.T.tolist()
+        return [
+            [
+                self._match_result(rfp_requirements, rfp_indexes, column)
+                for column in columns
+            ]
+            for rfp_requirements, rfp_indexes in zip(requirements, indexes)
+        ]
+
+    @staticmethod
+    def _match_result(
+        requirements: Requirements, indexes: RequirementIds, best: List[int]
+    ) -> MatchResult:
+        details: Dict[str, Dict[str, Any]] = {}
+        total_score = 0.0
+        for skills, ids, threshold, weight in (
+            (requirements[0], indexes[0], MUST_HAVE_THRESHOLD, MUST_HAVE_WEIGHT),
+            (requirements[1], indexes[1], NICE_TO_HAVE_THRESHOLD, NICE_TO_HAVE_WEIGHT),
+        ):
+            matched = 0
+            for skill, i in zip(skills, ids):
+                score = best[i]
+                details[skill] = {"matched": score >= threshold, "score": score}
+                matched += score >= threshold
+            if skills:
+                total_score += (matched / len(skills)) * weight
+        return total_score, details
+
+    def match(self, rfp: Any, freelancer_skills: Skills) -> MatchResult:
+        return self.match_rfps([rfp], freelancer_skills)[0]
+
+    @staticmethod
+    def no_match(rfp: Any) -> MatchResult:
+        """
+        The result for a freelancer sharing no skill term with the RFP, unscored.
+        """
+        must_haves, nice_to_haves = requirements_of(rfp)
+        unmatched = {"matched": False, "score": 0}
+        return 0.0, {skill: dict(unmatched) for skill in must_haves + nice_to_haves}
+
+
+default_engine = SkillMatchEngine()
@@ -0,0 +1,108 @@
+"""
+Skill normalization and aliases.
+
+normalize_skill() reduces a skill name to its lookup key: Unicode NFKC, lower
+case, collapsed whitespace, without qualifier phrases ("Erfahrung mit Django")
+and trailing version numbers ("Python 3.11"). Characters that tell skills apart
+("#", "+", ".") are kept, unlike in fuzzywuzzy's full_process.
+
+BUILTIN_ALIASES maps canonical skill names to their common spellings. A
+SkillAliasMap compiles these and further aliases (e.g. the skill_aliases table,
+see offermee/database/skill_aliases.py) into one dict from lookup key to
+canonical key, so resolving a skill is a single dict lookup.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, Mapping, Optional
+
+# canonical name -> aliases (compared by their normalized form)
+BUILTIN_ALIASES: Dict[str, Iterable[str]] = {
+    "C#": ["c sharp", "csharp", "c-sharp"],
+    "C++": ["cpp", "c plus plus"],
+    ".NET": [".net core", "dotnet", "dotnet core", "dot net", ".net framework"],
+    "JavaScript": ["js", "java script", "ecmascript"],
+    "TypeScript": ["ts", "type script"],
+    "Node.js": ["nodejs", "node js", "node"],
+    "Vue.js": ["vuejs", "vue js", "vue"],
+    "React": ["reactjs", "react.js", "react js"],
+    "Angular": ["angularjs", "angular.js"],
+    "PostgreSQL": ["postgres", "postgre sql", "psql"],
+    "Microsoft SQL Server": ["mssql", "ms sql", "sql server"],
+    "MongoDB": ["mongo", "mongo db"],
+    "Kubernetes": ["k8s"],
+    "Golang": ["go", "go lang"],
+    "Python": ["python3", "py"],
+    "Amazon Web Services": ["aws"],
+    "Google Cloud Platform": ["gcp", "google cloud"],
+    "Microsoft Azure": ["azure", "ms azure"],
+    "CI/CD": ["ci cd", "cicd", "continuous integration"],
+    "Spring Boot": ["springboot", "spring-boot"],
+}
+
+_QUALIFIERS = re.compile(
+    r"^(?:(?:sehr )?gute |fundierte |tiefe |mehrjährige |langjährige )?"
+    r"(?:erfahrung(?:en)? (?:mit|in)|kenntnisse (?:in|von|mit)|"
+    r"experience (?:with|in)|knowledge (?:of|in)|senior|junior) "
+)
+_VERSION = re.compile(r"\s+v?\d+(?:\.[\dx]+)*\+?$")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_skill(name: str) -> str:
+    """
+    The lookup key of a skill name, e.g. "Erfahrung mit  Python 3.11" -> "python".
+    """
+    key = unicodedata.normalize("NFKC", name or "").casefold()
+    key = _SPACES.sub(" ", key).strip()
+    key = _QUALIFIERS.sub("", key)
+    stripped = _VERSION.sub("", key)
+    return stripped if stripped else key
+
+
+class SkillAliasMap:
+    """
+    Compiled lookup of skill names: lookup key -> canonical key.
+    """
+
+    def __init__(
+        self,
+        aliases: Optional[Mapping[str, Iterable[str]]] = None,
+        use_builtin: bool = True,
+    ):
+        """
+        :param aliases: Further canonical name -> aliases, override the builtin ones.
+        :param use_builtin: Compiles BUILTIN_ALIASES as well.
+        """
+        self.lookup: Dict[str, str] = {}
+        self.names: Dict[str, str] = {}  # canonical key -> canonical name
+        if use_builtin:
+            self.update(BUILTIN_ALIASES)
+        if aliases:
+            self.update(aliases)
+
+    def update(self, aliases: Mapping[str, Iterable[str]]) -> None:
+        for name, name_aliases in aliases.items():
+            canonical = normalize_skill(name)
+            self.names[canonical] = name
+            self.lookup[canonical] = canonical
+            for alias in name_aliases:
+                self.lookup[normalize_skill(alias)] = canonical
+
+    def canonical_key(self, name: str) -> str:
+        """
+        The canonical key of a skill name, its own lookup key if it has no alias.
+        """
+        key = normalize_skill(name)
+        return self.lookup.get(key, key)
+
+    def canonical_name(self, name: str) -> str:
+        """
+        The canonical name of a skill, e.g. "c sharp" -> "C#". Skills without
+        alias keep their (stripped) name.
+        """
+        key = self.canonical_key(name)
+        return self.names.get(key, name.strip())
+
+
+builtin_aliases = SkillAliasMap()
@@ -1,15 +1,72 @@
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, List, Optional
 import requests
 from bs4 import BeautifulSoup
 
 from offermee.AI.rfp_processor import RFPProcessor
+from offermee.database.database_manager import DatabaseManager
 from offermee.database.facades.main_facades import RFPFacade, ReadFacade
+from offermee.database.matching_sink import enable_matching_worker
 from offermee.database.models.main_models import RFPSource
 from offermee.scraper.base_scraper import BaseScraper
 from offermee.utils.config import Config
 from offermee.utils.logger import CentralLogger
 
 
+# analyzed rfps are stored every STORE_CHUNK_SIZE rfps, so an aborted scraping run
+# loses at most one chunk of (expensive) LLM analyses
+STORE_CHUNK_SIZE = 20
+
+
+def store_rfp_batch(
+    rfps: List[Dict[str, Any]],
+    conflict_keys: List[str],
+    created_by: str,
+    logger: logging.Logger,
+) -> int:
+    """
+    Stores the rfps in one transaction. RFPs with fields the model does not know
+    are skipped and logged beforehand instead of discarding the whole batch.
+    If the batch still fails outside of a unit of work, every rfp is stored on its
+    own. Inside a unit of work the failed transaction cannot be retried, the error
+    is logged and the unit fails.
+    Returns the number of stored rfps.
+    """
+    valid = []
+    for rfp in rfps:
+        odd_fields = RFPFacade.odd_fields(rfp)
+        if odd_fields:
+            logger.error(f"Skipping invalid RFP {rfp.get('title')}: {odd_fields}")
+        else:
+            valid.append(rfp)
+    if not valid:
+        return 0
+    try:
+        return len(
+            RFPFacade.bulk_upsert(
+                valid, conflict_keys=conflict_keys, created_by=created_by
+            )
+        )
+    except Exception as e:
+        if len(valid) == 1 or DatabaseManager.current_unit_of_work() is not None:
+            logger.exception(f"Error saving {len(valid)} RFPs: {e}")
+            return 0
+        logger.warning(
+            f"Error saving {len(valid)} RFPs at once, saving one by one: {e}"
+        )
+    stored = 0
+    for rfp in valid:
+        try:
+            stored += len(
+                RFPFacade.bulk_upsert(
+                    [rfp], conflict_keys=conflict_keys, created_by=created_by
+                )
+            )
+        except Exception as e:
+            logger.exception(f"Skipping RFP {rfp.get('title')}: {e}")
+    return stored
+
+
 class BaseRFPScraper(BaseScraper):
     """
     General base class for scrapers.
@@ -21,9 +78,10 @@ class BaseRFPScraper(BaseScraper):
         super().__init__(base_url)
         self.project_processor: RFPProcessor = RFPProcessor()
 
-    def process(self, project: Dict[str, Any]) -> None:
+    def analyze(self, project: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Analyzes the rfp (request for proposal) description with an LLM and stores the extracted data.
+        Analyzes the rfp (request for proposal) description with an LLM.
+        Returns the extracted rfp, or None if the analysis failed or the rfp is already stored.
         """
         self.logger.info(f"Processing project: {project.get('title', 'No title')}")
         analysis = self.project_processor.analyze_rfp(str(project))
@@ -32,7 +90,7 @@ class BaseRFPScraper(BaseScraper):
             self.logger.error(
                 f"Analysis failed for project: {project.get('title', 'No title')}"
             )
-            return
+            return None
         try:
             original_link = new_rfp["original_link"] = new_rfp.get(
                 "original_link", project["link"]
@@ -42,12 +100,37 @@ class BaseRFPScraper(BaseScraper):
             )
             if existing_project:
                 self.logger.info(f"RFP already exists: {new_rfp.get('title')}")
-                return
+                return None
             self.logger.info(f"AI RFP analysis: {new_rfp}")
             new_rfp["source"] = RFPSource.ONLINE
-            RFPFacade.create(
-                new_rfp, created_by=Config.get_instance().get_current_user()
-            )
-            self.logger.info(f"RFP saved: {new_rfp.get('title')}")
+            return new_rfp
         except Exception as e:
-            self.logger.exception(f"Error saving RFP: {e}")
+            self.logger.exception(f"Error checking RFP: {e}")
+            return None
+
+    def store(self, rfps: List[Dict[str, Any]]) -> int:
+        """
+        Stores the analyzed rfps in one transaction, invalid ones are skipped.
+        RFPs are unique by their original link.
+        The new rfps are scored against all freelancers in the background.
+        Returns the number of stored rfps.
+        """
+        if not rfps:
+            return 0
+        enable_matching_worker()
+        stored = store_rfp_batch(
+            rfps,
+            conflict_keys=["original_link"],
+            created_by=Config.get_instance().get_current_user(),
+            logger=self.logger,
+        )
+        self.logger.info(f"{stored} RFPs saved.")
+        return stored
+
+    def process(self, project: Dict[str, Any]) -> None:
+        """
+        Analyzes the rfp (request for proposal) description with an LLM and stores the extracted data.
+        """
+        new_rfp = self.analyze(project)
+        if new_rfp:
+            self.store([new_rfp])
@@ -2,7 +2,7 @@ from typing import List, Tuple, Dict, Any, Optional
 from offermee.AI.rfp_processor import RFPProcessor
 from offermee.htmls.save_utils import generate_filename_from_url, save_html
 from offermee.utils.logger import CentralLogger
-from offermee.scraper.base_rfp_scraper import BaseRFPScraper
+from offermee.scraper.base_rfp_scraper import STORE_CHUNK_SIZE, BaseRFPScraper
 from bs4 import BeautifulSoup
 
 from offermee.utils.international import _T
@@ -267,26 +267,37 @@ class FreelanceMapScraper(BaseRFPScraper):
             )
             count = len(rfps)
             current: int = 0
-            for rfp in rfps:
-                current += 1
-                project_page_html_content = self.fetch_page(rfp["link"])
-                if not project_page_html_content:
-                    self.logger.error(
-                        f"No project page available for {rfp.get('title')}. Skipping."
-                    )
-                    continue
-                rfp = self.parse_rfp_page_html(project_page_html_content, rfp=rfp)
-                if progress:
-                    progress.progress(
-                        current / count,
-                        f"{_T('Processing RFPs')}: {current} / {count}",
-                    )
-                # llm analysis and store in db
-                self.process(rfp)
-                if progress:
-                    progress.progress(
-                        current / count, f"{_T('Processed RFPs')}: {current} / {count}"
-                    )
+            new_rfps: List[Dict[str, Any]] = []
+            try:
+                for rfp in rfps:
+                    current += 1
+                    project_page_html_content = self.fetch_page(rfp["link"])
+                    if not project_page_html_content:
+                        self.logger.error(
+                            f"No project page available for {rfp.get('title')}. Skipping."
+                        )
+                        continue
+                    rfp = self.parse_rfp_page_html(project_page_html_content, rfp=rfp)
+                    if progress:
+                        progress.progress(
+                            current / count,
+                            f"{_T('Processing RFPs')}: {current} / {count}",
+                        )
+                    # llm analysis, stored in db in chunks
+                    new_rfp = self.analyze(rfp)
+                    if new_rfp:
+                        new_rfps.append(new_rfp)
+                    if progress:
+                        progress.progress(
+                            current / count,
+                            f"{_T('Processed RFPs')}: {current} / {count}",
+                        )
+                    if len(new_rfps) >= STORE_CHUNK_SIZE:
+                        self.store(new_rfps)
+                        new_rfps = []
+            finally:
+                # also the analyzed rest, if the loop fails
+                self.store(new_rfps)
             return rfps
         except AttributeError as e:
             self.logger.exception(f"AttributeError while parsing project: {e}")
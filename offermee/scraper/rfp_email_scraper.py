@@ -7,8 +7,10 @@ from typing import List, Dict, Any, Optional
 # Project-specific imports
 from offermee.utils.config import Config
 from offermee.AI.rfp_processor import RFPProcessor
-from offermee.database.facades.main_facades import RFPFacade, ReadFacade
+from offermee.database.facades.main_facades import ReadFacade
+from offermee.database.matching_sink import enable_matching_worker
 from offermee.database.models.main_models import RFPSource
+from offermee.scraper.base_rfp_scraper import STORE_CHUNK_SIZE, store_rfp_batch
 from offermee.utils.logger import CentralLogger
 
 # Configure logging
@@ -147,13 +149,16 @@ def parse_email(msg_bytes: bytes) -> Dict[str, Any]:
         return {}
 
 
-def process_email(rfp_data: Dict[str, Any], operator: str):
+def analyze_email(rfp_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Analyzes the email body with an LLM. Returns the new rfp, or None if invalid or already stored.
+    """
     try:
         processor = RFPProcessor()
         result = processor.analyze_rfp(rfp_data["body"])
         if not result or "project" not in result:
             logger.warning("AI analysis did not return a valid 'project' structure.")
-            return
+            return None
 
         rfp: Dict[str, Any] = result["project"]
         # Check if the RFP already exists
@@ -166,16 +171,37 @@ def process_email(rfp_data: Dict[str, Any], operator: str):
             logger.info(
                 f"Skipping RFP '{rfp.get('title')}' of '{rfp.get('contact-person-email')}' that already exists in db."
             )
-            return
+            return None
 
-        # Transform and save the new project
         rfp["source"] = RFPSource.EMAIL
-        RFPFacade.create(rfp, operator)
-        logger.info(
-            f"New RFP '{rfp.get('title')}' of '{rfp.get('contact-person-email')}' successfully saved to db."
-        )
+        return rfp
     except Exception as e:
         logger.error(f"ERROR while processing the Email: {e}")
+        return None
+
+
+def store_rfps(rfps: List[Dict[str, Any]], operator: str) -> None:
+    """
+    Saves the analyzed email rfps in one transaction, unique by contact person email and title.
+    Invalid rfps are skipped, the others are saved nevertheless.
+    The new rfps are scored against all freelancers in the background.
+    """
+    if not rfps:
+        return
+    enable_matching_worker()
+    stored = store_rfp_batch(
+        rfps,
+        conflict_keys=["contact_person_email", "title"],
+        created_by=operator,
+        logger=logger,
+    )
+    logger.info(f"{stored} new RFPs successfully saved to db.")
+
+
+def process_email(rfp_data: Dict[str, Any], operator: str):
+    rfp = analyze_email(rfp_data)
+    if rfp:
+        store_rfps([rfp], operator)
 
 
 def scrap_rfps_from_email(since_days: int = 2):
@@ -201,11 +227,20 @@ def scrap_rfps_from_email(since_days: int = 2):
     # Fetch relevant emails
     emails = fetch_emails(mail, since_date, subject_filter, sender_filter)
 
-    # Process each email
-    for msg_bytes in emails:
-        rfp_data = parse_email(msg_bytes)
-        if rfp_data:
-            process_email(rfp_data, operator)
+    # Analyze each email, save the new RFPs in chunks (the rest also on errors)
+    new_rfps: List[Dict[str, Any]] = []
+    try:
+        for msg_bytes in emails:
+            rfp_data = parse_email(msg_bytes)
+            if rfp_data:
+                rfp = analyze_email(rfp_data)
+                if rfp:
+                    new_rfps.append(rfp)
+            if len(new_rfps) >= STORE_CHUNK_SIZE:
+                store_rfps(new_rfps, operator)
+                new_rfps = []
+    finally:
+        store_rfps(new_rfps, operator)
 
     # Logout from the email server
     mail.logout()
@@ -0,0 +1,112 @@
+"""
+Content-addressed blob store.
+
+Blobs are compressed files named by the SHA-256 of their uncompressed content,
+<root>/<first two hex digits>/<hash>.zst (zstd, if the zstandard package is
+installed) or .gz. Identical content is stored once, references are the hash.
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+from typing import Optional, Union
+
+try:
+    import zstandard  # optional, better ratio and faster than gzip
+except ImportError:
+    zstandard = None
+
+from offermee.utils.config import Config
+
+ZSTD_LEVEL = 10
+GZIP_LEVEL = 6
+
+
+def blob_hash(data: Union[bytes, str]) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class BlobStore:
+    _instance: Optional["BlobStore"] = None
+
+    @staticmethod
+    def get_instance() -> "BlobStore":
+        """
+        The blob store in the user data directory.
+        """
+        if BlobStore._instance is None:
+            BlobStore._instance = BlobStore(
+                os.path.join(Config.get_instance().get_user_data_dir(), "blobs")
+            )
+        return BlobStore._instance
+
+    def __init__(self, root: str, use_zstd: Optional[bool] = None):
+        self.root = root
+        self.use_zstd = zstandard is not None if use_zstd is None else use_zstd
+        if self.use_zstd and zstandard is None:
+            raise ImportError("zstd compression requires the zstandard package")
+
+    def _path(self, digest: str, extension: str) -> str:
+        return os.path.join(self.root, digest[:2], f"{digest}{extension}")
+
+    def _existing_path(self, digest: str) -> Optional[str]:
+        # a blob may have been written with the other compression
+        for extension in (".zst", ".gz"):
+            path = self._path(digest, extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def contains(self, digest: str) -> bool:
+        return self._existing_path(digest) is not None
+
+    def put(self, data: Union[bytes, str]) -> str:
+        """
+        Stores the content (str as UTF-8) unless it is stored already.
+
+        Returns:
+            str: The SHA-256 hex digest referencing the content.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        digest = blob_hash(data)
+        if self.contains(digest):
+            return digest
+        if self.use_zstd:
+            path = self._path(digest, ".zst")
+            compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        else:
+            path = self._path(digest, ".gz")
+            compressed = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # written under a temporary name and renamed, readers never see partial blobs
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """
+        Returns the content of the blob. Raises KeyError if it does not exist.
+        """
+        path = self._existing_path(digest)
+        if path is None:
+            raise KeyError(f"Blob {digest} not found in {self.root}")
+        with open(path, "rb") as f:
+            compressed = f.read()
+        if path.endswith(".zst"):
+            if zstandard is None:
+                raise ImportError(f"Blob {digest} is zstd compressed, install zstandard")
+            return zstandard.ZstdDecompressor().decompress(compressed)
+        return gzip.decompress(compressed)
+
+    def get_text(self, digest: str) -> str:
+        return self.get(digest).decode("utf-8")
@@ -0,0 +1,182 @@
+"""
+Locale-independent date parsing.
+
+Recognizes the numeric formats used in RFPs and CVs (DD.MM.YYYY, YYYY-MM-DD,
+DD-MM-YYYY, MM/DD/YYYY or DD/MM/YYYY, MM.YYYY, ...) and German and English month
+names with precompiled patterns, without touching the process-global locale. Strings
+matching none of them fall back to dateutil. Results are memoized, because
+ingestion parses the same few strings ("01.03.2025", "ASAP", ...) over and over.
+"""
+
+import datetime
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from dateutil import parser
+
+MONTHS: Dict[str, int] = {
+    # German
+    "januar": 1,
+    "jänner": 1,
+    "jaenner": 1,
+    "jan": 1,
+    "februar": 2,
+    "feb": 2,
+    "märz": 3,
+    "maerz": 3,
+    "mär": 3,
+    "mrz": 3,
+    "april": 4,
+    "apr": 4,
+    "mai": 5,
+    "juni": 6,
+    "jun": 6,
+    "juli": 7,
+    "jul": 7,
+    "august": 8,
+    "aug": 8,
+    "september": 9,
+    "sep": 9,
+    "sept": 9,
+    "oktober": 10,
+    "okt": 10,
+    "november": 11,
+    "nov": 11,
+    "dezember": 12,
+    "dez": 12,
+    # English
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "mar": 3,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "october": 10,
+    "oct": 10,
+    "december": 12,
+    "dec": 12,
+}
+
+_MONTH_NAME = r"([^\W\d_]+)\.?"
+
+
+def _year(value: str) -> int:
+    year = int(value)
+    return year + 2000 if len(value) == 2 else year
+
+
+def _month(name: str) -> int:
+    month = MONTHS.get(name.lower())
+    if month is None:
+        raise ValueError(f"Unknown month name: {name}")
+    return month
+
+
+def _day_first(day: str, month: str, year: str) -> datetime.date:
+    return datetime.date(_year(year), int(month), int(day))
+
+
+def _month_first(first: str, second: str, year: str) -> datetime.date:
+    # US notation, falls back to day first if the first number cannot be a month
+    month, day = int(first), int(second)
+    if month > 12:
+        month, day = day, month
+    return datetime.date(_year(year), month, day)
+
+
+def _day_first_or_swapped(first: str, second: str, year: str) -> datetime.date:
+    # European notation, month first if the second number cannot be a month
+    day, month = int(first), int(second)
+    if month > 12:
+        month, day = day, month
+    return datetime.date(_year(year), month, day)
+
+
+_SLASH_DATE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+# (pattern, builder from the match groups); the first matching pattern wins
+_FORMATS: List[Tuple[re.Pattern, Callable[..., datetime.date]]] = [
+    # YYYY-MM-DD, optionally followed by a time
+    (
+        re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})(?:[T ][\d:.]+(?:Z|[+-][\d:]+)?)?"),
+        lambda y, m, d: datetime.date(int(y), int(m), int(d)),
+    ),
+    # DD.MM.YYYY, DD.MM.YY
+    (re.compile(r"(\d{1,2})\.\s?(\d{1,2})\.\s?(\d{4}|\d{2})"), _day_first),
+    # DD-MM-YYYY
+    (re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})"), _day_first),
+    # MM/DD/YYYY (DD/MM/YYYY if the first number is greater than 12)
+    (_SLASH_DATE, _month_first),
+    # MM.YYYY, MM/YYYY -> first day of the month
+    (
+        re.compile(r"(\d{1,2})[./](\d{4})"),
+        lambda m, y: datetime.date(int(y), int(m), 1),
+    ),
+    # YYYY-MM -> first day of the month
+    (
+        re.compile(r"(\d{4})-(\d{1,2})"),
+        lambda y, m: datetime.date(int(y), int(m), 1),
+    ),
+    # 1. März 2025, 15 March 2025
+    (
+        re.compile(r"(\d{1,2})\.?\s+" + _MONTH_NAME + r",?\s+(\d{4})"),
+        lambda d, name, y: datetime.date(int(y), _month(name), int(d)),
+    ),
+    # March 15, 2025 / March 15th 2025
+    (
+        re.compile(_MONTH_NAME + r"\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})"),
+        lambda name, d, y: datetime.date(int(y), _month(name), int(d)),
+    ),
+    # März 2025, March 2025 -> first day of the month
+    (
+        re.compile(_MONTH_NAME + r",?\s+(\d{4})"),
+        lambda name, y: datetime.date(int(y), _month(name), 1),
+    ),
+]
+# the same formats, but slash dates read as DD/MM/YYYY
+_FORMATS_DAY_FIRST = [
+    (pattern, _day_first_or_swapped if pattern is _SLASH_DATE else build)
+    for pattern, build in _FORMATS
+]
+
+
+@lru_cache(maxsize=4096)
+def _parse(date_str: str, day_first: bool) -> Optional[datetime.date]:
+    text = date_str.strip()
+    if not text:
+        return None
+    for pattern, build in _FORMATS_DAY_FIRST if day_first else _FORMATS:
+        match = pattern.fullmatch(text)
+        if match:
+            try:
+                return build(*match.groups())
+            except ValueError:
+                # e.g. 31.02.2025 or an unknown month name, left to dateutil
+                break
+    try:
+        return parser.parse(text, dayfirst=True).date()
+    except (ValueError, OverflowError):
+        return None
+
+
+def parse_date(value, day_first: bool = False) -> Optional[datetime.date]:
+    """
+    Parses a date string (or passes a date / datetime through) to a datetime.date.
+
+    Args:
+        value: The date string, e.g. "01.03.2025", "2025-03-01", "03.2025" or "1. März 2025".
+        day_first: Reads slash dates as DD/MM/YYYY instead of MM/DD/YYYY. Dotted and
+            dashed dates are always read day first.
+
+    Returns:
+        Optional[datetime.date]: The date, None if value is empty or cannot be parsed.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return _parse(str(value), day_first)
@@ -0,0 +1,21 @@
+import logging
+
+from offermee.database.facades.main_facades import RFPFacade
+
+# Configuration
+MAX_AGE_DAYS = 90  # RFPs created longer ago are archived, as are RFPs past their end date
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+
+    try:
+        count = RFPFacade.archive_stale(max_age_days=MAX_AGE_DAYS)
+        logger.info(f"Moved {count} stale RFPs to the archive")
+    except Exception as e:
+        logger.error(f"Error in archive-rfps script: {e}")
+
+
+if __name__ == "__main__":
+    main()
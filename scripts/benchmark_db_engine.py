@@ -0,0 +1,110 @@
+"""
+Benchmarks concurrent read/write throughput of the bare SQLite engine (as used before)
+against the pooled WAL engine profile of the DatabaseManager.
+
+One writer thread inserts RFPs (one transaction each) while several reader threads
+query the new RFPs, like a scraper running next to the Streamlit dashboard.
+
+Usage:
+    python scripts/benchmark_db_engine.py [--seconds 5] [--readers 4]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import Engine, create_engine, insert, select
+from sqlalchemy.exc import OperationalError
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.models.main_models import RFPModel, RFPSource, RFPStatus
+
+
+def run_workload(engine: Engine, seconds: float, readers: int) -> Dict[str, int]:
+    DatabaseManager.Base.metadata.create_all(engine)
+    stats = {"writes": 0, "reads": 0, "locked": 0}
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + seconds
+
+    def count(key: str):
+        with lock:
+            stats[key] += 1
+
+    def writer():
+        i = 0
+        while time.perf_counter() < stop_at:
+            i += 1
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        insert(RFPModel.__table__).values(
+                            title=f"Benchmark RFP {i}",
+                            description="Python, SQL, Docker " * 20,
+                            must_have_requirements=["Python", "SQL"],
+                            nice_to_have_requirements=["Docker"],
+                            tasks=[],
+                            responsibilities=[],
+                            source=RFPSource.ONLINE,
+                            status=RFPStatus.NEW,
+                            original_link=f"https://example.com/rfp/{i}",
+                        )
+                    )
+                count("writes")
+            except OperationalError:
+                count("locked")
+
+    def reader():
+        query = (
+            select(RFPModel.__table__.c.id, RFPModel.__table__.c.title)
+            .where(RFPModel.__table__.c.status == RFPStatus.NEW)
+            .order_by(RFPModel.__table__.c.id.desc())
+            .limit(50)
+        )
+        while time.perf_counter() < stop_at:
+            try:
+                with engine.connect() as conn:
+                    conn.execute(query).all()
+                count("reads")
+            except OperationalError:
+                count("locked")
+
+    threads = [threading.Thread(target=writer)] + [
+        threading.Thread(target=reader) for _ in range(readers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return stats
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--seconds", type=float, default=5.0)
+    arg_parser.add_argument("--readers", type=int, default=4)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        variants = {
+            "bare create_engine": lambda path: create_engine(f"sqlite:///{path}"),
+            "engine profile (WAL)": lambda path: DatabaseManager.build_engine(path),
+        }
+        print(
+            f"{'variant':<22} {'writes/s':>10} {'reads/s':>10} {'locked':>8}"
+            f"  ({args.seconds:.0f}s, 1 writer, {args.readers} readers)"
+        )
+        for name, make_engine in variants.items():
+            db_path = os.path.join(tmp_dir, f"{name.split()[0]}.db")
+            stats = run_workload(make_engine(db_path), args.seconds, args.readers)
+            print(
+                f"{name:<22} {stats['writes'] / args.seconds:>10.0f} "
+                f"{stats['reads'] / args.seconds:>10.0f} {stats['locked']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
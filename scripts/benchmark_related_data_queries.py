@@ -0,0 +1,113 @@
+"""
+Counts the SQL statements the services emit while storing a freelancer with a CV
+the way save_cv_to_db does (capabilities with soft and tech skills, contact, address).
+
+Usage:
+    python scripts/benchmark_related_data_queries.py [--tech-skills 80] [--soft-skills 20]
+"""
+
+import argparse
+import os
+import tempfile
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.facades.main_facades import FreelancerFacade
+from offermee.database.models.main_models import ContactRole
+
+
+def freelancer_payload(tech_skills: int, soft_skills: int, offset: int = 0) -> Dict[str, Any]:
+    return {
+        "name": "Max Mustermann",
+        "role": "DEVELOPER",
+        "availability": "Sofort",
+        "desired_rate_min": 80.0,
+        "desired_rate_max": 100.0,
+        "offer_template": "Standard-Template",
+        "capabilities": {
+            "soft_skills": [
+                {"type": "soft", "name": f"Soft Skill {i}"}
+                for i in range(offset, offset + soft_skills)
+            ],
+            "tech_skills": [
+                {"type": "tech", "name": f"Tech Skill {i}"}
+                for i in range(offset, offset + tech_skills)
+            ],
+        },
+        "contact": {
+            "first_name": "Max",
+            "last_name": "Mustermann",
+            "phone": "+49 123 456789",
+            "email": "max@example.com",
+            "type": ContactRole.FREELANCER,
+            "address": {
+                "street": "Musterstr. 1",
+                "city": "Berlin",
+                "zip_code": "10115",
+                "country": "Deutschland",
+            },
+        },
+        "website": "https://example.com",
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--tech-skills", type=int, default=80)
+    arg_parser.add_argument("--soft-skills", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = DatabaseManager.build_engine(os.path.join(tmp_dir, "queries.db"))
+        DatabaseManager.Base.metadata.create_all(engine)
+        DatabaseManager._data_base_instance = SimpleNamespace(
+            session_maker=sessionmaker(bind=engine)
+        )
+        statements = {"count": 0}
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements["count"] += 1
+
+        def measure(label: str, action):
+            statements["count"] = 0
+            action()
+            print(f"{label:<40} {statements['count']:>6}")
+
+        print(
+            f"{'operation':<40} {'SQL':>6}"
+            f"  ({args.tech_skills} tech skills, {args.soft_skills} soft skills)"
+        )
+        freelancer = {}
+        measure(
+            "create freelancer (new skills)",
+            lambda: freelancer.update(
+                FreelancerFacade.create(
+                    freelancer_payload(args.tech_skills, args.soft_skills)
+                )
+            ),
+        )
+        measure(
+            "update freelancer (same skills)",
+            lambda: FreelancerFacade.update(
+                freelancer["id"], freelancer_payload(args.tech_skills, args.soft_skills)
+            ),
+        )
+        measure(
+            "update freelancer (half new skills)",
+            lambda: FreelancerFacade.update(
+                freelancer["id"],
+                freelancer_payload(
+                    args.tech_skills, args.soft_skills, offset=args.tech_skills // 2
+                ),
+            ),
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
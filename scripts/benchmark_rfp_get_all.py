@@ -0,0 +1,75 @@
+"""
+Micro-benchmark for RFPFacade.get_all() on 10k RFPs: the ORM path (instances + to_dict)
+against the as_dicts=True path (rows serialized directly).
+
+Usage:
+    python scripts/benchmark_rfp_get_all.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.facades.main_facades import RFPFacade
+from offermee.database.models.main_models import RFPModel, RFPSource, RFPStatus
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--rows", type=int, default=10000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = DatabaseManager.build_engine(os.path.join(tmp_dir, "get_all.db"))
+        DatabaseManager.Base.metadata.create_all(engine)
+        DatabaseManager._data_base_instance = SimpleNamespace(
+            session_maker=sessionmaker(bind=engine)
+        )
+        with engine.begin() as conn:
+            conn.execute(
+                insert(RFPModel.__table__),
+                [
+                    {
+                        "title": f"Benchmark RFP {i}",
+                        "description": "Python, SQL, Docker " * 20,
+                        "must_have_requirements": ["Python", "SQL"],
+                        "nice_to_have_requirements": ["Docker"],
+                        "tasks": ["Develop"],
+                        "responsibilities": [],
+                        "source": RFPSource.ONLINE,
+                        "status": RFPStatus.NEW,
+                        "original_link": f"https://example.com/rfp/{i}",
+                    }
+                    for i in range(args.rows)
+                ],
+            )
+
+        variants = {
+            "get_all()": lambda: RFPFacade.get_all(limit=args.rows),
+            "get_all(as_dicts=True)": lambda: RFPFacade.get_all(
+                limit=args.rows, as_dicts=True
+            ),
+        }
+        results = {name: fetch() for name, fetch in variants.items()}
+        assert results["get_all()"] == results["get_all(as_dicts=True)"]
+
+        print(f"{'variant':<24} {'best ms':>10}  ({args.rows} rows, best of {args.repeat})")
+        for name, fetch in variants.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                fetch()
+                timings.append(time.perf_counter() - start)
+            print(f"{name:<24} {min(timings) * 1000:>10.1f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
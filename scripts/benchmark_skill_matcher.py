@@ -0,0 +1,125 @@
+"""
+Benchmark of the skill matching of 1,000 RFPs x 20 freelancers: the former
+per-requirement process.extractOne loop against SkillMatchEngine (one similarity
+matrix per batch) with fuzzywuzzy and, if installed, rapidfuzz.
+
+The extractOne loop is timed on --sample RFPs and extrapolated to all RFPs.
+
+Usage:
+    python scripts/benchmark_skill_matcher.py [--rfps 1000] [--freelancers 20] [--sample 50]
+"""
+
+import argparse
+import random
+import time
+
+from fuzzywuzzy import fuzz, process
+
+from offermee.matcher.skill_match_engine import (
+    MUST_HAVE_THRESHOLD,
+    NICE_TO_HAVE_THRESHOLD,
+    SkillMatchEngine,
+    rapid_process,
+)
+
+SKILLS = [
+    "Python", "Java", "Kotlin", "TypeScript", "JavaScript", "React", "Angular",
+    "Vue.js", "Node.js", "Django", "Flask", "FastAPI", "Spring Boot", "SQL",
+    "PostgreSQL", "MySQL", "Oracle", "MongoDB", "Redis", "Kafka", "RabbitMQ",
+    "Docker", "Kubernetes", "Helm", "Terraform", "Ansible", "AWS", "Azure", "GCP",
+    "Linux", "Bash", "Git", "Jenkins", "GitLab CI", "SAP ABAP", "SAP HANA",
+    "Scrum", "Kanban", "Jira", "C#", ".NET", "C++", "Go", "Rust", "Scala",
+    "Spark", "Hadoop", "Airflow", "Pandas", "TensorFlow", "PyTorch", "MLOps",
+]  # fmt: skip
+QUALIFIERS = ["", "", "", "Senior ", "Erfahrung mit ", "Kenntnisse in "]
+
+
+def legacy_match(rfp, freelancer_skills):
+    # the former SkillMatcher.match_skills: one extractOne per requirement
+    score, details = 0.0, {}
+    for key, threshold, weight in (
+        ("must_have_requirements", MUST_HAVE_THRESHOLD, 70),
+        ("nice_to_have_requirements", NICE_TO_HAVE_THRESHOLD, 30),
+    ):
+        skills = [skill.strip().lower() for skill in rfp[key]]
+        matched = 0
+        for skill in skills:
+            match = process.extractOne(
+                skill, freelancer_skills, scorer=fuzz.partial_ratio
+            )
+            details[skill] = {"matched": match[1] >= threshold, "score": match[1]}
+            matched += match[1] >= threshold
+        if skills:
+            score += matched / len(skills) * weight
+    return score, details
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--rfps", type=int, default=1000)
+    arg_parser.add_argument("--freelancers", type=int, default=20)
+    arg_parser.add_argument("--sample", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(42)
+    rfps = [
+        {
+            "must_have_requirements": [
+                rng.choice(QUALIFIERS) + skill for skill in rng.sample(SKILLS, 6)
+            ],
+            "nice_to_have_requirements": rng.sample(SKILLS, 4),
+        }
+        for _ in range(args.rfps)
+    ]
+    freelancers = [
+        [skill.lower() for skill in rng.sample(SKILLS, 15)]
+        for _ in range(args.freelancers)
+    ]
+
+    start = time.perf_counter()
+    expected = [
+        [legacy_match(rfp, skills) for skills in freelancers]
+        for rfp in rfps[: args.sample]
+    ]
+    legacy_s = (time.perf_counter() - start) * args.rfps / args.sample
+
+    pairs = args.rfps * args.freelancers
+    print(
+        f"{'variant':<34} {'seconds':>9}  "
+        f"({args.rfps} RFPs x {args.freelancers} freelancers)"
+    )
+    print(f"{'extractOne loop (extrapolated)':<34} {legacy_s:>9.2f}")
+    engines = {"SkillMatchEngine fuzzywuzzy": SkillMatchEngine(use_rapidfuzz=False)}
+    if rapid_process is not None:
+        engines["SkillMatchEngine rapidfuzz"] = SkillMatchEngine(use_rapidfuzz=True)
+        engines["SkillMatchEngine rapidfuzz -1"] = SkillMatchEngine(
+            use_rapidfuzz=True, workers=-1
+        )
+    for name, engine in engines.items():
+        start = time.perf_counter()
+        scores = engine.score_matrix(rfps, freelancers)
+        elapsed = time.perf_counter() - start
+        sample = [
+            [engine.match(rfp, skills) for skills in freelancers]
+            for rfp in rfps[: args.sample]
+        ]
+        # rapidfuzz's partial_ratio scores short skills higher than fuzzywuzzy's
+        differing = sum(
+            got[0] != want[0]
+            for got_row, want_row in zip(sample, expected)
+            for got, want in zip(got_row, want_row)
+        )
+        assert all(
+            abs(scores[i][j] - sample[i][j][0]) < 1e-9
+            for i in range(len(sample))
+            for j in range(args.freelancers)
+        )
+        print(
+            f"{name:<34} {elapsed:>9.2f}  ({pairs / elapsed:,.0f} pairs/s, "
+            f"{differing} of {len(sample) * args.freelancers} sampled scores "
+            "differ from extractOne)"
+        )
+
+
+if __name__ == "__main__":
+    main()
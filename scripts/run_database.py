@@ -1,10 +1,53 @@
+import argparse
 import traceback
 from offermee.database.database_manager import DatabaseManager
+from offermee.database.db_connection import session_scope
+from offermee.database.document_store import offload_existing_texts
 from offermee.database.facades.main_facades import RFPFacade
 from offermee.utils.logger import CentralLogger
 
 
+def regenerate_schemas():
+    # writes the JSON schemas of all db models, unchanged files are skipped
+    written = DatabaseManager.store_json_schemas()
+    written += DatabaseManager.store_json_schemas(full=True)
+    print(f"{written} schema file(s) written.")
+
+
+def offload_documents(db_type: str):
+    # moves long document raw texts into the blob store and shrinks the db file
+    DatabaseManager.load_database(db_type=db_type)
+    with session_scope() as session:
+        moved = offload_existing_texts(session)
+    engine = DatabaseManager.get_default_session().get_bind()
+    with engine.connect() as connection:
+        connection.exec_driver_sql("VACUUM")
+    print(
+        f"{moved['documents']} document(s) with {moved['characters']} characters "
+        "moved to the blob store."
+    )
+
+
 def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument(
+        "--regenerate-schemas",
+        action="store_true",
+        help="Regenerate offermee/schemas/json/db from the db models and exit.",
+    )
+    arg_parser.add_argument(
+        "--offload-documents",
+        metavar="DB_TYPE",
+        help="Move long document raw texts of the database (e.g. PROD) into the "
+        "blob store and exit.",
+    )
+    args = arg_parser.parse_args()
+    if args.regenerate_schemas:
+        regenerate_schemas()
+        return
+    if args.offload_documents:
+        offload_documents(args.offload_documents)
+        return
     try:
         # Load the database with type "TEST" and set shall_overwrite to True
         DatabaseManager.load_database(
@@ -15,6 +15,7 @@ setup(
         "streamlit",
         "sqlalchemy",
         "fuzzywuzzy",
+        "numpy",
         "PyPDF2",
         "pycryptodome",
         "streamlit-authenticator",
@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import sessionmaker
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.facades.main_facades import BaseFacade
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """
+    Runs every test against a fresh database, which the facades use instead of the
+    configured one: by default a SQLite file with all tables in a temporary directory.
+    """
+
+    def create_engine(self) -> Engine:
+        """
+        The engine of the test database, override it to test another backend.
+        """
+        engine = DatabaseManager.build_engine(
+            os.path.join(self.tmp_dir.name, "test.db")
+        )
+        DatabaseManager.Base.metadata.create_all(engine)
+        return engine
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.engine = self.create_engine()
+        self.previous_instance = DatabaseManager._data_base_instance
+        DatabaseManager._data_base_instance = SimpleNamespace(
+            session_maker=sessionmaker(bind=self.engine)
+        )
+        BaseFacade.clear_cache()  # entries of an earlier test database
+
+    def tearDown(self):
+        DatabaseManager._data_base_instance = self.previous_instance
+        self.engine.dispose()
+        self.tmp_dir.cleanup()
@@ -0,0 +1,194 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import select, update
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.document_store import OFFLOAD_MIN_LENGTH, offload_existing_texts
+from offermee.database.facades.main_facades import (
+    DocumentFacade,
+    ReadFacade,
+    RFPFacade,
+)
+from offermee.database.models.main_models import (
+    DocumentModel,
+    DocumentRelatedType,
+    RFPSource,
+)
+from offermee.htmls.save_utils import HTML_INDEX_FILENAME, load_html, save_html
+from offermee.utils.blob_store import BlobStore, blob_hash
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestBlobStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = BlobStore(
+            os.path.join(self.tmp_dir.name, "blobs"), use_zstd=False
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_put_get_and_deduplication(self):
+        html = "<html>" + "<p>Python Developer</p>" * 1000 + "</html>"
+        digest = self.store.put(html)
+        self.assertEqual(digest, blob_hash(html))
+        self.assertEqual(self.store.put(html.encode("utf-8")), digest)
+        self.assertEqual(self.store.get_text(digest), html)
+        files = [f for _, _, names in os.walk(self.store.root) for f in names]
+        self.assertEqual(files, [f"{digest}.gz"])
+        size = os.path.getsize(os.path.join(self.store.root, digest[:2], files[0]))
+        self.assertLess(size * 10, len(html))
+        with self.assertRaises(KeyError):
+            self.store.get(blob_hash("missing"))
+
+
+class TestSaveHtml(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.previous_store = BlobStore._instance
+        BlobStore._instance = BlobStore(os.path.join(self.tmp_dir.name, "blobs"))
+        config = patch("offermee.htmls.save_utils.Config")
+        config.start().get_instance.return_value.get_user_data_dir.return_value = (
+            self.tmp_dir.name
+        )
+        self.addCleanup(config.stop)
+
+    def tearDown(self):
+        BlobStore._instance = self.previous_store
+        self.tmp_dir.cleanup()
+
+    def index_lines(self):
+        with open(os.path.join(self.tmp_dir.name, "html", HTML_INDEX_FILENAME)) as f:
+            return f.readlines()
+
+    def test_save_html(self):
+        html = "<html><p>Python Developer</p></html>"
+        digest = save_html(html, "project.html", "html")
+        self.assertEqual(digest, blob_hash(html))
+        with open(os.path.join(self.tmp_dir.name, "html", "project.html")) as f:
+            self.assertEqual(f.read(), html)
+        self.assertEqual(load_html("project.html", "html"), html)
+        # saving the same content again does not grow the index
+        save_html(html, "project.html", "html")
+        self.assertEqual(len(self.index_lines()), 1)
+        save_html("<html>changed</html>", "project.html", "html")
+        save_html(html, "project.html", "html")
+        self.assertEqual(len(self.index_lines()), 3)
+        self.assertEqual(load_html("project.html", "html"), html)
+        self.assertIsNone(load_html("unknown.html", "html"))
+
+
+class TestDocumentStore(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.previous_store = BlobStore._instance
+        BlobStore._instance = BlobStore(os.path.join(self.tmp_dir.name, "blobs"))
+        self.long_text = "Anforderungen: Python, SQL. " * OFFLOAD_MIN_LENGTH
+        self.rfp = RFPFacade.create(
+            {"title": "Python Developer", "source": RFPSource.ONLINE}
+        )
+        for name, text in [("long.txt", self.long_text), ("short.txt", "short")]:
+            DocumentFacade.create(
+                {
+                    "related_type": DocumentRelatedType.RFP,
+                    "related_id": self.rfp["id"],
+                    "document_name": name,
+                    "document_link": f"file://{name}",
+                    "document_raw_text": text,
+                }
+            )
+
+    def tearDown(self):
+        BlobStore._instance = self.previous_store
+        super().tearDown()
+
+    def stored_rows(self):
+        with self.engine.connect() as conn:
+            return {
+                row.document_name: row
+                for row in conn.execute(select(DocumentModel.__table__))
+            }
+
+    def documents(self):
+        docs = ReadFacade.get_documents_for(DocumentRelatedType.RFP, self.rfp["id"])
+        return {doc["document_name"]: doc for doc in docs}
+
+    def test_long_texts_are_stored_as_blobs(self):
+        rows = self.stored_rows()
+        self.assertIsNone(rows["long.txt"].document_raw_text)
+        self.assertEqual(
+            rows["long.txt"].document_blob_hash, blob_hash(self.long_text)
+        )
+        self.assertEqual(rows["short.txt"].document_raw_text, "short")
+        self.assertIsNone(rows["short.txt"].document_blob_hash)
+        docs = self.documents()
+        self.assertEqual(docs["long.txt"]["document_raw_text"], self.long_text)
+        self.assertEqual(docs["short.txt"]["document_raw_text"], "short")
+        # updates of other fields keep the reference
+        DocumentFacade.update(rows["long.txt"].id, {"document_name": "renamed.txt"})
+        row = self.stored_rows()["renamed.txt"]
+        self.assertEqual(row.document_blob_hash, blob_hash(self.long_text))
+
+    def test_rows_read_as_dicts_carry_the_text(self):
+        texts = {"long.txt": self.long_text, "short.txt": "short"}
+        rows = DocumentFacade.get_all(as_dicts=True)
+        self.assertEqual(
+            {row["document_name"]: row["document_raw_text"] for row in rows}, texts
+        )
+        for row in rows:
+            # also when only the raw text column is selected
+            selected = DocumentFacade.get_by_id(
+                row["id"], columns=["document_raw_text"]
+            )
+            self.assertEqual(
+                selected["document_raw_text"], texts[row["document_name"]]
+            )
+        page, _ = DocumentFacade.get_page(
+            columns=["document_name", "document_raw_text"]
+        )
+        self.assertEqual(
+            {row["document_name"]: row["document_raw_text"] for row in page}, texts
+        )
+        self.assertEqual(
+            {
+                row["document_name"]: row["document_raw_text"]
+                for row in DocumentFacade.iter_all()
+            },
+            texts,
+        )
+
+    def test_update_replaces_the_blob_reference(self):
+        doc_id = self.stored_rows()["long.txt"].id
+        updated = DocumentFacade.update(doc_id, {"document_raw_text": "now short"})
+        self.assertEqual(updated["document_raw_text"], "now short")
+        row = self.stored_rows()["long.txt"]
+        self.assertEqual(row.document_raw_text, "now short")
+        self.assertIsNone(row.document_blob_hash)
+        DocumentFacade.update(doc_id, {"document_name": "renamed.txt"})
+        renamed = self.documents()["renamed.txt"]
+        self.assertEqual(renamed["document_raw_text"], "now short")
+
+    def test_offload_existing_texts(self):
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(DocumentModel.__table__).values(
+                    document_raw_text=self.long_text, document_blob_hash=None
+                )
+            )
+        with DatabaseManager._data_base_instance.session_maker() as session:
+            moved = offload_existing_texts(session)
+            session.commit()
+        self.assertEqual(moved["documents"], 2)
+        self.assertTrue(
+            all(row.document_raw_text is None for row in self.stored_rows().values())
+        )
+        short = self.documents()["short.txt"]
+        self.assertEqual(short["document_raw_text"], self.long_text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import datetime
+import unittest
+
+from offermee.database.facades.main_facades import TransformFacade
+from offermee.utils.date_parser import parse_date
+
+
+class TestDateParser(unittest.TestCase):
+    def test_numeric_formats(self):
+        expected = datetime.date(2025, 3, 1)
+        for value in [
+            "01.03.2025",
+            "1.3.2025",
+            "01.03.25",
+            "2025-03-01",
+            "2025-03-01T10:15:00Z",
+            "01-03-2025",
+            "03/01/2025",
+            " 01.03.2025 ",
+        ]:
+            self.assertEqual(parse_date(value), expected, value)
+        # day first if the first number cannot be a month
+        self.assertEqual(parse_date("13/03/2025"), datetime.date(2025, 3, 13))
+
+    def test_day_first_slash_dates(self):
+        self.assertEqual(parse_date("03/04/2025"), datetime.date(2025, 3, 4))
+        self.assertEqual(
+            parse_date("03/04/2025", day_first=True), datetime.date(2025, 4, 3)
+        )
+        # month first if the second number cannot be a month
+        self.assertEqual(
+            parse_date("03/13/2025", day_first=True), datetime.date(2025, 3, 13)
+        )
+        # other formats do not depend on day_first
+        self.assertEqual(
+            parse_date("01.03.2025", day_first=True), datetime.date(2025, 3, 1)
+        )
+        self.assertEqual(
+            parse_date("3/2025", day_first=True), datetime.date(2025, 3, 1)
+        )
+        # the TransformService reads slash dates day first, as it always did
+        self.assertEqual(
+            TransformFacade.parse_date("03/04/2025"), datetime.date(2025, 4, 3)
+        )
+
+    def test_month_and_year(self):
+        expected = datetime.date(2025, 3, 1)
+        for value in ["03.2025", "3/2025", "2025-03", "März 2025", "March 2025"]:
+            self.assertEqual(parse_date(value), expected, value)
+
+    def test_month_names(self):
+        expected = datetime.date(2025, 3, 15)
+        for value in [
+            "15. März 2025",
+            "15 Maerz 2025",
+            "15. Mrz. 2025",
+            "15 March 2025",
+            "March 15, 2025",
+            "Mar 15th 2025",
+        ]:
+            self.assertEqual(parse_date(value), expected, value)
+        self.assertEqual(parse_date("1. Oktober 2024"), datetime.date(2024, 10, 1))
+        self.assertEqual(parse_date("Dez 2024"), datetime.date(2024, 12, 1))
+
+    def test_unparseable_and_passthrough(self):
+        for value in [None, "", "ASAP", "ab sofort", "31.02.2025"]:
+            self.assertIsNone(parse_date(value), value)
+        today = datetime.date.today()
+        self.assertEqual(parse_date(today), today)
+        self.assertEqual(
+            parse_date(datetime.datetime(2025, 3, 1, 8, 0)), datetime.date(2025, 3, 1)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, undefer_group
+
+from offermee.database.facades.main_facades import RFPFacade
+from offermee.database.models.main_models import (
+    HEAVY_COLUMNS_GROUP,
+    RFPModel,
+    RFPSource,
+)
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestDeferredColumns(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.description = "Python, SQL und Cloud. " * 200
+        self.rfp = RFPFacade.create(
+            {
+                "title": "Python Developer",
+                "source": RFPSource.ONLINE,
+                "description": self.description,
+                "must_have_requirements": ["Python"],
+            }
+        )
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self.record)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self.record)
+        super().tearDown()
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_heavy_columns_are_not_loaded_by_default(self):
+        with Session(self.engine) as session:
+            rfp = session.scalars(select(RFPModel)).one()
+            unloaded = inspect(rfp).unloaded
+            self.assertIn("description", unloaded)
+            self.assertIn("must_have_requirements", unloaded)
+            self.assertNotIn("title", unloaded)
+            self.assertNotIn("description", self.statements[-1])
+            # loaded on access with a separate statement
+            self.assertEqual(rfp.description, self.description)
+            self.assertIn("description", self.statements[-1])
+
+    def test_undefer_group_loads_them_at_once(self):
+        with Session(self.engine) as session:
+            rfp = session.scalars(
+                select(RFPModel).options(undefer_group(HEAVY_COLUMNS_GROUP))
+            ).one()
+            self.assertEqual(inspect(rfp).unloaded, set())
+            count = len(self.statements)
+            self.assertEqual(rfp.must_have_requirements, ["Python"])
+            self.assertEqual(len(self.statements), count)
+
+    def test_service_reads(self):
+        self.assertEqual(
+            RFPFacade.get_by_id(self.rfp["id"])["description"], self.description
+        )
+        self.assertEqual(RFPFacade.get_all()[0]["description"], self.description)
+        self.statements.clear()
+        self.assertEqual(
+            RFPFacade.get_by_id(self.rfp["id"], columns=["title"]),
+            {"id": self.rfp["id"], "title": "Python Developer"},
+        )
+        self.assertEqual(len(self.statements), 1)
+        self.assertNotIn("description", self.statements[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import text
+
+from offermee.database.database_manager import DatabaseManager, EngineProfile
+
+
+class TestEngineProfile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "test.db")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def pragma(self, connection, name):
+        return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+    def test_pragmas_are_applied_on_every_pooled_connection(self):
+        engine = DatabaseManager.build_engine(self.db_path)
+        self.addCleanup(engine.dispose)
+        # two connections checked out at once are two DBAPI connections
+        with engine.connect() as first, engine.connect() as second:
+            for connection in (first, second):
+                self.assertEqual(self.pragma(connection, "journal_mode"), "wal")
+                self.assertEqual(self.pragma(connection, "busy_timeout"), 5000)
+                self.assertEqual(self.pragma(connection, "synchronous"), 1)  # NORMAL
+                self.assertEqual(self.pragma(connection, "cache_size"), -64000)
+
+    def test_custom_profile(self):
+        engine = DatabaseManager.build_engine(
+            self.db_path, EngineProfile(busy_timeout=250, synchronous="FULL")
+        )
+        self.addCleanup(engine.dispose)
+        with engine.connect() as connection:
+            self.assertEqual(self.pragma(connection, "busy_timeout"), 250)
+            self.assertEqual(self.pragma(connection, "synchronous"), 2)  # FULL
+
+    def test_readers_are_not_blocked_by_an_open_write(self):
+        engine = DatabaseManager.build_engine(self.db_path)
+        self.addCleanup(engine.dispose)
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            connection.execute(text("INSERT INTO items (id) VALUES (1)"))
+        with engine.connect() as writer, engine.connect() as reader:
+            writer.execute(text("INSERT INTO items (id) VALUES (2)"))  # not committed
+            self.assertEqual(
+                reader.execute(text("SELECT count(*) FROM items")).scalar(), 1
+            )
+            writer.commit()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import time
+import unittest
+
+from sqlalchemy import event
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.facades.entity_cache import EntityCache
+from offermee.database.facades.main_facades import BaseFacade, RFPFacade
+from offermee.database.models.main_models import RFPModel, RFPSource
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestEntityCache(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.selects = 0
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        self.rfp = RFPFacade.create({"title": "Python", "source": RFPSource.ONLINE})
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+        super().tearDown()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.selects += 1
+
+    def titles(self):
+        return sorted(rfp["title"] for rfp in RFPFacade.get_all(as_dicts=True))
+
+    def test_repeated_reads_are_served_from_memory(self):
+        self.selects = 0
+        hits = BaseFacade.cache_stats()["hits"]
+        for _ in range(5):
+            self.assertEqual(self.titles(), ["Python"])
+            self.assertEqual(RFPFacade.get_by_id(self.rfp["id"])["title"], "Python")
+            self.assertEqual(
+                RFPFacade.get_first_by({"title": "Python"})["id"], self.rfp["id"]
+            )
+        self.assertEqual(self.selects, 3)
+        self.assertEqual(BaseFacade.cache_stats()["hits"] - hits, 12)
+
+    def test_returned_dicts_are_copies(self):
+        RFPFacade.get_by_id(self.rfp["id"])["title"] = "changed"
+        RFPFacade.get_all()[0]["title"] = "changed"
+        self.assertEqual(RFPFacade.get_by_id(self.rfp["id"])["title"], "Python")
+        self.assertEqual(self.titles(), ["Python"])
+
+    def test_nested_values_are_copies(self):
+        rfp = RFPFacade.create(
+            {
+                "title": "Java",
+                "source": RFPSource.ONLINE,
+                "must_have_requirements": ["Java"],
+            }
+        )
+        # the first (loading) and the later (cached) reads return copies
+        for _ in range(2):
+            RFPFacade.get_by_id(rfp["id"])["must_have_requirements"].append("Spring")
+            RFPFacade.get_all()[-1]["must_have_requirements"].clear()
+        self.assertEqual(
+            RFPFacade.get_by_id(rfp["id"])["must_have_requirements"], ["Java"]
+        )
+        self.assertEqual(RFPFacade.get_all()[-1]["must_have_requirements"], ["Java"])
+
+    def test_as_dicts_is_part_of_the_key(self):
+        misses = BaseFacade.cache_stats()["misses"]
+        RFPFacade.get_all()
+        RFPFacade.get_all(as_dicts=True)
+        RFPFacade.get_all_by({"title": "Python"})
+        RFPFacade.get_all_by({"title": "Python"}, as_dicts=True)
+        self.assertEqual(BaseFacade.cache_stats()["misses"] - misses, 4)
+
+    def test_writes_invalidate(self):
+        self.assertEqual(self.titles(), ["Python"])
+        RFPFacade.create({"title": "Java", "source": RFPSource.ONLINE})
+        self.assertEqual(self.titles(), ["Java", "Python"])
+        RFPFacade.update(self.rfp["id"], {"title": "Rust"})
+        self.assertEqual(self.titles(), ["Java", "Rust"])
+        self.assertIsNone(RFPFacade.get_first_by({"title": "Python"}))
+        # writes outside of the facades invalidate as well
+        with DatabaseManager.get_default_session() as session:
+            session.get(RFPModel, self.rfp["id"]).title = "Go"
+            session.commit()
+        self.assertEqual(self.titles(), ["Go", "Java"])
+        RFPFacade.delete(self.rfp["id"])
+        self.assertEqual(self.titles(), ["Java"])
+
+    def test_rolled_back_unit_of_work_is_not_cached(self):
+        with self.assertRaises(RuntimeError):
+            with DatabaseManager.unit_of_work():
+                RFPFacade.create({"title": "Java", "source": RFPSource.ONLINE})
+                self.assertEqual(self.titles(), ["Java", "Python"])
+                raise RuntimeError("abort")
+        self.assertEqual(self.titles(), ["Python"])
+
+    def test_lru_and_ttl(self):
+        cache = EntityCache(maxsize=2, ttl=60)
+        for key in ["a", "b", "c"]:
+            cache.get_or_load("items", (key,), lambda: key)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.get_or_load("items", ("c",), lambda: "new"), "c")
+        self.assertEqual(cache.get_or_load("items", ("a",), lambda: "new"), "new")
+        cache.ttl = 0.01
+        cache.get_or_load("other", ("x",), lambda: 1)
+        time.sleep(0.02)
+        self.assertEqual(cache.get_or_load("other", ("x",), lambda: 2), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from sqlalchemy import event
+
+from offermee.database import history_sink
+from offermee.database.db_connection import session_scope
+from offermee.database.facades.main_facades import ReadFacade, RFPFacade
+from offermee.database.models.main_models import HistoryType, RFPSource, RFPStatus
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestHistorySink(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.rfp = RFPFacade.create(
+            {"title": "Python Developer", "source": RFPSource.ONLINE}
+        )
+
+    def tearDown(self):
+        history_sink.disable_background_writer()
+        super().tearDown()
+
+    def histories(self, record_id):
+        return ReadFacade.get_history_for(HistoryType.RFP, record_id)
+
+    def test_update_stores_compact_diff_with_one_insert(self):
+        inserts = []
+
+        @event.listens_for(self.engine, "before_cursor_execute")
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO histories"):
+                inserts.append(statement)
+
+        RFPFacade.update(
+            self.rfp["id"],
+            {"title": "Senior Python Developer", "description": "x" * 10000},
+        )
+        event.remove(self.engine, "before_cursor_execute", _count)
+
+        self.assertEqual(len(inserts), 1)
+        history = self.histories(self.rfp["id"])[-1]
+        self.assertEqual(
+            history["changes"]["title"],
+            {"old": "Python Developer", "new": "Senior Python Developer"},
+        )
+        self.assertLess(len(history["changes"]["description"]["new"]), 300)
+        self.assertNotIn("x" * 300, history["description"])
+
+    def test_rollback_discards_buffered_entries(self):
+        with self.assertRaises(RuntimeError):
+            with session_scope() as session:
+                history_sink.record_history(session, HistoryType.RFP, 4711, "never")
+                raise RuntimeError("rollback")
+        self.assertEqual(self.histories(4711), [])
+
+    def test_background_writer(self):
+        history_sink.enable_background_writer()
+        RFPFacade.update(self.rfp["id"], {"status": RFPStatus.OFFERED})
+        history_sink.flush_background_writer()
+        history = self.histories(self.rfp["id"])[-1]
+        self.assertEqual(history["changes"]["status"], {"old": "NEW", "new": "OFFERED"})
+
+
+if __name__ == "__main__":
+    unittest.main()
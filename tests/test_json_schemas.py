@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from offermee.database import database_manager
+from offermee.database.database_manager import SCHEMA_DIR, DatabaseManager
+from offermee.database.models.main_models import RFPModel
+
+
+class TestJsonSchemas(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(database_manager, "SCHEMA_DIR", self.tmp_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_only_changed_schemas_are_written(self):
+        models = len(DatabaseManager.Base.registry.mappers)
+        self.assertGreater(models, 1)
+        self.assertEqual(DatabaseManager.store_json_schemas(), models)
+        self.assertEqual(DatabaseManager.store_json_schemas(), 0)
+        path = os.path.join(self.tmp_dir.name, f"{RFPModel.__name__}.schema.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{}")
+        self.assertEqual(DatabaseManager.store_json_schemas(), 1)
+        self.assertEqual(DatabaseManager.store_json_schemas(full=True), models)
+
+    def test_stored_schemas_are_up_to_date(self):
+        DatabaseManager.store_json_schemas()
+        names = [n for n in os.listdir(self.tmp_dir.name) if n.endswith(".schema.json")]
+        self.assertIn(f"{RFPModel.__name__}.schema.json", names)
+        for name in sorted(names):
+            with open(os.path.join(self.tmp_dir.name, name), encoding="utf-8") as f:
+                generated = f.read()
+            with open(os.path.join(SCHEMA_DIR, name), encoding="utf-8") as f:
+                self.assertEqual(f.read(), generated, name)
+
+    def test_database_initialization_does_not_write_schemas(self):
+        db_path = os.path.join(self.tmp_dir.name, "test.db")
+        with mock.patch.object(
+            DatabaseManager, "get_db_url", return_value=db_path
+        ), mock.patch.object(DatabaseManager, "store_json_schemas") as store:
+            database = DatabaseManager._DataBase("TEST")
+            database.engine.dispose()
+        store.assert_not_called()
+        self.assertTrue(os.path.exists(db_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from offermee.database.facades.main_facades import (
+    FreelancerFacade,
+    MatchingFacade,
+    RFPFacade,
+)
+from offermee.database.models.main_models import RFPSource, RFPStatus
+from offermee.database.query_metrics import track_queries
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestMatchingScores(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.python = RFPFacade.create(
+            {
+                "title": "Python Developer",
+                "source": RFPSource.ONLINE,
+                "must_have_requirements": ["Python", "SQL"],
+                "nice_to_have_requirements": ["Docker"],
+                "max_hourly_rate": 100.0,
+            }
+        )
+        self.java = RFPFacade.create(
+            {
+                "title": "Java Developer",
+                "source": RFPSource.ONLINE,
+                "must_have_requirements": ["Java", "Spring"],
+            }
+        )
+        self.freelancer = FreelancerFacade.create(
+            {
+                "name": "Erika Mustermann",
+                "website": "https://example.com",
+                "role": "DEVELOPER",
+                "desired_rate_min": 90.0,
+                "capabilities": {
+                    "tech_skills": [
+                        {"type": "tech", "name": "Python"},
+                        {"type": "tech", "name": "PostgreSQL"},
+                    ]
+                },
+            }
+        )
+
+
+    def test_refresh_scores_changed_pairs_only(self):
+        result = MatchingFacade.refresh()
+        self.assertEqual((result.created, result.updated), (2, 0))
+        matches = MatchingFacade.get_matches(self.freelancer["id"])
+        self.assertEqual(
+            [match["rfp_id"] for match in matches],
+            [self.python["id"], self.java["id"]],
+        )
+        best = matches[0]
+        # Python and SQL (in PostgreSQL) matched, Docker not; rate 10 below the max
+        self.assertEqual(best["skill_score"], 70.0)
+        self.assertEqual(best["price_score"], 90.0)
+        self.assertAlmostEqual(best["matching_score"], 70 * 0.7 + 90 * 0.3)
+        self.assertTrue(best["match_details"]["python"]["matched"])
+
+        result = MatchingFacade.refresh()
+        self.assertEqual((result.created, result.updated, result.unchanged), (0, 0, 2))
+
+        RFPFacade.update(self.java["id"], {"must_have_requirements": ["Python"]})
+        result = MatchingFacade.refresh()
+        self.assertEqual((result.updated, result.unchanged), (1, 1))
+        java = MatchingFacade.get_matches(self.freelancer["id"])[1]
+        self.assertEqual((java["rfp_id"], java["skill_score"]), (self.java["id"], 70.0))
+
+    def test_matches_of_live_new_rfps(self):
+        MatchingFacade.refresh()
+        RFPFacade.update(self.java["id"], {"status": RFPStatus.OFFERED})
+        RFPFacade.delete(self.python["id"])
+        self.assertEqual(MatchingFacade.get_matches(self.freelancer["id"]), [])
+        matches = MatchingFacade.get_matches(self.freelancer["id"], status=None)
+        self.assertEqual([match["rfp_id"] for match in matches], [self.java["id"]])
+
+    def test_matcher_query_uses_the_index(self):
+        MatchingFacade.refresh()
+        with track_queries() as counter:
+            MatchingFacade.get_matches(self.freelancer["id"])
+        self.assertEqual(counter.count, 1)
+        with self.engine.connect() as conn:
+            plan = conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + counter.statements[0],
+                (self.freelancer["id"], 0.0, RFPStatus.NEW.name),
+            ).all()
+        self.assertIn("idx_matching_freelancer_score", str(plan))
+
+
+if __name__ == "__main__":
+    unittest.main()
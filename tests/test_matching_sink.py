@@ -0,0 +1,69 @@
+import unittest
+
+from offermee.database.facades.main_facades import (
+    FreelancerFacade,
+    MatchingFacade,
+    RFPFacade,
+)
+from offermee.database.matching_sink import (
+    disable_matching_worker,
+    enable_matching_worker,
+    flush_matching_worker,
+)
+from offermee.database.models.main_models import RFPSource
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestMatchingSink(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.freelancer = FreelancerFacade.create(
+            {
+                "name": "Erika Mustermann",
+                "website": "https://example.com",
+                "role": "DEVELOPER",
+                "capabilities": {"tech_skills": [{"type": "tech", "name": "Python"}]},
+            }
+        )
+
+    def tearDown(self):
+        disable_matching_worker()
+        super().tearDown()
+
+    def store(self, titles):
+        # as the scrapers store their RFPs
+        return RFPFacade.bulk_upsert(
+            [
+                {
+                    "title": title,
+                    "source": RFPSource.ONLINE,
+                    "original_link": f"https://example.com/{title}",
+                    "must_have_requirements": [title],
+                }
+                for title in titles
+            ],
+            conflict_keys=["original_link"],
+        )
+
+    def test_new_rfps_are_scored_on_commit(self):
+        enable_matching_worker()
+        stored = self.store(["Python", "Java"])
+        flush_matching_worker()
+        matches = MatchingFacade.get_matches(self.freelancer["id"])
+        self.assertEqual(
+            [match["rfp_id"] for match in matches], [rfp["id"] for rfp in stored]
+        )
+        self.assertEqual(matches[0]["skill_score"], 70.0)
+
+        # updates of stored RFPs are not ingestion
+        self.store(["Python"])
+        flush_matching_worker()
+        self.assertEqual(MatchingFacade.refresh().unchanged, 2)
+
+    def test_without_worker_nothing_is_scored(self):
+        self.store(["Python"])
+        self.assertEqual(MatchingFacade.get_matches(self.freelancer["id"]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import (
+    Column,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    inspect,
+    select,
+    text,
+)
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.migrations import (
+    MIGRATIONS,
+    MigrationOps,
+    schema_migrations,
+    upgrade_database,
+)
+from offermee.database.models import main_models  # noqa: F401 registers the models
+
+
+class TestMigrations(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.engine = DatabaseManager.build_engine(
+            os.path.join(self.tmp_dir.name, "migrations.db")
+        )
+        self.metadata = DatabaseManager.Base.metadata
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def index_names(self, table_name):
+        return {idx["name"] for idx in inspect(self.engine).get_indexes(table_name)}
+
+    def test_fresh_database_records_all_migrations(self):
+        self.assertEqual(upgrade_database(self.engine, self.metadata), [])
+        with self.engine.connect() as conn:
+            versions = conn.execute(schema_migrations.select()).all()
+        self.assertEqual(
+            [row.version for row in versions], [m.version for m in MIGRATIONS]
+        )
+        self.assertIn("idx_rfp_status_live", self.index_names("rfps"))
+
+    def test_existing_database_gets_missing_indexes(self):
+        # a database created before the lookup indexes existed
+        self.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("DROP INDEX idx_rfp_status_live"))
+            conn.execute(text("DROP INDEX idx_history_related"))
+
+        with self.engine.begin() as conn:
+            MIGRATIONS[0].upgrade(MigrationOps(conn, self.metadata))
+        self.assertIn("idx_rfp_status", self.index_names("rfps"))
+        self.assertIn("idx_history_related", self.index_names("histories"))
+
+        applied = upgrade_database(self.engine, self.metadata)
+        self.assertIn(5, applied)
+        # migration 5 replaces the status index by the partial one
+        self.assertNotIn("idx_rfp_status", self.index_names("rfps"))
+        self.assertIn("idx_rfp_status_live", self.index_names("rfps"))
+        self.assertEqual(upgrade_database(self.engine, self.metadata), [])
+
+    def test_existing_database_gets_search_index(self):
+        self.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            for name in ["rfps_fts_ai", "rfps_fts_ad", "rfps_fts_au"]:
+                conn.execute(text(f"DROP TRIGGER {name}"))
+            conn.execute(text("DROP TABLE rfps_fts"))
+            conn.execute(
+                main_models.RFPModel.__table__.insert().values(
+                    title="Rust Developer", source=main_models.RFPSource.ONLINE
+                )
+            )
+
+        self.assertIn(3, upgrade_database(self.engine, self.metadata))
+        with self.engine.connect() as conn:
+            match = "SELECT rowid FROM rfps_fts WHERE rfps_fts MATCH 'rust'"
+            self.assertEqual(len(conn.execute(text(match)).all()), 1)
+
+    def test_add_column_and_rebuild_table(self):
+        old_metadata = MetaData()
+        Table(
+            "items",
+            old_metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String),
+        )
+        old_metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("INSERT INTO items (name) VALUES ('a'), ('b')"))
+
+        new_metadata = MetaData()
+        Table(
+            "items",
+            new_metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String, nullable=False),
+            Column("note", String, nullable=True),
+            Column("code", String, unique=True),
+            Index("idx_items_name", "name"),
+        )
+        with self.engine.begin() as conn:
+            op = MigrationOps(conn, new_metadata)
+            self.assertTrue(op.add_column("items", "note"))  # ALTER TABLE
+            self.assertTrue(op.add_column("items", "code"))  # table rebuild
+            self.assertFalse(op.add_column("items", "note"))
+            self.assertFalse(op.create_index("items", "idx_items_name"))  # rebuilt
+
+        columns = {col["name"]: col for col in inspect(self.engine).get_columns("items")}
+        self.assertEqual(set(columns), {"id", "name", "note", "code"})
+        self.assertFalse(columns["name"]["nullable"])
+        self.assertIn("idx_items_name", self.index_names("items"))
+        with self.engine.connect() as conn:
+            names = conn.execute(text("SELECT name FROM items ORDER BY id")).scalars()
+            self.assertEqual(list(names), ["a", "b"])
+
+    def test_rebuild_fills_new_not_null_columns(self):
+        old_metadata = MetaData()
+        Table("items", old_metadata, Column("id", Integer, primary_key=True))
+        old_metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("INSERT INTO items (id) VALUES (1), (2)"))
+
+        def items(*columns):
+            metadata = MetaData()
+            Table(
+                "items",
+                metadata,
+                Column("id", Integer, primary_key=True),
+                Column("score", Float, nullable=False, default=0.0),
+                Column("label", String, nullable=False, default=lambda: "new"),
+                *columns,
+            )
+            return metadata
+
+        with self.engine.begin() as conn:
+            op = MigrationOps(conn, items())
+            self.assertTrue(op.add_column("items", "score"))
+            self.assertFalse(op.add_column("items", "label"))  # the same rebuild
+        with self.engine.begin() as conn:
+            op = MigrationOps(conn, items(Column("code", String, nullable=False)))
+            # no default for the existing rows: refused before the table is touched
+            with self.assertRaisesRegex(ValueError, "items.code"):
+                op.add_column("items", "code")
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(text("SELECT * FROM items ORDER BY id")).all()
+        self.assertEqual(
+            [tuple(row) for row in rows], [(1, 0.0, "new"), (2, 0.0, "new")]
+        )
+
+    def test_existing_database_gets_rfp_matching_scores(self):
+        self.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("DROP TABLE matching_scores"))
+            # the table as created before migration 6
+            conn.execute(
+                text(
+                    "CREATE TABLE matching_scores (id INTEGER PRIMARY KEY, "
+                    "project_id INTEGER NOT NULL, freelancer_id INTEGER NOT NULL, "
+                    "matching_score FLOAT NOT NULL, match_details JSON, "
+                    "matched_at DATETIME NOT NULL, "
+                    "UNIQUE (project_id, freelancer_id))"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO matching_scores (project_id, freelancer_id, "
+                    "matching_score, matched_at) VALUES (1, 1, 80.0, '2025-01-01')"
+                )
+            )
+
+        self.assertIn(6, upgrade_database(self.engine, self.metadata))
+        with self.engine.connect() as conn:
+            # the project-keyed scores are dropped, refresh recomputes them per RFP
+            count = text("SELECT COUNT(*) FROM matching_scores")
+            self.assertEqual(conn.execute(count).scalar(), 0)
+        columns = {
+            col["name"]: col
+            for col in inspect(self.engine).get_columns("matching_scores")
+        }
+        self.assertTrue(columns["project_id"]["nullable"])
+        self.assertIn("rfp_hash", columns)
+        self.assertIn(
+            "idx_matching_freelancer_score", self.index_names("matching_scores")
+        )
+
+    def test_existing_database_gets_skill_index(self):
+        self.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("DROP TABLE skill_index"))
+            conn.execute(
+                main_models.RFPModel.__table__.insert().values(
+                    title="Python Developer",
+                    source=main_models.RFPSource.ONLINE,
+                    must_have_requirements=["Python"],
+                )
+            )
+
+        self.assertIn(7, upgrade_database(self.engine, self.metadata))
+        with self.engine.connect() as conn:
+            terms = conn.execute(text("SELECT term FROM skill_index")).scalars()
+            self.assertIn("python", set(terms))
+
+    def test_existing_database_gets_rfp_skill_ids(self):
+        self.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("DROP TABLE skill_aliases"))
+            for table_name in ("rfps", "rfps_archive"):
+                for column in ("must_have_skill_ids", "nice_to_have_skill_ids"):
+                    conn.execute(text(f"ALTER TABLE {table_name} DROP COLUMN {column}"))
+            conn.execute(text("INSERT INTO skills (name, type) VALUES ('C#', 'tech')"))
+            conn.execute(
+                main_models.RFPModel.__table__.insert().values(
+                    title=".NET Developer",
+                    source=main_models.RFPSource.ONLINE,
+                    must_have_requirements=["c sharp", "Blazor"],
+                )
+            )
+
+        self.assertIn(8, upgrade_database(self.engine, self.metadata))
+        with self.engine.connect() as conn:
+            skill_ids = conn.execute(
+                select(main_models.RFPModel.__table__.c.must_have_skill_ids)
+            ).scalar_one()
+            terms = conn.execute(text("SELECT term FROM skill_index")).scalars()
+            self.assertIn("#1", set(terms))
+        self.assertEqual(skill_ids, [1, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from datetime import date
+
+from sqlalchemy import inspect
+
+from offermee.database.facades.main_facades import RFPFacade
+from offermee.database.models.main_models import (
+    AddressModel,
+    ContactModel,
+    FreelancerModel,
+    RFPModel,
+    RFPSource,
+    RFPStatus,
+)
+from offermee.database.models.model_registry import (
+    build_model_metadata,
+    get_model_metadata,
+)
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestModelRegistry(unittest.TestCase):
+    def test_metadata_is_computed_once_per_model(self):
+        metadata = get_model_metadata(RFPModel)
+        self.assertIs(get_model_metadata(RFPModel), metadata)
+        self.assertIs(get_model_metadata(RFPModel()), metadata)
+        rebuilt = build_model_metadata(inspect(RFPModel))
+        self.assertEqual(metadata.column_keys, rebuilt.column_keys)
+        self.assertEqual(set(metadata.relationships), set(rebuilt.relationships))
+
+    def test_mapper_information(self):
+        contact = get_model_metadata(ContactModel)
+        self.assertEqual(contact.primary_keys, ("id",))
+        self.assertIn("phone", contact.single_unique_keys)
+        self.assertIn("email", contact.single_unique_keys)
+        self.assertEqual(contact.relationships["address"].target, AddressModel)
+        self.assertFalse(contact.relationships["address"].uselist)
+        self.assertIn("created_at", contact.datetime_columns)
+        address = get_model_metadata(AddressModel)
+        self.assertEqual(
+            address.multi_unique_constraints,
+            (
+                {
+                    "name": "unique_address",
+                    "columns": ["street", "city", "zip_code", "country"],
+                },
+            ),
+        )
+        freelancer = get_model_metadata(FreelancerModel)
+        self.assertEqual(
+            freelancer.column_names,
+            tuple(column.name for column in FreelancerModel.__table__.columns),
+        )
+
+    def test_projection(self):
+        projection = get_model_metadata(RFPModel).projection(["title"])
+        self.assertEqual(projection.names, ("id", "title"))
+        self.assertEqual(
+            projection.to_dict((1, "Python")), {"id": 1, "title": "Python"}
+        )
+        with self.assertRaises(ValueError):
+            get_model_metadata(RFPModel).projection(["unknown"])
+
+
+class TestRowDicts(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        for title, status in [("Python", RFPStatus.NEW), ("Java", RFPStatus.OFFERED)]:
+            RFPFacade.create(
+                {
+                    "title": title,
+                    "source": RFPSource.ONLINE,
+                    "status": status,
+                    "must_have_requirements": [title, "SQL"],
+                    "start_date": date(2025, 4, 3),
+                    "description": f"{title} " * 100,
+                }
+            )
+
+    def test_rows_read_as_dicts_equal_the_serialized_instances(self):
+        service = RFPFacade.SERVICE
+        rows = service.get_all(as_dicts=True)
+        self.assertEqual(rows, service.get_all())
+        self.assertEqual(rows[0]["status"], RFPStatus.NEW)
+        self.assertEqual(rows[0]["must_have_requirements"], ["Python", "SQL"])
+        pattern = {"status": RFPStatus.OFFERED}
+        self.assertEqual(
+            service.get_all_by(pattern, as_dicts=True), service.get_all_by(pattern)
+        )
+        instance = RFPModel(title="Go", source=RFPSource.EMAIL)
+        self.assertEqual(instance.to_dict()["title"], "Go")
+        self.assertEqual(
+            list(instance.to_dict()), list(get_model_metadata(RFPModel).column_names)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
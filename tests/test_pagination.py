@@ -0,0 +1,83 @@
+import unittest
+
+from offermee.database.facades.main_facades import RFPFacade
+from offermee.database.models.main_models import RFPSource, RFPStatus
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestPagination(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        # duplicate and missing rates, so pages break inside ties and NULL runs
+        rates = [80.0, None, 100.0, 80.0, None, 120.0, 100.0, None, 80.0, 90.0, None]
+        self.rfps = [
+            RFPFacade.create(
+                {
+                    "title": f"RFP {i}",
+                    "source": RFPSource.ONLINE,
+                    "max_hourly_rate": rate,
+                    "status": RFPStatus.NEW if i % 2 else RFPStatus.OFFERED,
+                }
+            )
+            for i, rate in enumerate(rates)
+        ]
+
+    def pages(self, page_size, **kwargs):
+        ids, after_id, pages = [], None, 0
+        while True:
+            page, after_id = RFPFacade.get_page(
+                after_id=after_id, page_size=page_size, **kwargs
+            )
+            ids += [rfp["id"] for rfp in page]
+            pages += 1
+            if after_id is None:
+                return ids, pages
+
+    def expected(self, descending):
+        def key(rfp):
+            rate = rfp["max_hourly_rate"]
+            if descending:  # NULLs last, ties by descending id
+                return (rate is None, -(rate or 0), -rfp["id"])
+            return (rate is not None, rate or 0, rfp["id"])
+
+        return [rfp["id"] for rfp in sorted(self.rfps, key=key)]
+
+    def test_ascending_pages_with_nulls(self):
+        for page_size in (1, 2, 3, 4, 11, 20):
+            ids, pages = self.pages(page_size, order_by="max_hourly_rate")
+            self.assertEqual(ids, self.expected(descending=False), page_size)
+            self.assertEqual(pages, max(1, -(-len(self.rfps) // page_size)))
+
+    def test_descending_pages_with_nulls(self):
+        for page_size in (1, 2, 3, 4, 11, 20):
+            ids, _ = self.pages(page_size, order_by="-max_hourly_rate")
+            self.assertEqual(ids, self.expected(descending=True), page_size)
+
+    def test_id_order_pattern_and_columns(self):
+        ids, _ = self.pages(3, order_by="-id")
+        self.assertEqual(ids, [rfp["id"] for rfp in reversed(self.rfps)])
+        page, _ = RFPFacade.get_page(
+            pattern={"status": RFPStatus.NEW}, page_size=100, columns=["title"]
+        )
+        self.assertEqual([set(rfp) for rfp in page], [{"id", "title"}] * 5)
+        with self.assertRaises(ValueError):
+            RFPFacade.get_page(order_by="unknown")
+
+    def test_deleted_cursor_restarts(self):
+        page, after_id = RFPFacade.get_page(page_size=3, order_by="max_hourly_rate")
+        RFPFacade.SERVICE.delete(after_id, soft_delete=False)
+        restarted, _ = RFPFacade.get_page(
+            after_id=after_id, page_size=3, order_by="max_hourly_rate"
+        )
+        self.assertEqual(restarted[0]["id"], page[0]["id"])
+
+    def test_iter_all_returns_every_row_once(self):
+        for batch_size in (1, 4, 11, 500):
+            ids = [rfp["id"] for rfp in RFPFacade.iter_all(batch_size=batch_size)]
+            self.assertEqual(ids, [rfp["id"] for rfp in self.rfps], batch_size)
+        offered = list(RFPFacade.iter_all(pattern={"status": RFPStatus.OFFERED}))
+        self.assertEqual(len(offered), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from offermee.database.facades.main_facades import RFPFacade
+from offermee.database.models.main_models import RFPSource, RFPStatus
+from offermee.database.query_metrics import (
+    normalize_statement,
+    query_metrics,
+    track_queries,
+)
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestQueryMetrics(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.previous_threshold = query_metrics.slow_query_ms
+        self.rfp = RFPFacade.create(
+            {"title": "Python Developer", "source": RFPSource.ONLINE}
+        )
+        query_metrics.reset()
+
+    def tearDown(self):
+        query_metrics.slow_query_ms = self.previous_threshold
+        query_metrics.reset()
+        super().tearDown()
+
+    def test_statements_are_recorded_per_facade_method(self):
+        RFPFacade.get_all_by({"status": RFPStatus.NEW}, as_dicts=True)
+        RFPFacade.update(self.rfp["id"], {"title": "Senior Python Developer"})
+        callers = {row["caller"]: row for row in query_metrics.by_caller()}
+        self.assertEqual(callers["RFPFacade.get_all_by"]["count"], 1)
+        self.assertIn("RFPFacade.update", callers)
+        update = next(
+            row
+            for row in query_metrics.summary()
+            if row["statement"].startswith("UPDATE rfps")
+        )
+        self.assertEqual((update["caller"], update["rows"]), ("RFPFacade.update", 1))
+
+    def test_query_budget(self):
+        with track_queries("rfp list", budget=1) as counter:
+            RFPFacade.get_all()
+        self.assertEqual(counter.count, 1)
+        self.assertFalse(counter.exceeded)
+        # a cache hit runs no query at all
+        with track_queries() as counter:
+            RFPFacade.get_all()
+        self.assertEqual(counter.count, 0)
+        with self.assertLogs("db.metrics", level="WARNING"):
+            with track_queries("rfp pages", budget=1) as counter:
+                RFPFacade.get_page(page_size=10)
+                RFPFacade.get_by_id_with_relations(self.rfp["id"])
+        self.assertTrue(counter.exceeded)
+        self.assertEqual(
+            [request["label"] for request in query_metrics.requests()],
+            ["rfp pages", "rfp list"],
+        )
+
+    def test_slow_query_log(self):
+        query_metrics.slow_query_ms = 0.0
+        with self.assertLogs("db.slow_query", level="WARNING"):
+            RFPFacade.get_by_id(self.rfp["id"])
+        slow = query_metrics.slow_queries()
+        self.assertEqual(slow[0]["caller"], "RFPFacade.get_by_id")
+
+    def test_normalize_statement(self):
+        self.assertEqual(
+            normalize_statement("SELECT id\n  FROM rfps WHERE id IN (?, ?,  ?)"),
+            "SELECT id FROM rfps WHERE id IN (…)",
+        )
+        self.assertEqual(
+            normalize_statement("SELECT 1 WHERE id IN (%(id_1_1)s, %(id_1_2)s)"),
+            "SELECT 1 WHERE id IN (…)",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from sqlalchemy import event
+
+from offermee.database.facades.main_facades import (
+    OfferFacade,
+    ReadFacade,
+    RFPFacade,
+)
+from offermee.database.models.main_models import (
+    DocumentRelatedType,
+    HistoryType,
+    OfferStatus,
+    RFPSource,
+    RFPStatus,
+)
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestQueryPlans(DatabaseTestCase):
+    """
+    Runs EXPLAIN QUERY PLAN for the SQL of the hot service lookups and fails on
+    full table scans.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._capture)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self._capture)
+        super().tearDown()
+
+    def _capture(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, parameters))
+
+    def assertNoTableScan(self, label, action):
+        self.statements.clear()
+        action()
+        self.assertTrue(self.statements, f"{label}: no SELECT captured")
+        with self.engine.connect() as conn:
+            for statement, parameters in self.statements:
+                plan = conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                ).all()
+                details = [row[-1] for row in plan]
+                scans = [
+                    detail
+                    for detail in details
+                    if detail.startswith("SCAN") and "INDEX" not in detail
+                ]
+                self.assertFalse(scans, f"{label}: table scan in plan {details}")
+
+    def test_rfp_source_rule_lookups_use_indexes(self):
+        self.assertNoTableScan(
+            "online rfp",
+            lambda: ReadFacade.get_source_rule_unique_rfp_record(
+                source=RFPSource.ONLINE, original_link="https://example.com/rfp/1"
+            ),
+        )
+        self.assertNoTableScan(
+            "email rfp",
+            lambda: ReadFacade.get_source_rule_unique_rfp_record(
+                source=RFPSource.EMAIL,
+                contact_person_email="max@example.com",
+                title="Python Developer",
+            ),
+        )
+        self.assertNoTableScan(
+            "manual rfp",
+            lambda: ReadFacade.get_source_rule_unique_rfp_record(
+                source=RFPSource.MANUAL, provider="ACME", title="Python Developer"
+            ),
+        )
+
+    def test_status_filters_use_indexes(self):
+        self.assertNoTableScan(
+            "rfps by status",
+            lambda: RFPFacade.get_all_by({"status": RFPStatus.NEW}),
+        )
+        self.assertNoTableScan(
+            "offers by status",
+            lambda: OfferFacade.get_all_by({"status": OfferStatus.SENT}),
+        )
+
+    def test_polymorphic_lookups_use_indexes(self):
+        self.assertNoTableScan(
+            "documents for",
+            lambda: ReadFacade.get_documents_for(DocumentRelatedType.CV, 1),
+        )
+        self.assertNoTableScan(
+            "history for",
+            lambda: ReadFacade.get_history_for(HistoryType.RFP, 1),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from sqlalchemy import func, select
+
+from offermee.database.facades.main_facades import FreelancerFacade
+from offermee.database.models.main_models import SkillModel
+from offermee.database.query_metrics import track_queries
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestRelatedData(DatabaseTestCase):
+    def freelancer(self, skills, offset=0):
+        return {
+            "name": "Max Mustermann",
+            "role": "DEVELOPER",
+            "website": "https://example.com",
+            "capabilities": {
+                "tech_skills": [
+                    {"type": "tech", "name": f"Tech Skill {i}"}
+                    for i in range(offset, offset + skills)
+                ],
+            },
+        }
+
+    def skill_count(self):
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(SkillModel)).scalar()
+
+    def statements(self, action):
+        with track_queries() as counter:
+            action()
+        return counter.count
+
+    def test_existing_skills_are_reused(self):
+        freelancer = FreelancerFacade.create(self.freelancer(10))
+        self.assertEqual(self.skill_count(), 10)
+        FreelancerFacade.update(freelancer["id"], self.freelancer(10, offset=5))
+        self.assertEqual(self.skill_count(), 15)
+        skills = FreelancerFacade.get_by_id_with_relations(freelancer["id"])[
+            "capabilities"
+        ]["tech_skills"]
+        self.assertEqual(
+            sorted(skill["name"] for skill in skills),
+            sorted(f"Tech Skill {i}" for i in range(5, 15)),
+        )
+
+    def test_statements_do_not_grow_with_the_skills(self):
+        small = FreelancerFacade.create(self.freelancer(5))
+        large = FreelancerFacade.create(self.freelancer(50, offset=100))
+        # same skills again: every existing skill is resolved by one lookup per list
+        self.assertEqual(
+            self.statements(
+                lambda: FreelancerFacade.update(small["id"], self.freelancer(5))
+            ),
+            self.statements(
+                lambda: FreelancerFacade.update(
+                    large["id"], self.freelancer(50, offset=100)
+                )
+            ),
+        )
+        self.assertEqual(self.skill_count(), 55)
+
+
+if __name__ == "__main__":
+    unittest.main()
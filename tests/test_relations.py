@@ -0,0 +1,98 @@
+import datetime
+import unittest
+
+from sqlalchemy import event
+
+from offermee.database.facades.main_facades import (
+    DocumentFacade,
+    OfferFacade,
+    ProjectFacade,
+)
+from offermee.database.models.main_models import DocumentRelatedType
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestRelationLoading(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.projects = [
+            self.create_project(f"Project {i}", offers=i + 2) for i in range(3)
+        ]
+        self.selects = 0
+        event.listen(self.engine, "before_cursor_execute", self._count)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+        super().tearDown()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.selects += 1
+
+    def create_project(self, title, offers):
+        project = ProjectFacade.create(
+            {"title": title, "start_date": datetime.date(2025, 3, 1)}
+        )
+        for i in range(offers):
+            offer = OfferFacade.create(
+                {
+                    "offer_number": f"{title}-{i}",
+                    "title": f"Offer {i}",
+                    "offer_contact_person": "Jane Doe",
+                    "offer_contact_person_email": "jane@example.com",
+                    "project_id": project["id"],
+                }
+            )
+            DocumentFacade.create(
+                {
+                    "related_type": DocumentRelatedType.OFFER,
+                    "related_id": offer["id"],
+                    "document_name": "offer.pdf",
+                    "document_link": "file://offer.pdf",
+                }
+            )
+        return project
+
+    def test_full_graph_is_loaded_per_relationship_not_per_row(self):
+        project = ProjectFacade.get_by_id_with_relations(self.projects[2]["id"])
+        queries = self.selects
+        self.assertEqual(len(project["offers"]), 4)
+        offer = project["offers"][0]
+        self.assertEqual(len(offer["documents"]), 1)
+        self.assertEqual(len(offer["histories"]), 1)
+        self.assertEqual(len(project["histories"]), 1)
+        self.assertNotIn("project", offer)  # no way back to the project
+        # the query count depends on the relationships, not on the number of rows
+        self.selects = 0
+        many = ProjectFacade.get_many_with_relations([p["id"] for p in self.projects])
+        self.assertEqual(self.selects, queries)
+        self.assertEqual([len(p["offers"]) for p in many], [2, 3, 4])
+
+    def test_include_and_depth(self):
+        project_id = self.projects[0]["id"]
+        project = ProjectFacade.get_by_id_with_relations(
+            project_id, include=["offers.documents"]
+        )
+        self.assertEqual(self.selects, 3)
+        flat_project = ProjectFacade.get_by_id(project_id)
+        self.assertEqual(set(project) - set(flat_project), {"offers"})
+        offer = project["offers"][0]
+        flat_offer = OfferFacade.get_by_id(offer["id"])
+        self.assertEqual(set(offer) - set(flat_offer), {"documents"})
+
+        project = ProjectFacade.get_by_id_with_relations(project_id, depth=1)
+        self.assertIn("offers", project)
+        self.assertNotIn("documents", project["offers"][0])
+
+        with self.assertRaises(ValueError):
+            ProjectFacade.get_by_id_with_relations(project_id, include=["offers.nope"])
+
+    def test_order_and_unknown_ids(self):
+        ids = [self.projects[2]["id"], 999, self.projects[0]["id"]]
+        many = ProjectFacade.get_many_with_relations(ids, depth=1)
+        self.assertEqual([p["id"] for p in many], [ids[0], ids[2]])
+        self.assertIsNone(ProjectFacade.get_by_id_with_relations(999))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+from unittest.mock import patch
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.facades.main_facades import RFPFacade, ReadFacade
+from offermee.database.matching_sink import disable_matching_worker
+from offermee.database.models.main_models import HistoryType, RFPSource
+from offermee.scraper.rfp_email_scraper import scrap_rfps_from_email, store_rfps
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestRFPStore(DatabaseTestCase):
+    def tearDown(self):
+        disable_matching_worker()
+        super().tearDown()
+
+    def rfp(self, title, **fields):
+        return {
+            "title": title,
+            "source": RFPSource.EMAIL,
+            "contact_person_email": "recruiter@example.com",
+            **fields,
+        }
+
+    def test_invalid_rfp_does_not_discard_the_batch(self):
+        store_rfps(
+            [
+                self.rfp("Python Developer"),
+                self.rfp("Invalid", salary_expectation="unknown field"),
+                self.rfp("Java Developer"),
+            ],
+            operator="tester",
+        )
+        self.assertEqual(
+            sorted(rfp["title"] for rfp in RFPFacade.get_all(as_dicts=True)),
+            ["Java Developer", "Python Developer"],
+        )
+
+    def test_invalid_rfp_inside_a_unit_of_work(self):
+        with DatabaseManager.unit_of_work():
+            store_rfps(
+                [
+                    self.rfp("Python Developer"),
+                    self.rfp("Invalid", salary_expectation="unknown field"),
+                ],
+                operator="tester",
+            )
+        self.assertEqual(
+            [rfp["title"] for rfp in RFPFacade.get_all(as_dicts=True)],
+            ["Python Developer"],
+        )
+
+    @patch("offermee.scraper.rfp_email_scraper.store_rfps")
+    @patch("offermee.scraper.rfp_email_scraper.analyze_email")
+    @patch("offermee.scraper.rfp_email_scraper.parse_email")
+    @patch("offermee.scraper.rfp_email_scraper.fetch_emails")
+    @patch("offermee.scraper.rfp_email_scraper.connect_to_email")
+    @patch("offermee.scraper.rfp_email_scraper.Config")
+    def test_email_rfps_are_stored_in_chunks(
+        self, _config, _connect, fetch_emails, parse_email, analyze_email, store
+    ):
+        fetch_emails.return_value = range(45)
+        parse_email.side_effect = lambda msg: {"body": msg}
+        analyze_email.side_effect = lambda data: self.rfp(f"RFP {data['body']}")
+        stored = []
+        store.side_effect = lambda rfps, operator: stored.append(len(rfps))
+
+        scrap_rfps_from_email()
+        self.assertEqual(stored, [20, 20, 5])
+
+        # an aborted run still stores the rfps analyzed so far
+        stored.clear()
+        analyze_email.side_effect = lambda data: (
+            self.rfp(f"RFP {data['body']}") if data["body"] < 25 else 1 / 0
+        )
+        with self.assertRaises(ZeroDivisionError):
+            scrap_rfps_from_email()
+        self.assertEqual(stored, [20, 5])
+
+
+class TestBulkWrites(DatabaseTestCase):
+    def rfp(self, title, link, **fields):
+        return {
+            "title": title,
+            "source": RFPSource.ONLINE,
+            "original_link": link,
+            **fields,
+        }
+
+    def history(self, rfp_id):
+        return [
+            entry["description"]
+            for entry in ReadFacade.get_history_for(HistoryType.RFP, rfp_id)
+        ]
+
+    def test_bulk_create(self):
+        created = RFPFacade.bulk_create(
+            [self.rfp("Python", "https://a"), self.rfp("Java", "https://b")],
+            created_by="tester",
+        )
+        self.assertEqual([rfp["title"] for rfp in created], ["Python", "Java"])
+        for rfp in created:
+            history = self.history(rfp["id"])
+            self.assertEqual(len(history), 1)
+            self.assertTrue(history[0].startswith("Created RFPModel"))
+
+    def test_bulk_upsert_updates_existing_and_inserts_new_rows(self):
+        existing = RFPFacade.create(self.rfp("Python", "https://a"))
+        result = RFPFacade.bulk_upsert(
+            [
+                self.rfp("Python (updated)", "https://a"),
+                self.rfp("Java", "https://b"),
+            ],
+            conflict_keys=["original_link"],
+            created_by="tester",
+        )
+        self.assertEqual(result[0]["id"], existing["id"])
+        rows = {rfp["original_link"]: rfp for rfp in RFPFacade.get_all(as_dicts=True)}
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows["https://a"]["title"], "Python (updated)")
+        self.assertEqual(rows["https://b"]["title"], "Java")
+        self.assertTrue(self.history(existing["id"])[-1].startswith("Updated"))
+        self.assertIn("title", self.history(existing["id"])[-1])
+        self.assertTrue(self.history(rows["https://b"]["id"])[0].startswith("Created"))
+
+    def test_bulk_upsert_merges_records_with_the_same_conflict_key(self):
+        result = RFPFacade.bulk_upsert(
+            [
+                self.rfp("Python", "https://a"),
+                self.rfp("Python (second mail)", "https://a"),
+            ],
+            conflict_keys=["original_link"],
+        )
+        self.assertEqual(len(result), 1)
+        rows = RFPFacade.get_all(as_dicts=True)
+        self.assertEqual([rfp["title"] for rfp in rows], ["Python (second mail)"])
+        self.assertEqual(len(self.history(rows[0]["id"])), 1)
+
+    def test_bulk_upsert_rejects_unknown_conflict_keys(self):
+        with self.assertRaises(ValueError):
+            RFPFacade.bulk_upsert(
+                [self.rfp("Python", "https://a")], conflict_keys=["link"]
+            )
+        self.assertEqual(RFPFacade.odd_fields({"title": "x", "link": "y"}), ["link"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import datetime
+import unittest
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.facades.main_facades import (
+    CVFacade,
+    ProjectFacade,
+    RFPFacade,
+    SchemaFacade,
+    SearchFacade,
+)
+from offermee.database.migrations import MigrationOps
+from offermee.database.models.main_models import RFPSource, RFPStatus
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestSearch(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.python_rfp = RFPFacade.create(
+            {
+                "title": "Python Backend Developer",
+                "description": "Microservices mit Django und PostgreSQL",
+                "source": RFPSource.ONLINE,
+                "status": RFPStatus.NEW,
+            }
+        )
+        self.java_rfp = RFPFacade.create(
+            {
+                "title": "Java Architect",
+                "description": "Spring Boot, some Python scripting",
+                "source": RFPSource.ONLINE,
+                "status": RFPStatus.OFFERED,
+            }
+        )
+        self.project = ProjectFacade.create(
+            {
+                "title": "Datenplattform",
+                "tasks": "Python ETL Strecken bauen",
+                "start_date": datetime.date(2025, 3, 1),
+            }
+        )
+        schema = SchemaFacade.create({"name": "cv", "schema_definition": "{}"})
+        self.cv = CVFacade.create(
+            {
+                "name": "Max Mustermann",
+                "cv_raw_text": "Senior Entwickler, Python und Kubernetes",
+                "cv_structured_data": {},
+                "cv_schema_reference_id": schema["id"],
+            }
+        )
+
+
+    def hits(self, text, **kwargs):
+        return [(r["table"], r["id"]) for r in SearchFacade.search(text, **kwargs)]
+
+    def test_ranked_search_over_all_tables(self):
+        results = SearchFacade.search("python")
+        self.assertEqual(len(results), 4)
+        # the title match ranks first
+        self.assertEqual(
+            (results[0]["table"], results[0]["id"]), ("rfps", self.python_rfp["id"])
+        )
+        self.assertEqual(results[0]["title"], "Python Backend Developer")
+        self.assertIn("**Python**", results[0]["snippet"])
+        self.assertEqual(self.hits("kubernetes python"), [("cvs", self.cv["id"])])
+        self.assertEqual(self.hits("pyth djan"), [("rfps", self.python_rfp["id"])])
+        self.assertEqual(
+            self.hits("python", limit=1), [("rfps", self.python_rfp["id"])]
+        )
+
+    def test_filters_and_tables(self):
+        self.assertEqual(
+            self.hits(
+                "python", filters={"status": RFPStatus.OFFERED}, tables=["rfps"]
+            ),
+            [("rfps", self.java_rfp["id"])],
+        )
+        self.assertEqual(
+            self.hits("python", tables=["projects"]), [("projects", self.project["id"])]
+        )
+
+    def test_free_text_input(self):
+        self.assertEqual(self.hits(""), [])
+        self.assertEqual(self.hits("C++ AND \"NOT"), [])
+        self.assertEqual(len(self.hits("Python!")), 4)
+
+    def test_index_follows_writes(self):
+        RFPFacade.update(self.java_rfp["id"], {"description": "Spring Boot, Kotlin"})
+        self.assertEqual(self.hits("kotlin"), [("rfps", self.java_rfp["id"])])
+        self.assertNotIn(("rfps", self.java_rfp["id"]), self.hits("python"))
+        RFPFacade.delete(self.python_rfp["id"])
+        self.assertEqual(self.hits("django"), [])
+
+    def test_rebuilt_table_keeps_its_index(self):
+        with self.engine.begin() as connection:
+            ops = MigrationOps(connection, DatabaseManager.Base.metadata)
+            ops.rebuild_table("rfps")
+        self.assertEqual(len(self.hits("python", tables=["rfps"])), 2)
+        RFPFacade.update(self.java_rfp["id"], {"title": "Kotlin Architect"})
+        self.assertEqual(self.hits("kotlin"), [("rfps", self.java_rfp["id"])])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import unittest
+
+from offermee.database.facades.main_facades import (
+    FreelancerFacade,
+    MatchingFacade,
+    RFPFacade,
+    SkillAliasFacade,
+    SkillFacade,
+)
+from offermee.database.models.main_models import RFPSource
+from offermee.database.skill_index import candidate_pairs
+from offermee.matcher.skill_match_engine import SkillMatchEngine
+from offermee.matcher.skill_normalizer import SkillAliasMap, normalize_skill
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestSkillNormalizer(unittest.TestCase):
+    def test_normalize_skill(self):
+        self.assertEqual(normalize_skill("  Erfahrung mit  Python 3.11 "), "python")
+        self.assertEqual(normalize_skill("Sehr gute Kenntnisse in C++"), "c++")
+        self.assertEqual(normalize_skill(".NET 8"), ".net")
+        self.assertEqual(normalize_skill("ES6"), "es6")
+
+    def test_alias_map(self):
+        aliases = SkillAliasMap({"Kubernetes": ["Container-Orchestrierung"]})
+        self.assertEqual(aliases.canonical_name("c sharp"), "C#")
+        self.assertEqual(aliases.canonical_name(".NET Core"), ".NET")
+        self.assertEqual(
+            aliases.canonical_name("container-orchestrierung"), "Kubernetes"
+        )
+        self.assertEqual(aliases.canonical_name(" Haskell "), "Haskell")
+
+    def test_engine_compares_skill_ids_first(self):
+        rfp = {
+            "must_have_requirements": ["K8s", "Python"],
+            "must_have_skill_ids": [7, None],
+            "nice_to_have_requirements": [],
+        }
+        engine = SkillMatchEngine()
+        [[(score, details)]] = engine.match_matrix([rfp], [["kubernetes", "python"]])
+        self.assertFalse(details["k8s"]["matched"])
+        [[(score, details)]] = engine.match_matrix(
+            [rfp], [["kubernetes", "python"]], [[7, None]]
+        )
+        self.assertEqual(details["k8s"], {"matched": True, "score": 100})
+        self.assertEqual(score, 70)
+
+    def test_engine_keeps_skills_normalizing_alike_apart(self):
+        # "C#", "C++" and "C" all normalize to "c" for the fuzzy scorer
+        rfp = {
+            "must_have_requirements": ["C#", "C++"],
+            "must_have_skill_ids": [1, 2],
+            "nice_to_have_requirements": [],
+        }
+        engine = SkillMatchEngine()
+        [[(score, details)], [(_, c_details)]] = engine.match_matrix(
+            [rfp, {**rfp, "must_have_skill_ids": [1, None]}], [["C++", "C"]], [[2, 3]]
+        )
+        self.assertEqual(details["c#"], {"matched": False, "score": 0})
+        self.assertEqual(details["c++"], {"matched": True, "score": 100})
+        self.assertEqual(score, 35)
+        # an unknown requirement is still scored fuzzily
+        self.assertEqual(c_details["c++"], {"matched": True, "score": 100})
+
+
+class TestSkillAliases(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+
+
+    def create_freelancer(self, skills):
+        return FreelancerFacade.create(
+            {
+                "name": "Erika Mustermann",
+                "website": "https://example.com",
+                "role": "DEVELOPER",
+                "capabilities": {
+                    "tech_skills": [{"type": "tech", "name": name} for name in skills]
+                },
+            }
+        )
+
+    def test_ingestion_assigns_canonical_skills(self):
+        skills = SkillFacade.canonical_names(["k8s", "Kubernetes", "c sharp", "Rust"])
+        self.assertEqual(skills, ["Kubernetes", "C#", "Rust"])
+        freelancer = self.create_freelancer(skills)
+        kubernetes = SkillFacade.get_first_by({"name": "Kubernetes"})
+        rfp = RFPFacade.create(
+            {
+                "title": "Platform Engineer",
+                "source": RFPSource.ONLINE,
+                "must_have_requirements": ["Erfahrung mit K8s", "Terraform"],
+            }
+        )
+        rfp = RFPFacade.get_by_id(rfp["id"])
+        self.assertEqual(rfp["must_have_skill_ids"], [kubernetes["id"], None])
+
+        # aliases of the table resolve to the existing skill row
+        SkillAliasFacade.create(
+            {"alias": "Container-Orchestrierung", "skill_id": kubernetes["id"]}
+        )
+        self.assertEqual(
+            SkillFacade.canonical_names(["container-orchestrierung"]), ["Kubernetes"]
+        )
+
+        MatchingFacade.refresh()
+        (match,) = MatchingFacade.get_matches(freelancer["id"])
+        self.assertEqual(
+            match["match_details"]["erfahrung mit k8s"], {"matched": True, "score": 100}
+        )
+        self.assertEqual(match["skill_score"], 35.0)
+
+    def test_skill_and_alias_changes_reassign_rfp_skill_ids(self):
+        rfp = RFPFacade.create(
+            {
+                "title": "Platform Engineer",
+                "source": RFPSource.ONLINE,
+                "must_have_requirements": ["K8s", "Container-Orchestrierung"],
+                "nice_to_have_requirements": ["Docker"],
+            }
+        )
+        rfp_id = rfp["id"]
+        self.assertEqual(rfp["must_have_skill_ids"], [None, None])
+
+        # a new skill resolves the builtin alias "k8s"
+        freelancer = self.create_freelancer(["Kubernetes"])
+        kubernetes = SkillFacade.get_first_by({"name": "Kubernetes"})
+        rfp = RFPFacade.get_by_id(rfp_id)
+        self.assertEqual(rfp["must_have_skill_ids"], [kubernetes["id"], None])
+
+        SkillAliasFacade.create(
+            {"alias": "Container-Orchestrierung", "skill_id": kubernetes["id"]}
+        )
+        rfp = RFPFacade.get_by_id(rfp_id)
+        self.assertEqual(
+            rfp["must_have_skill_ids"], [kubernetes["id"], kubernetes["id"]]
+        )
+        with self.engine.connect() as conn:
+            self.assertEqual(
+                candidate_pairs(conn, [rfp_id], [freelancer["capabilities_id"]]),
+                {(rfp_id, freelancer["capabilities_id"])},
+            )
+
+        SkillFacade.update(kubernetes["id"], {"name": "Docker"})
+        rfp = RFPFacade.get_by_id(rfp_id)
+        self.assertEqual(rfp["must_have_skill_ids"], [None, kubernetes["id"]])
+        self.assertEqual(rfp["nice_to_have_skill_ids"], [kubernetes["id"]])
+
+    def test_c_family_skills_do_not_match_each_other(self):
+        c_sharp = self.create_freelancer(["C#"])
+        c_plus_plus = self.create_freelancer(["C++", "C"])
+        RFPFacade.create(
+            {
+                "title": "C# Developer",
+                "source": RFPSource.ONLINE,
+                "must_have_requirements": ["C#"],
+            }
+        )
+        MatchingFacade.refresh()
+        (match,) = MatchingFacade.get_matches(c_sharp["id"])
+        self.assertEqual(match["match_details"]["c#"], {"matched": True, "score": 100})
+        (match,) = MatchingFacade.get_matches(c_plus_plus["id"])
+        self.assertEqual(match["match_details"]["c#"], {"matched": False, "score": 0})
+        self.assertEqual(match["skill_score"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+
+from sqlalchemy import select
+
+from offermee.database.facades.main_facades import (
+    FreelancerFacade,
+    MatchingFacade,
+    RFPFacade,
+    SkillFacade,
+)
+from offermee.database.models.main_models import RFPSource, skill_index
+from offermee.database.skill_index import (
+    CAPABILITIES_OWNER,
+    RFP_OWNER,
+    candidate_pairs,
+    rebuild_skill_index,
+    skill_id_term,
+)
+from offermee.matcher.skill_match_engine import SkillMatchEngine, skill_terms
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestSkillIndex(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.rfp = RFPFacade.create(
+            {
+                "title": "Data Engineer",
+                "source": RFPSource.ONLINE,
+                "must_have_requirements": ["SQL"],
+                "nice_to_have_requirements": ["Kafka"],
+            }
+        )
+        self.freelancer = FreelancerFacade.create(
+            {
+                "name": "Erika Mustermann",
+                "website": "https://example.com",
+                "role": "DEVELOPER",
+                "capabilities": {"tech_skills": [{"type": "tech", "name": "MySQL"}]},
+            }
+        )
+
+
+    def terms(self, owner_type, owner_id):
+        with self.engine.connect() as conn:
+            return set(
+                conn.execute(
+                    select(skill_index.c.term).where(
+                        skill_index.c.owner_type == owner_type,
+                        skill_index.c.owner_id == owner_id,
+                    )
+                ).scalars()
+            )
+
+    def test_skill_terms(self):
+        self.assertEqual(skill_terms("Vue.js"), {"vue", "js"})
+        self.assertEqual(
+            skill_terms("PostgreSQL"),
+            {"postgresql", "pos", "ost", "stg", "tgr", "gre", "res", "esq", "sql"},
+        )
+
+    def test_index_follows_the_records(self):
+        self.assertEqual(
+            self.terms(RFP_OWNER, self.rfp["id"]), {"sql", "kafka", "kaf", "afk", "fka"}
+        )
+        capabilities_id = self.freelancer["capabilities_id"]
+        mysql = SkillFacade.get_first_by({"name": "MySQL"})
+        self.assertEqual(
+            self.terms(CAPABILITIES_OWNER, capabilities_id),
+            {"mysql", "mys", "ysq", "sql", skill_id_term(mysql["id"])},
+        )
+        with self.engine.connect() as conn:
+            self.assertEqual(
+                candidate_pairs(conn, [self.rfp["id"]], [capabilities_id]),
+                {(self.rfp["id"], capabilities_id)},
+            )
+
+        RFPFacade.update(self.rfp["id"], {"must_have_requirements": ["Java"]})
+        self.assertNotIn("sql", self.terms(RFP_OWNER, self.rfp["id"]))
+        with self.engine.connect() as conn:
+            self.assertEqual(
+                candidate_pairs(conn, [self.rfp["id"]], [capabilities_id]), set()
+            )
+            expected = conn.execute(select(skill_index)).all()
+        with self.engine.begin() as conn:
+            rebuild_skill_index(conn)
+            self.assertCountEqual(conn.execute(select(skill_index)).all(), expected)
+
+    def test_refresh_skips_pairs_without_shared_terms(self):
+        RFPFacade.create(
+            {
+                "title": "Java Developer",
+                "source": RFPSource.ONLINE,
+                "must_have_requirements": ["Java"],
+            }
+        )
+        result = MatchingFacade.refresh()
+        self.assertEqual((result.created, result.pruned), (2, 1))
+        java = MatchingFacade.get_matches(self.freelancer["id"])[1]
+        self.assertEqual(java["skill_score"], 0.0)
+        self.assertEqual(
+            java["match_details"], {"java": {"matched": False, "score": 0}}
+        )
+
+    def test_pruned_similarity_matrix(self):
+        queries = ["sql", "kafka", "erfahrung mit django", "go"]
+        choices = ["mysql", "django", "golang"]
+        full = SkillMatchEngine().similarity_matrix(queries, choices)
+        pruned = SkillMatchEngine(prune=True).pruned_similarity_matrix(queries, choices)
+        self.assertEqual(pruned[0, 0], full[0, 0])
+        self.assertEqual(pruned[2, 1], full[2, 1])
+        self.assertEqual(pruned[1].tolist(), [0, 0, 0])
+        # too short for a trigram and no shared word: the trade-off of pruning
+        self.assertEqual(full[3, 2], 100)
+        self.assertEqual(pruned[3, 2], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
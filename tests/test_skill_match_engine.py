@@ -0,0 +1,85 @@
+import unittest
+
+from fuzzywuzzy import fuzz, process
+
+from offermee.database.models.main_models import ProjectModel
+from offermee.matcher.skill_match_engine import (
+    SkillMatchEngine,
+    rapid_process,
+    requirements_of,
+)
+
+FREELANCERS = [
+    ["python", "django", "docker", "aws"],
+    ["Java", "Spring Boot", "Kubernetes", "PostgreSQL"],
+    [],
+]
+RFPS = [
+    {
+        "must_have_requirements": ["Python", "SQL", "Erfahrung mit Django"],
+        "nice_to_have_requirements": ["Docker", "Kubernetes"],
+    },
+    {"must_have_requirements": ["Java"], "nice_to_have_requirements": []},
+    {"must_have_requirements": [], "nice_to_have_requirements": []},
+    ProjectModel(must_haves="Python, SQL", nice_to_haves="Docker, Kubernetes"),
+]
+
+
+def extract_one_match(project, freelancer_skills):
+    # the former SkillMatcher.match_skills
+    must_haves, nice_to_haves = requirements_of(project)
+    score, details = 0, {}
+    for skills, threshold, weight in ((must_haves, 80, 70), (nice_to_haves, 70, 30)):
+        matched = 0
+        for skill in skills:
+            match = process.extractOne(
+                skill, freelancer_skills, scorer=fuzz.partial_ratio
+            )
+            matched += bool(match and match[1] >= threshold)
+            details[skill] = {
+                "matched": bool(match and match[1] >= threshold),
+                "score": match[1] if match else 0,
+            }
+        if skills:
+            score += (matched / len(skills)) * weight
+    return score, details
+
+
+class TestSkillMatchEngine(unittest.TestCase):
+    def test_same_results_as_extract_one(self):
+        engine = SkillMatchEngine()
+        for skills in FREELANCERS:
+            expected = [extract_one_match(rfp, skills) for rfp in RFPS]
+            self.assertEqual(engine.match_rfps(RFPS, skills), expected)
+
+    def test_score_matrix(self):
+        engine = SkillMatchEngine()
+        scores = engine.score_matrix(RFPS, FREELANCERS)
+        self.assertEqual(scores.shape, (len(RFPS), len(FREELANCERS)))
+        for column, skills in enumerate(FREELANCERS):
+            totals = [round(score, 9) for score, _ in engine.match_rfps(RFPS, skills)]
+            self.assertEqual(scores[:, column].round(9).tolist(), totals)
+        self.assertAlmostEqual(scores[0, 0], 70 * 2 / 3 + 30 / 2)
+        self.assertEqual(scores[2].tolist(), [0, 0, 0])
+
+    def test_comma_separated_skills(self):
+        score, details = SkillMatchEngine().match(RFPS[3], "python, docker,aws")
+        self.assertEqual(list(details), ["python", "sql", "docker", "kubernetes"])
+        self.assertEqual(score, 35 + 15)
+
+    @unittest.skipIf(rapid_process is None, "rapidfuzz is not installed")
+    def test_rapidfuzz(self):
+        engine = SkillMatchEngine(use_rapidfuzz=True)
+        for skills in FREELANCERS:
+            for (score, details), (_, expected) in zip(
+                engine.match_rfps(RFPS, skills),
+                [extract_one_match(rfp, skills) for rfp in RFPS],
+            ):
+                self.assertEqual(
+                    {skill: d["matched"] for skill, d in details.items()},
+                    {skill: d["matched"] for skill, d in expected.items()},
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
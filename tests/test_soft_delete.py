@@ -0,0 +1,148 @@
+import datetime
+import unittest
+
+from sqlalchemy import inspect, select, text
+
+from offermee.database.database_manager import DatabaseManager
+from offermee.database.facades.main_facades import (
+    ProjectFacade,
+    ReadFacade,
+    RFPFacade,
+)
+from offermee.database.migrations import upgrade_database
+from offermee.database.models.main_models import (
+    ProjectStatus,
+    RFPModel,
+    RFPSource,
+    RFPStatus,
+    rfps_archive,
+)
+from tests.db_test_case import DatabaseTestCase
+
+
+class TestSoftDelete(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.rfps = [
+            RFPFacade.create(
+                {
+                    "title": f"Developer {i}",
+                    "original_link": f"https://example.com/rfp/{i}",
+                    "source": RFPSource.ONLINE,
+                    "status": RFPStatus.NEW,
+                    "end_date": end_date,
+                }
+            )
+            for i, end_date in enumerate(["31.12.2099", "01.03.2020", None])
+        ]
+
+    def ids(self, records):
+        return sorted(record["id"] for record in records)
+
+    def test_soft_delete_and_restore(self):
+        rfp_id = self.rfps[0]["id"]
+        self.assertTrue(RFPFacade.delete(rfp_id))
+        with self.engine.connect() as conn:
+            row = conn.execute(select(RFPModel.__table__).where(text(f"id={rfp_id}")))
+            self.assertIsNotNone(row.one().deleted_at)
+        self.assertIsNone(RFPFacade.get_by_id(rfp_id))
+        live = self.ids(self.rfps[1:])
+        self.assertEqual(self.ids(RFPFacade.get_all()), live)
+        self.assertEqual(self.ids(RFPFacade.get_all(as_dicts=True)), live)
+        self.assertEqual(self.ids(RFPFacade.get_all_by({"status": RFPStatus.NEW})), live)
+        # the scrapers still know the RFP
+        link = self.rfps[0]["original_link"]
+        self.assertIsNone(RFPFacade.get_first_by({"original_link": link}))
+        found = ReadFacade.get_source_rule_unique_rfp_record(
+            RFPSource.ONLINE, original_link=link
+        )
+        self.assertEqual(found["id"], rfp_id)
+
+        self.assertTrue(RFPFacade.restore(rfp_id))
+        self.assertFalse(RFPFacade.restore(rfp_id))
+        self.assertEqual(RFPFacade.get_by_id(rfp_id)["title"], "Developer 0")
+
+        self.assertTrue(RFPFacade.delete(rfp_id, soft_delete=False))
+        with self.engine.connect() as conn:
+            self.assertEqual(len(conn.execute(select(RFPModel.id)).all()), 2)
+
+    def test_status_query_uses_the_partial_index(self):
+        with self.engine.connect() as conn:
+            plan = conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT id FROM rfps "
+                "WHERE status = 'NEW' AND deleted_at IS NULL"
+            ).all()
+        self.assertIn("idx_rfp_status_live", " ".join(row[-1] for row in plan))
+
+    def test_archive_stale_rfps(self):
+        with self.engine.begin() as conn:
+            conn.execute(
+                RFPModel.__table__.update()
+                .where(RFPModel.id == self.rfps[2]["id"])
+                .values(created_at=datetime.datetime(2020, 1, 1))
+            )
+        self.assertEqual(RFPFacade.archive_stale(max_age_days=90), 2)
+        self.assertEqual(self.ids(RFPFacade.get_all()), [self.rfps[0]["id"]])
+        with self.engine.connect() as conn:
+            archived = conn.execute(select(rfps_archive)).all()
+        self.assertEqual(sorted(row.id for row in archived), self.ids(self.rfps[1:]))
+        self.assertTrue(all(row.archived_at for row in archived))
+        found = ReadFacade.get_source_rule_unique_rfp_record(
+            RFPSource.ONLINE, original_link=self.rfps[1]["original_link"]
+        )
+        self.assertEqual(found["title"], "Developer 1")
+        self.assertEqual(RFPFacade.archive_stale(max_age_days=90), 0)
+
+    def test_rfps_in_work_are_not_archived(self):
+        stale = [
+            RFPFacade.create(
+                {
+                    "title": f"Stale {status.name}",
+                    "original_link": f"https://example.com/stale/{status.name}",
+                    "source": RFPSource.ONLINE,
+                    "status": status,
+                    "end_date": "01.03.2020",
+                }
+            )
+            for status in RFPStatus
+        ]
+        offered = next(r for r in stale if r["status"] == RFPStatus.OFFERED)
+        for rfp, status in [
+            (self.rfps[1], ProjectStatus.OFFER_SENT),
+            (stale[0], ProjectStatus.COMPLETED),
+        ]:
+            ProjectFacade.create(
+                {
+                    "title": rfp["title"],
+                    "original_link": rfp["original_link"],
+                    "start_date": datetime.date(2020, 1, 1),
+                    "status": status,
+                }
+            )
+        # NEW, OUTDATED and REJECTED are archived, also with a completed project
+        self.assertEqual(RFPFacade.archive_stale(max_age_days=90), 3)
+        self.assertEqual(
+            self.ids(RFPFacade.get_all()), self.ids([*self.rfps, offered])
+        )
+
+    def test_migration_of_an_existing_database(self):
+        with self.engine.begin() as conn:
+            conn.execute(text("DROP TABLE rfps_archive"))
+            conn.execute(text("DROP INDEX idx_rfp_status_live"))
+            conn.execute(text("ALTER TABLE rfps DROP COLUMN deleted_at"))
+            conn.execute(text("ALTER TABLE rfps DROP COLUMN created_at"))
+            conn.execute(text("CREATE INDEX idx_rfp_status ON rfps (status)"))
+
+        self.assertIn(5, upgrade_database(self.engine, DatabaseManager.Base.metadata))
+        inspector = inspect(self.engine)
+        self.assertIn("rfps_archive", inspector.get_table_names())
+        indexes = {idx["name"] for idx in inspector.get_indexes("rfps")}
+        self.assertIn("idx_rfp_status_live", indexes)
+        self.assertNotIn("idx_rfp_status", indexes)
+        with self.engine.connect() as conn:
+            created = conn.execute(select(RFPModel.created_at)).scalars().all()
+        self.assertTrue(all(isinstance(c, datetime.datetime) for c in created))
+
+
+if __name__ == "__main__":
+    unittest.main()
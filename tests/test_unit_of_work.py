@@ -0,0 +1,91 @@
+import unittest
+
+from sqlalchemy import event
+
+from offermee.database.database_manager import DatabaseManager, UnitOfWorkFailedError
+from offermee.database.facades.main_facades import ReadFacade, RFPFacade
+from offermee.database.models.main_models import HistoryType, RFPSource
+from tests.db_test_case import DatabaseTestCase
+
+
+class RerunSignal(BaseException):
+    """Stands in for Streamlit's RerunException, which is no Exception."""
+
+
+class TestUnitOfWork(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.checkouts = 0
+        self.commits = 0
+        event.listen(self.engine, "checkout", self._checkout)
+        event.listen(self.engine, "commit", self._commit)
+
+    def tearDown(self):
+        event.remove(self.engine, "checkout", self._checkout)
+        event.remove(self.engine, "commit", self._commit)
+        super().tearDown()
+
+    def _checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self.checkouts += 1
+
+    def _commit(self, conn):
+        self.commits += 1
+
+    def create_rfp(self, title):
+        return RFPFacade.create({"title": title, "source": RFPSource.MANUAL})
+
+    def titles(self):
+        return sorted(rfp["title"] for rfp in RFPFacade.get_all(as_dicts=True))
+
+    def test_calls_share_one_connection_and_transaction(self):
+        with DatabaseManager.unit_of_work():
+            first = self.create_rfp("first")
+            self.create_rfp("second")
+            self.assertEqual(RFPFacade.get_by_id(first["id"])["title"], "first")
+            histories = ReadFacade.get_history_for(HistoryType.RFP, first["id"])
+            self.assertEqual(len(histories), 1)
+        self.assertEqual(self.checkouts, 1)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(self.titles(), ["first", "second"])
+
+    def test_exception_rolls_back_the_whole_unit(self):
+        with self.assertRaises(RuntimeError):
+            with DatabaseManager.unit_of_work():
+                self.create_rfp("first")
+                self.create_rfp("second")
+                raise RuntimeError("abort")
+        self.assertEqual(self.titles(), [])
+
+    def test_caught_error_fails_the_whole_unit(self):
+        with self.assertRaises(UnitOfWorkFailedError):
+            with DatabaseManager.unit_of_work():
+                self.create_rfp("first")
+                try:
+                    RFPFacade.create({"title": "invalid", "source": None})
+                except Exception:
+                    pass  # the caller goes on as if only this call failed
+                with self.assertRaises(UnitOfWorkFailedError):
+                    self.create_rfp("second")
+        self.assertEqual(self.titles(), [])
+
+    def test_control_flow_exception_commits(self):
+        @DatabaseManager.unit_of_work()
+        def render():
+            self.create_rfp("first")
+            raise RerunSignal()
+
+        with self.assertRaises(RerunSignal):
+            render()
+        self.assertEqual(self.titles(), ["first"])
+
+    def test_nested_units_join_the_outer_one(self):
+        with DatabaseManager.unit_of_work() as outer:
+            with DatabaseManager.unit_of_work() as inner:
+                self.assertIs(inner, outer)
+                self.create_rfp("first")
+        self.assertEqual(self.checkouts, 1)
+        self.assertEqual(self.titles(), ["first"])
+
+
+if __name__ == "__main__":
+    unittest.main()